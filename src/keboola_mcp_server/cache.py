@@ -0,0 +1,134 @@
+"""In-process caches shared by the MCP server sessions."""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+LOG = logging.getLogger(__name__)
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+# the caches shared by the sessions of the process, see `clear_shared_caches()`
+_SHARED_CACHES: list['TtlCache[Any, Any]'] = []
+
+
+def token_fingerprint(token: str | None) -> str | None:
+    """
+    Gets a short, non-reversible fingerprint of a token that can be used in cache keys instead of the token itself.
+    """
+    if not token:
+        return None
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:32]
+
+
+def clear_shared_caches() -> None:
+    """Clears all the caches shared by the sessions of the process, e.g. to keep the tests from affecting each other."""
+    for cache in _SHARED_CACHES:
+        cache.clear()
+
+
+class TtlCache(Generic[K, V]):
+    """
+    Bounded in-memory cache whose entries expire after a fixed time-to-live.
+
+    When the cache is full, the least recently used entry is evicted. Concurrent lookups of the same missing key
+    through `get_or_load()` are coalesced, so the value is loaded only once and all the callers await the same
+    result. Failed loads are not cached.
+    """
+
+    def __init__(
+        self, *, max_size: int, ttl: float, shared: bool = False, timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param max_size: The maximum number of entries kept in the cache.
+        :param ttl: The number of seconds after which an entry expires.
+        :param shared: Whether the cache is shared by all the sessions of the process; all the shared caches
+            are cleared at once by `clear_shared_caches()`.
+        :param timer: The clock used to expire the entries; the tests can pass a fake one.
+        """
+        if max_size <= 0:
+            raise ValueError('max_size must be a positive integer.')
+        if ttl <= 0:
+            raise ValueError('ttl must be a positive number.')
+
+        self._max_size = max_size
+        self._ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._loading: dict[K, asyncio.Future[V]] = {}
+        if shared:
+            _SHARED_CACHES.append(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: K) -> V | None:
+        """Gets the cached value or None if the key is not cached or its entry has expired."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        """Caches the value, evicting the least recently used entry if the cache is full."""
+        self._entries[key] = (self._timer() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Removes the key from the cache and returns its value, if it was cached."""
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def pop_matching(self, predicate: Callable[[K], bool]) -> int:
+        """
+        Removes all the entries whose keys match the predicate.
+
+        :return: The number of removed entries.
+        """
+        keys = [key for key in self._entries if predicate(key)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Gets the cached value or loads and caches it. Concurrent calls for the same key share a single load.
+
+        :param key: The cache key.
+        :param loader: The function loading the value when it is not cached.
+        :return: The cached or freshly loaded value.
+        """
+        if (value := self.get(key)) is not None:
+            return value
+
+        if (future := self._loading.get(key)) is None:
+            future = asyncio.ensure_future(loader())
+            self._loading[key] = future
+
+            def _on_loaded(f: asyncio.Future[V]) -> None:
+                if self._loading.get(key) is f:
+                    del self._loading[key]
+                if not f.cancelled() and f.exception() is None:
+                    self.put(key, f.result())
+
+            future.add_done_callback(_on_loaded)
+
+        # Shielded so that a cancelled caller does not cancel the load the other callers are waiting for.
+        return await asyncio.shield(future)
@@ -1,7 +1,12 @@
+import importlib.util
 import json
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from http import HTTPStatus
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from typing import Any, Union, cast
+from urllib.parse import urlsplit
 
 import httpx
 from httpx_retries import Retry, RetryTransport
@@ -16,6 +21,134 @@ JsonStruct = Union[JsonDict, JsonList]  # noqa: UP007
 
 LOG = logging.getLogger(__name__)
 
+# The retry settings are immutable (`Retry.increment()` returns a new instance), so a single instance is shared
+# by all clients, including the pooled ones.
+_DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    max_backoff_wait=10,
+    status_forcelist=frozenset(Retry.RETRYABLE_STATUS_CODES | {HTTPStatus.CONFLICT}),
+)
+
+
+class HttpConnectionPool:
+    """
+    Process-wide pool of keep-alive HTTP connections shared by all `RawKeboolaClient` instances.
+
+    Each upstream host (Storage API, Query Service, Job Queue, ...) gets its own bounded connection pool,
+    so consecutive requests to the same service reuse open TCP/TLS connections instead of paying a full
+    handshake per request. HTTP/2 is negotiated when the optional `h2` package is installed.
+
+    The pooled `httpx.AsyncClient` instances carry no authorization headers and keep no cookies; every
+    `RawKeboolaClient` sends its own token with each request, so callers sharing a connection never share
+    credentials or sessions.
+
+    The connections of a host are shared by all the concurrent requests of all the sessions, so a burst of them
+    can wait for a free connection. The pooled clients therefore wait for a connection as long as for the response
+    (the read timeout) instead of failing with `httpx.PoolTimeout` after the short default pool timeout.
+
+    The pool is opened by the server lifespan (see `server.create_keboola_lifespan`). The overlapping opens share
+    the pool, which is closed when the last of them exits. Outside the lifespan (CLI scripts, unit tests) no pool
+    is installed and `RawKeboolaClient` falls back to a short-lived `httpx.AsyncClient` per request.
+    """
+
+    MAX_CONNECTIONS_PER_HOST = 50
+    MAX_KEEPALIVE_CONNECTIONS_PER_HOST = 20
+    KEEPALIVE_EXPIRY = 30.0  # seconds
+
+    _current: 'HttpConnectionPool | None' = None
+    _open_count = 0
+
+    def __init__(
+        self,
+        *,
+        max_connections_per_host: int | None = None,
+        max_keepalive_connections_per_host: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections_per_host or self.MAX_CONNECTIONS_PER_HOST,
+            max_keepalive_connections=max_keepalive_connections_per_host or self.MAX_KEEPALIVE_CONNECTIONS_PER_HOST,
+            keepalive_expiry=keepalive_expiry or self.KEEPALIVE_EXPIRY,
+        )
+        self._http2 = http2 if http2 is not None else importlib.util.find_spec('h2') is not None
+        # one connection pool per upstream host, shared by all clients talking to that host
+        self._transports: dict[str, httpx.AsyncHTTPTransport] = {}
+        # clients keyed by host and timeout settings; all clients of one host share its transport
+        self._clients: dict[tuple[str, tuple[Any, ...]], httpx.AsyncClient] = {}
+
+    @classmethod
+    def current(cls) -> 'HttpConnectionPool | None':
+        """Gets the connection pool installed for this process or None if no pool is open."""
+        return cls._current
+
+    @classmethod
+    @asynccontextmanager
+    async def open(cls, **kwargs: Any) -> AsyncIterator['HttpConnectionPool']:
+        """
+        Installs a process-wide connection pool for the duration of the context. The nested or overlapping calls
+        reuse the pool that is already installed, and the last of them to exit closes its connections.
+
+        :param kwargs: The pool settings, see the constructor; ignored when the pool is already installed.
+        """
+        if (pool := cls._current) is None:
+            pool = cls(**kwargs)
+            cls._current = pool
+            LOG.info(f'Opened shared HTTP connection pool: limits={pool._limits}, http2={pool._http2}')
+
+        cls._open_count += 1
+        try:
+            yield pool
+        finally:
+            cls._open_count -= 1
+            if cls._open_count == 0 and cls._current is pool:
+                cls._current = None
+                await pool.aclose()
+
+    def get_client(self, url: str, *, timeout: httpx.Timeout, retry: Retry) -> httpx.AsyncClient:
+        """
+        Gets the pooled client for the host of the given URL.
+
+        :param url: The URL of the request; only its scheme, host and port are used.
+        :param timeout: The timeout settings of the client.
+        :param retry: The retry settings applied to the requests sent by the client.
+        :return: The client sharing the host's keep-alive connections.
+        """
+        parts = urlsplit(url)
+        origin = f'{parts.scheme}://{parts.netloc}'
+        key = (origin, tuple(sorted(timeout.as_dict().items())))
+        if (client := self._clients.get(key)) is None:
+            timeout = httpx.Timeout(connect=timeout.connect, read=timeout.read, write=timeout.write, pool=timeout.read)
+            if (transport := self._transports.get(origin)) is None:
+                transport = httpx.AsyncHTTPTransport(limits=self._limits, http2=self._http2)
+                self._transports[origin] = transport
+            client = httpx.AsyncClient(
+                timeout=timeout,
+                transport=RetryTransport(transport=transport, retry=retry),
+                # the client is shared by all the tokens, so the cookies set for one must not be sent with another
+                cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            )
+            self._clients[key] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Closes all pooled clients and their connections."""
+        clients = list(self._clients.values())
+        transports = list(self._transports.values())
+        self._clients.clear()
+        self._transports.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                LOG.warning('Failed to close a pooled HTTP client.', exc_info=True)
+        for transport in transports:
+            try:
+                await transport.aclose()
+            except Exception:
+                LOG.warning('Failed to close a pooled HTTP transport.', exc_info=True)
+
 
 class RawKeboolaClient:
     """
@@ -45,12 +178,7 @@ class RawKeboolaClient:
                 self.headers['X-StorageAPI-Token'] = api_token
         self.timeout = timeout or httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0)
         # Store retry config, not the transport - transports cannot be shared across concurrent AsyncClient instances
-        self._retry = Retry(
-            total=3,
-            backoff_factor=1.0,
-            max_backoff_wait=10,
-            status_forcelist=frozenset(Retry.RETRYABLE_STATUS_CODES | {HTTPStatus.CONFLICT}),
-        )
+        self._retry = _DEFAULT_RETRY
         if headers:
             self.headers.update(headers)
         self.readonly = readonly
@@ -62,6 +190,21 @@ class RawKeboolaClient:
         """
         return RetryTransport(retry=self._retry)
 
+    @asynccontextmanager
+    async def _http_client(self, timeout: httpx.Timeout | None = None) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Yields the HTTP client for sending a single request. When the process-wide `HttpConnectionPool` is open,
+        its keep-alive client for this service's host is reused, otherwise a short-lived client is created
+        and closed after the request.
+
+        :param timeout: Optional per-call timeout override; falls back to the client default when None
+        """
+        if pool := HttpConnectionPool.current():
+            yield pool.get_client(self.base_api_url, timeout=timeout or self.timeout, retry=self._retry)
+        else:
+            async with httpx.AsyncClient(timeout=timeout or self.timeout, transport=self._create_transport()) as client:
+                yield client
+
     @staticmethod
     def _raise_for_status(response: httpx.Response) -> None:
         """
@@ -113,7 +256,7 @@ class RawKeboolaClient:
         :return: API response as dictionary
         """
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client() as client:
             response = await client.get(
                 f'{self.base_api_url}/{endpoint}',
                 params=params,
@@ -137,7 +280,7 @@ class RawKeboolaClient:
         :return: API response as text
         """
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client() as client:
             response = await client.get(
                 f'{self.base_api_url}/{endpoint}',
                 params=params,
@@ -168,7 +311,7 @@ class RawKeboolaClient:
             raise RuntimeError(f'Forbidden POST operation on a readonly client: {self.base_api_url}')
 
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=timeout or self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client(timeout) as client:
             response = await client.post(
                 f'{self.base_api_url}/{endpoint}',
                 params=params,
@@ -198,7 +341,7 @@ class RawKeboolaClient:
             raise RuntimeError(f'Forbidden PUT operation on a readonly client: {self.base_api_url}')
 
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client() as client:
             response = await client.put(
                 f'{self.base_api_url}/{endpoint}',
                 params=params,
@@ -224,7 +367,7 @@ class RawKeboolaClient:
             raise RuntimeError(f'Forbidden DELETE operation on a readonly client: {self.base_api_url}')
 
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client() as client:
             response = await client.delete(
                 f'{self.base_api_url}/{endpoint}',
                 headers=headers,
@@ -256,7 +399,7 @@ class RawKeboolaClient:
             raise RuntimeError(f'Forbidden PATCH operation on a readonly client: {self.base_api_url}')
 
         headers = self.headers | (headers or {})
-        async with httpx.AsyncClient(timeout=self.timeout, transport=self._create_transport()) as client:
+        async with self._http_client() as client:
             response = await client.patch(
                 f'{self.base_api_url}/{endpoint}',
                 params=params,
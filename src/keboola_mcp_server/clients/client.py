@@ -1,13 +1,15 @@
 """Keboola Storage API client wrapper."""
 
+import copy
 import logging
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Collection, Mapping, Sequence
 from pathlib import Path
 from typing import Any, Literal, TypeVar
 from urllib.parse import urlparse, urlunparse
 
 import httpx
 
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
 from keboola_mcp_server.clients.ai_service import AIServiceClient
 from keboola_mcp_server.clients.data_science import DataScienceClient
 from keboola_mcp_server.clients.encryption import EncryptionClient
@@ -56,6 +58,15 @@ def get_metadata_property(
     if provider and preferred_providers:
         raise ValueError('Specifying both provider and preferred_providers makes no sense.')
 
+    filtered = (
+        m for m in metadata if m['key'] == key and (not provider or ('provider' in m and m['provider'] == provider))
+    )
+    item = max(filtered, key=_metadata_sort_key(preferred_providers), default=None)
+    value = item.get('value') if item else None
+    return value if value is not None else default
+
+
+def _metadata_sort_key(preferred_providers: Sequence[str] | None) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
     def _sort_key(m: Mapping[str, Any]) -> tuple[Any, ...]:
         # TODO: ideally we should first convert the timestamps to UTC
         if preferred_providers:
@@ -67,12 +78,52 @@ def get_metadata_property(
         else:
             return (m.get('timestamp') or '',)
 
-    filtered = [
-        m for m in metadata if m['key'] == key and (not provider or ('provider' in m and m['provider'] == provider))
-    ]
-    item = max(filtered, key=_sort_key, default=None)
-    value = item.get('value') if item else None
-    return value if value is not None else default
+    return _sort_key
+
+
+class MetadataIndex:
+    """
+    Metadata entries grouped by their keys, for getting several properties of the same metadata list.
+
+    The list is scanned once and the most recent entry of each key is resolved upfront, while `get_metadata_property`
+    scans the whole list on every call. Both return the same values.
+    """
+
+    def __init__(self, metadata: Sequence[Mapping[str, Any]]) -> None:
+        self._items_by_key: dict[str, list[Mapping[str, Any]]] = {}
+        self._latest_by_key: dict[str, Mapping[str, Any]] = {}
+        for m in metadata:
+            key = m['key']
+            self._items_by_key.setdefault(key, []).append(m)
+            # The first of the equally recent entries wins, as with max().
+            if (latest := self._latest_by_key.get(key)) is None or (m.get('timestamp') or '') > (
+                latest.get('timestamp') or ''
+            ):
+                self._latest_by_key[key] = m
+
+    def get(
+        self,
+        key: str,
+        *,
+        provider: str | None = None,
+        preferred_providers: list[str] | None = None,
+        default: T | None = None,
+    ) -> T | None:
+        """Gets the value of a metadata property, see `get_metadata_property`."""
+        if provider and preferred_providers:
+            raise ValueError('Specifying both provider and preferred_providers makes no sense.')
+
+        if provider or preferred_providers:
+            filtered = (
+                m
+                for m in self._items_by_key.get(key, [])
+                if not provider or ('provider' in m and m['provider'] == provider)
+            )
+            item = max(filtered, key=_metadata_sort_key(preferred_providers), default=None)
+        else:
+            item = self._latest_by_key.get(key)
+        value = item.get('value') if item else None
+        return value if value is not None else default
 
 
 class KeboolaClient:
@@ -80,6 +131,15 @@ class KeboolaClient:
 
     STATE_KEY = 'sapi_client'
 
+    # Process-wide cache of the `tokens/verify` responses keyed by the Storage API URL and the fingerprint of the token
+    # the Storage API is called with. The project id, the project features, the token role and the default backend
+    # are all read from this response, so one lookup per token and TTL window serves all the sessions.
+    TOKEN_INFO_CACHE_SIZE = 1_024
+    TOKEN_INFO_CACHE_TTL = 120.0  # seconds
+    _token_info_cache: TtlCache[tuple[str, str], JsonDict] = TtlCache(
+        max_size=TOKEN_INFO_CACHE_SIZE, ttl=TOKEN_INFO_CACHE_TTL, shared=True
+    )
+
     @classmethod
     def from_state(cls, state: Mapping[str, Any]) -> 'KeboolaClient':
         instance = state[cls.STATE_KEY]
@@ -262,10 +322,48 @@ class KeboolaClient:
         """
         return self._branch_id
 
+    async def get_token_info(self) -> JsonDict:
+        """
+        Gets the token privileges and the information about the project to which the token belongs.
+
+        The `tokens/verify` responses are cached for `TOKEN_INFO_CACHE_TTL` seconds and concurrent lookups
+        of the same token share a single request. Each call gets its own copy of the response.
+
+        :return: Token and project information
+        """
+        return copy.deepcopy(await self._load_token_info())
+
+    async def get_project_id(self) -> str:
+        """
+        Gets the ID of the project to which the token belongs, see `get_token_info()`.
+
+        :return: Project id.
+        """
+        token_info = await self._load_token_info()
+        assert isinstance(token_info['owner'], dict)
+        return str(token_info['owner']['id'])
+
+    async def _load_token_info(self) -> JsonDict:
+        if not (fingerprint := token_fingerprint(self._bearer_token or self._token)):
+            return await self._storage_client.verify_token()
+        return await self._token_info_cache.get_or_load(
+            (self._storage_api_url, fingerprint), self._storage_client.verify_token
+        )
+
+    @classmethod
+    def invalidate_token_info(cls, fingerprints: Collection[str | None]) -> int:
+        """
+        Drops the cached `tokens/verify` responses of the tokens, e.g. after the Storage API rejected them.
+
+        :param fingerprints: The fingerprints of the tokens, see `token_fingerprint()`.
+        :return: The number of dropped responses.
+        """
+        return cls._token_info_cache.pop_matching(lambda key: key[1] in fingerprints)
+
     async def has_feature(self, feature: str) -> bool:
         """Checks if the project has a specific feature enabled. Results are cached."""
         if self._features_cache is None:
-            token_info = await self._storage_client.verify_token()
+            token_info = await self._load_token_info()
             owner = token_info.get('owner', {})
             self._features_cache = set(owner.get('features', []) if isinstance(owner, dict) else [])
         return feature in self._features_cache
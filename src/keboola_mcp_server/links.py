@@ -43,7 +43,7 @@ class ProjectLinksManager:
 
     @classmethod
     async def from_client(cls, client: KeboolaClient) -> 'ProjectLinksManager':
-        project_id = await client.storage_client.project_id()
+        project_id = await client.get_project_id()
         return cls(base_url=client.storage_api_url, project_id=project_id, branch_id=client.branch_id)
 
     def _url(self, path: str) -> str:
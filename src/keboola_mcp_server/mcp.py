@@ -14,6 +14,7 @@ from collections.abc import Awaitable, Callable, Iterable
 from typing import Any, TypeVar
 from unittest.mock import MagicMock
 
+import httpx
 import toon_format
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
@@ -29,6 +30,7 @@ from starlette.applications import Starlette
 from starlette.requests import Request
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
 from keboola_mcp_server.clients.auth_bridge import StorageTokenResolver, is_programmatic_token, strip_bearer
 from keboola_mcp_server.clients.base import JsonDict
 from keboola_mcp_server.clients.client import KeboolaClient
@@ -171,6 +173,43 @@ def get_http_request_or_none() -> Request | None:
         return None
 
 
+@dataclasses.dataclass(frozen=True)
+class _SessionKey:
+    """The request parameters that determine the session state built by `SessionStateMiddleware`."""
+
+    token_fingerprint: str | None
+    bearer_fingerprint: str | None
+    storage_api_url: str | None
+    branch_id: str | None
+    workspace_schema: str | None
+    project_id: str | None
+    skip_token_exchange: bool
+
+    @classmethod
+    def from_config(cls, config: Config, *, skip_token_exchange: bool) -> '_SessionKey':
+        return cls(
+            token_fingerprint=token_fingerprint(config.storage_token),
+            bearer_fingerprint=token_fingerprint(config.bearer_token),
+            storage_api_url=config.storage_api_url,
+            branch_id=config.branch_id,
+            workspace_schema=config.workspace_schema,
+            project_id=config.project_id,
+            skip_token_exchange=skip_token_exchange,
+        )
+
+
+def _find_http_status_code(error: BaseException) -> int | None:
+    """Gets the status code of the HTTP error that caused the exception, if there is one in its chain."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, httpx.HTTPStatusError):
+            return current.response.status_code
+        current = current.__cause__ or current.__context__
+    return None
+
+
 class SessionStateMiddleware(fmw.Middleware):
     """
     FastMCP middleware that manages session state in the Context parameter.
@@ -185,8 +224,27 @@ class SessionStateMiddleware(fmw.Middleware):
     * URL query parameters
 
     Note: HTTP headers and URL query parameters are only used when the server runs on HTTP-based transport.
+
+    The `KeboolaClient` and `WorkspaceManager` instances are cached across requests, keyed by the credentials,
+    the Storage API URL, the branch and the workspace schema of the request. In the stateless HTTP mode each tool call
+    is a separate request, so the cache saves the branch validation and the workspace discovery round-trips on every
+    call. A request with a different token simply maps to a different cache entry, and the entries of a token that
+    the Storage API rejects (HTTP 401) are dropped. The session state of a programmatic token (`kbc_at_`/`kbc_pat_`)
+    is not cached: the Storage token it is exchanged for stays valid after the programmatic token is revoked, so
+    the token is exchanged on every request. A branch or workspace deleted meanwhile fails the tool calls until its
+    entry expires.
     """
 
+    SESSION_CACHE_SIZE = 256
+    SESSION_CACHE_TTL = 300.0  # seconds
+
+    def __init__(self, *, session_cache_size: int | None = None, session_cache_ttl: float | None = None) -> None:
+        super().__init__()
+        self._session_cache: TtlCache[_SessionKey, dict[str, Any]] = TtlCache(
+            max_size=session_cache_size or self.SESSION_CACHE_SIZE,
+            ttl=session_cache_ttl or self.SESSION_CACHE_TTL,
+        )
+
     async def on_request(
         self,
         context: fmw.MiddlewareContext[mt.Request[Any, Any]],
@@ -239,18 +297,54 @@ class SessionStateMiddleware(fmw.Middleware):
                     LOG.info(f'Skipping branch validation for {context.method} request.')
                 config = dataclasses.replace(config, branch_id=None)
 
-            state = await self.create_session_state(
-                config, runtime_info, own_stack_storage_api_url=own_stack_storage_api_url, skip_token_exchange=is_list
-            )
-            ctx.session.state = state
+            def _create_session_state() -> Awaitable[dict[str, Any]]:
+                return self.create_session_state(
+                    config,
+                    runtime_info,
+                    own_stack_storage_api_url=own_stack_storage_api_url,
+                    skip_token_exchange=is_list,
+                )
+
+            session_key: _SessionKey | None = None
+            if is_programmatic_token(config.storage_token) and not is_list:
+                # Exchanged on every request, so that a revoked programmatic token is rejected right away.
+                cached_state = await _create_session_state()
+            else:
+                session_key = _SessionKey.from_config(config, skip_token_exchange=is_list)
+                try:
+                    cached_state = await self._session_cache.get_or_load(session_key, _create_session_state)
+                except Exception as e:
+                    self._invalidate_session_cache(session_key, e)
+                    raise
+            # The conversation ID is specific to the request, the rest of the state is shared by the cache entry.
+            ctx.session.state = cached_state | {CONVERSATION_ID: config.conversation_id}
+        else:
+            session_key = None
 
         try:
             return await call_next(context)
+        except Exception as e:
+            if session_key:
+                self._invalidate_session_cache(session_key, e)
+            raise
         finally:
             # NOTE: This line is commented following a bug related to session state clearance in Claude client
             # ctx.session.state = {}
             pass
 
+    def _invalidate_session_cache(self, session_key: '_SessionKey', error: BaseException) -> None:
+        """
+        Drops the cached session state that the upstream services no longer accept: an HTTP 401 error drops
+        all the entries of the rejected token and its cached token information. The other errors (e.g. HTTP 404
+        of a missing table) keep the entries.
+        """
+        if _find_http_status_code(error) == 401:
+            dropped = self._session_cache.pop_matching(lambda k: k.token_fingerprint == session_key.token_fingerprint)
+            KeboolaClient.invalidate_token_info(
+                {session_key.token_fingerprint, session_key.bearer_fingerprint} - {None}
+            )
+            LOG.info(f'Dropped {dropped} cached session state(s) of a token rejected by the Storage API.')
+
     @classmethod
     def _get_headers(cls, runtime_info: ServerRuntimeInfo) -> dict[str, Any]:
         """
@@ -482,7 +576,7 @@ class ToolsFilteringMiddleware(fmw.Middleware):
     async def get_token_info(ctx: Context) -> JsonDict:
         assert isinstance(ctx, Context), f'Expecting Context, got {type(ctx)}.'
         client = KeboolaClient.from_state(ctx.session.state)
-        return await client.storage_client.verify_token()
+        return await client.get_token_info()
 
     @staticmethod
     def get_project_features(token_info: JsonDict) -> set[str]:
@@ -0,0 +1,69 @@
+"""Adaptive polling of the status of the query jobs running in the Query Service."""
+
+from keboola_mcp_server.cache import TtlCache
+
+
+class QueryPollingStrategy:
+    """
+    Decides how long to wait before the next status check of a running query job.
+
+    The checks start at sub-second intervals and back off in proportion to the time the job has been running,
+    so a job is never detected as finished later than a fixed fraction of its duration. The strategy also learns
+    the typical duration of the queries in its workspace (an exponentially weighted moving average) and shortens
+    the wait so that a check lands at the moment the job is expected to finish.
+    """
+
+    MIN_INTERVAL = 0.25  # seconds
+    MAX_INTERVAL = 20.0  # seconds
+    # The interval is this fraction of the time the job has been running, e.g. a 25s query is checked every 2.5s.
+    BACKOFF_RATIO = 0.1
+    # The weight of the latest query duration in the moving average.
+    DURATION_WEIGHT = 0.3
+
+    WORKSPACE_STRATEGIES_SIZE = 1_024
+    WORKSPACE_STRATEGIES_TTL = 3_600.0  # seconds
+
+    # The durations of the queries differ per workspace (backend, warehouse size, data volume), so each
+    # workspace learns its own; the strategies are shared by all the sessions using the workspace.
+    _workspace_strategies: TtlCache[int, 'QueryPollingStrategy'] = TtlCache(
+        max_size=WORKSPACE_STRATEGIES_SIZE, ttl=WORKSPACE_STRATEGIES_TTL, shared=True
+    )
+
+    def __init__(self) -> None:
+        self._expected_duration: float | None = None
+
+    @classmethod
+    def for_workspace(cls, workspace_id: int) -> 'QueryPollingStrategy':
+        """Gets the strategy shared by all the queries running in the given workspace."""
+        if (strategy := cls._workspace_strategies.get(workspace_id)) is None:
+            strategy = cls()
+            cls._workspace_strategies.put(workspace_id, strategy)
+        return strategy
+
+    @property
+    def expected_duration(self) -> float | None:
+        """The moving average of the durations of the finished queries, None before the first query finishes."""
+        return self._expected_duration
+
+    def next_interval(self, elapsed_seconds: float) -> float:
+        """
+        Gets the number of seconds to wait before the next status check.
+
+        :param elapsed_seconds: The number of seconds the job has been running.
+        """
+        interval = min(max(elapsed_seconds * self.BACKOFF_RATIO, self.MIN_INTERVAL), self.MAX_INTERVAL)
+        if self._expected_duration is not None and elapsed_seconds < self._expected_duration:
+            interval = min(interval, max(self._expected_duration - elapsed_seconds, self.MIN_INTERVAL))
+        return interval
+
+    def record_query(self, duration: float) -> None:
+        """
+        Records a finished query so that the next queries are polled closer to their expected duration.
+
+        :param duration: The number of seconds from the job submission until the job finished.
+        """
+        if self._expected_duration is None:
+            self._expected_duration = duration
+        else:
+            weight = self.DURATION_WEIGHT
+            self._expected_duration = weight * duration + (1 - weight) * self._expected_duration
@@ -302,7 +302,7 @@ async def preview_config_diff(rq: Request) -> Response:
     # preview e.g. a data-app tool on a non-main branch, or a write tool with a read-only token.
     semantic_tools = getattr(rq.app.state, 'mcp_semantic_tools', set())
     is_semantic = preview_rq.tool_name in semantic_tools
-    token_info = await client.storage_client.verify_token()
+    token_info = await client.get_token_info()
     has_semantic_models = await project_has_semantic_models(client) if is_semantic else False
     denial = ToolsFilteringMiddleware.authorize_tool_call(
         tool_name=preview_rq.tool_name,
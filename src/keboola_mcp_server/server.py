@@ -16,6 +16,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, RedirectResponse, Response
 
 from keboola_mcp_server.authorization import ToolAuthorizationMiddleware
+from keboola_mcp_server.clients.base import HttpConnectionPool
 from keboola_mcp_server.config import Config, ServerRuntimeInfo, Transport, get_env_storage_api_url
 from keboola_mcp_server.errors import ValidationErrorMiddleware
 from keboola_mcp_server.mcp import (
@@ -96,11 +97,15 @@ def create_keboola_lifespan(
         def tool(ctx: Context):
             ... = ctx.request_context.life_span.config # ctx.life_span is type of ServerState
 
+        The lifespan also owns the process-wide `HttpConnectionPool`, so the keep-alive connections to the Keboola
+        services are reused by all sessions and closed when the server shuts down.
+
         Ideas:
         - it could handle OAuth token, client access, Redis database connection for storing sessions, access
         to the Relational DB, etc.
         """
-        yield server_state
+        async with HttpConnectionPool.open():
+            yield server_state
 
     return keboola_lifespan
 
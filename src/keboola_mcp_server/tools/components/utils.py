@@ -41,6 +41,7 @@ from keboola_mcp_server.clients.client import (
 from keboola_mcp_server.clients.storage import ComponentAPIResponse, ConfigurationAPIResponse
 from keboola_mcp_server.config import MetadataField
 from keboola_mcp_server.links import ProjectLinksManager
+from keboola_mcp_server.mcp import process_concurrently, unwrap_results
 from keboola_mcp_server.tools.components import tf_update
 from keboola_mcp_server.tools.components.model import (
     ALL_COMPONENT_TYPES,
@@ -110,12 +111,16 @@ async def list_configs_by_types(
     """
     components_with_configurations = []
 
-    for comp_type in component_types:
+    async def _list_components(comp_type: ComponentType) -> list[JsonDict]:
         # Fetch raw components with configurations included
-        raw_components_with_configurations_by_type = await client.storage_client.component_list(
-            component_type=comp_type, include=['configuration']
-        )
+        return await client.storage_client.component_list(component_type=comp_type, include=['configuration'])
+
+    # Fetch the listings of all the types concurrently, each type just once
+    unique_component_types = list(dict.fromkeys(component_types))
+    results = await process_concurrently(unique_component_types, _list_components)
+    raw_components_by_type = unwrap_results(results, 'Failed to list the components of some types')
 
+    for raw_components_with_configurations_by_type in raw_components_by_type:
         # Process each component and its configurations
         for raw_component in raw_components_with_configurations_by_type:
             raw_configuration_responses = [
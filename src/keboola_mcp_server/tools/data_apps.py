@@ -551,7 +551,7 @@ async def modify_streamlit_data_app(
     workspace_manager = WorkspaceManager.from_state(ctx.session.state)
     links_manager = await ProjectLinksManager.from_client(client)
 
-    project_id = await client.storage_client.project_id()
+    project_id = await client.get_project_id()
     workspace_id = await workspace_manager.get_workspace_id()
     sql_dialect = await workspace_manager.get_sql_dialect()
     branch_id = await workspace_manager.get_branch_id()
@@ -725,7 +725,7 @@ async def modify_streamlit_data_app_internal(
     updated_config = cast(
         JsonDict,
         await client.encryption_client.encrypt(
-            updated_config, component_id=DATA_APP_COMPONENT_ID, project_id=await client.storage_client.project_id()
+            updated_config, component_id=DATA_APP_COMPONENT_ID, project_id=await client.get_project_id()
         ),
     )
 
@@ -1233,7 +1233,7 @@ async def modify_python_js_data_app(
         if git_block is not None:
             # The git block's `#password` is plaintext at this point; the encryption service walks
             # the dict and only encrypts keys starting with `#`, so everything else is untouched.
-            project_id = await client.storage_client.project_id()
+            project_id = await client.get_project_id()
             config_payload = cast(dict[str, Any], config.model_dump(by_alias=True, exclude_none=True))
             encrypted_payload = await client.encryption_client.encrypt(
                 config_payload,
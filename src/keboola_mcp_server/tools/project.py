@@ -181,7 +181,7 @@ async def get_project_info(
     links_manager = await ProjectLinksManager.from_client(client)
     storage = client.storage_client
 
-    token_data = await storage.verify_token()
+    token_data = await client.get_token_info()
     project_data = cast(JsonDict, token_data.get('owner', {}))
     project_id = cast(str, project_data.get('id', ''))
     project_name = cast(str, project_data.get('name', ''))
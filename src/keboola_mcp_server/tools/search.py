@@ -1,8 +1,9 @@
 import asyncio
+import heapq
 import logging
 from collections import defaultdict
-from collections.abc import AsyncGenerator, Sequence
-from typing import Annotated, Any
+from collections.abc import AsyncGenerator, Callable, Hashable, Sequence
+from typing import Annotated, Any, NamedTuple
 
 from fastmcp import Context, FastMCP
 from fastmcp.exceptions import ToolError
@@ -10,6 +11,7 @@ from fastmcp.tools import FunctionTool
 from mcp.types import ToolAnnotations
 from pydantic import BaseModel, Field
 
+from keboola_mcp_server.cache import token_fingerprint
 from keboola_mcp_server.clients.base import JsonDict
 from keboola_mcp_server.clients.client import (
     CONDITIONAL_FLOW_COMPONENT_ID,
@@ -21,9 +23,13 @@ from keboola_mcp_server.clients.client import (
 from keboola_mcp_server.config import MetadataField
 from keboola_mcp_server.errors import tool_errors
 from keboola_mcp_server.links import Link, ProjectLinksManager
-from keboola_mcp_server.mcp import toon_serializer_compact
+from keboola_mcp_server.mcp import process_concurrently, toon_serializer_compact, unwrap_results
 from keboola_mcp_server.tools.components.utils import get_nested
+from keboola_mcp_server.tools.search_cursor import SearchCursors, SearchSnapshot
 from keboola_mcp_server.tools.search_global import _global_textual_search
+from keboola_mcp_server.tools.search_index import match_quality
+from keboola_mcp_server.tools.search_inventory import ProjectInventory
+from keboola_mcp_server.tools.search_lineage import is_mapping_scope
 from keboola_mcp_server.tools.search_models import (
     DEFAULT_GLOBAL_SEARCH_LIMIT,
     GLOBAL_SEARCH_FEATURE,
@@ -38,7 +44,6 @@ from keboola_mcp_server.tools.search_models import (
     SearchSpec,
     SearchType,
 )
-from keboola_mcp_server.tools.storage_helpers import merged_bucket_list, merged_bucket_table_list
 
 LOG = logging.getLogger(__name__)
 
@@ -111,10 +116,87 @@ def _check_column_match(table: JsonDict, cfg: SearchSpec) -> list[PatternMatch]:
     return []
 
 
-async def _fetch_buckets(client: KeboolaClient, spec: SearchSpec) -> list[SearchHit]:
+def _narrow_by_text_index(
+    inventory: ProjectInventory,
+    name: str,
+    items: list[JsonDict],
+    spec: SearchSpec,
+    get_texts: Callable[[JsonDict], list],
+) -> list[JsonDict]:
+    """
+    Narrows the items to those the patterns may match, looking up the literal patterns in the text index
+    of the items. Returns all the items if the patterns cannot be looked up.
+    """
+    if spec._literals is None:
+        return items
+    index = inventory.text_index(name, items, lambda: ((i, get_texts(item)) for i, item in enumerate(items)))
+    if (candidates := index.candidates(spec._literals)) is None:
+        return items
+    return [items[i] for i in sorted(candidates)]
+
+
+def _bucket_texts(bucket: JsonDict) -> list[str | None]:
+    return [
+        bucket.get('id'),
+        bucket.get('name'),
+        bucket.get('displayName'),
+        get_metadata_property(bucket.get('metadata', []), MetadataField.DESCRIPTION),
+    ]
+
+
+def _table_texts(table: JsonDict) -> list[str | None]:
+    return [
+        table.get('id'),
+        table.get('name'),
+        table.get('displayName'),
+        get_metadata_property(table.get('metadata', []), MetadataField.DESCRIPTION),
+        *table.get('columns', []),
+        *(
+            get_metadata_property(col_meta, MetadataField.DESCRIPTION)
+            for col_meta in (table.get('columnMetadata') or {}).values()
+        ),
+    ]
+
+
+def _configuration_texts(config: JsonDict) -> list[str | None]:
+    return [
+        config.get('id'),
+        config.get('name'),
+        config.get('description'),
+        *(text for row in config.get('rows', []) for text in (row.get('id'), row.get('name'), row.get('description'))),
+    ]
+
+
+def _match_configuration(
+    inventory: ProjectInventory, spec: SearchSpec, key: tuple[str, ...], config: JsonDict
+) -> list[PatternMatch]:
+    """Matches the JSON of a configuration or configuration row, flattened once per its version."""
+    if (configuration := config.get('configuration')) is None:
+        return []
+    flat = inventory.flat_configuration(key, config.get('version'), configuration)
+    return spec.match_configuration_scopes(configuration, flat)
+
+
+class _HitCandidate(NamedTuple):
+    """A matching item, validated as a `SearchHit` only once it is known to be returned."""
+
+    # The fields of the SearchHit
+    fields: dict[str, Any]
+    matches: list[PatternMatch]
+
+    @property
+    def item_type(self) -> SearchItemType:
+        return self.fields['item_type']
+
+    def to_hit(self) -> SearchHit:
+        return SearchHit(**self.fields).set_matches(self.matches)
+
+
+async def _fetch_buckets(client: KeboolaClient, spec: SearchSpec) -> AsyncGenerator[_HitCandidate, None]:
     """Fetches and filters buckets."""
-    hits = []
-    for bucket in await merged_bucket_list(client):
+    inventory = await ProjectInventory.from_client(client)
+    buckets = await inventory.list_buckets(client)
+    for bucket in _narrow_by_text_index(inventory, 'buckets', buckets, spec, _bucket_texts):
         if not (bucket_id := bucket.get('id')):
             continue
 
@@ -123,71 +205,88 @@ async def _fetch_buckets(client: KeboolaClient, spec: SearchSpec) -> list[Search
         bucket_description = get_metadata_property(bucket.get('metadata', []), MetadataField.DESCRIPTION)
 
         if matches := spec.match_texts([bucket_id, bucket_name, bucket_display_name, bucket_description]):
-            hits.append(
-                SearchHit(
-                    bucket_id=bucket_id,
-                    item_type='bucket',
-                    updated=_get_field_value(bucket, ['lastChangeDate', 'updated', 'created']) or '',
-                    name=bucket_name,
-                    display_name=bucket_display_name,
-                    description=bucket_description,
-                ).set_matches(matches)
+            yield _HitCandidate(
+                {
+                    'bucket_id': bucket_id,
+                    'item_type': 'bucket',
+                    'updated': _get_field_value(bucket, ['lastChangeDate', 'updated', 'created']) or '',
+                    'name': bucket_name,
+                    'display_name': bucket_display_name,
+                    'description': bucket_description,
+                },
+                matches,
             )
-    return hits
 
 
-async def _fetch_tables(client: KeboolaClient, spec: SearchSpec) -> list[SearchHit]:
+async def _fetch_tables(client: KeboolaClient, spec: SearchSpec) -> AsyncGenerator[_HitCandidate, None]:
     """Fetches and filters tables from all buckets."""
-    hits = []
-    for bucket in await merged_bucket_list(client):
-        if not (bucket_id := bucket.get('id')):
+    inventory = await ProjectInventory.from_client(client)
+    tables = await inventory.list_tables(client)
+    for table in _narrow_by_text_index(inventory, 'tables', tables, spec, _table_texts):
+        if not (table_id := table.get('id')):
             continue
 
-        tables = await merged_bucket_table_list(client, bucket_id, include=['columns', 'columnMetadata'])
-        for table in tables:
-            if not (table_id := table.get('id')):
-                continue
-
-            table_name = table.get('name')
-            table_display_name = table.get('displayName')
-            table_description = get_metadata_property(table.get('metadata', []), MetadataField.DESCRIPTION)
-
-            matches = spec.match_texts([table_id, table_name, table_display_name, table_description])
-            matches.extend(_check_column_match(table, spec))
-            if matches:
-                hits.append(
-                    SearchHit(
-                        table_id=table_id,
-                        item_type='table',
-                        updated=_get_field_value(table, ['lastChangeDate', 'created']) or '',
-                        name=table_name,
-                        display_name=table_display_name,
-                        description=table_description,
-                    ).set_matches(matches)
-                )
-    return hits
+        table_name = table.get('name')
+        table_display_name = table.get('displayName')
+        table_description = get_metadata_property(table.get('metadata', []), MetadataField.DESCRIPTION)
+
+        matches = spec.match_texts([table_id, table_name, table_display_name, table_description])
+        matches.extend(_check_column_match(table, spec))
+        if matches:
+            yield _HitCandidate(
+                {
+                    'table_id': table_id,
+                    'item_type': 'table',
+                    'updated': _get_field_value(table, ['lastChangeDate', 'created']) or '',
+                    'name': table_name,
+                    'display_name': table_display_name,
+                    'description': table_description,
+                },
+                matches,
+            )
 
 
 async def fetch_configurations(client: KeboolaClient, spec: SearchSpec) -> list[SearchHit]:
     """Fetches and filters configurations and configuration rows from all component types."""
-    hits = []
+    return [candidate.to_hit() async for candidate in _fetch_all_configs(client, spec)]
 
-    if spec._component_types:
-        for component_type in spec._component_types:
-            async for hit in _fetch_configs(client, spec, component_type=component_type):
-                hits.append(hit)
 
-    else:
-        async for hit in _fetch_configs(client, spec, component_type=None):
-            hits.append(hit)
+async def _fetch_all_configs(client: KeboolaClient, spec: SearchSpec) -> AsyncGenerator[_HitCandidate, None]:
+    inventory = await ProjectInventory.from_client(client)
+    component_types: Sequence[str | None] = spec._component_types or [None]
+
+    # The listings of all the component types are fetched at once and each of them just once per search.
+    async def _list_components(component_type: str | None) -> list[JsonDict]:
+        return await inventory.list_components(client, component_type)
+
+    results = await process_concurrently(component_types, _list_components)
+    listings = unwrap_results(results, 'Failed to list the components of some types')
 
-    return hits
+    for component_type, components in zip(component_types, listings):
+        async for candidate in _fetch_configs(inventory, spec, component_type, components):
+            yield candidate
 
 
 async def _fetch_configs(
-    client: KeboolaClient, spec: SearchSpec, component_type: str | None = None
-) -> AsyncGenerator[SearchHit, None]:
-    components = await client.storage_client.component_list(component_type, include=['configuration', 'rows'])
+    inventory: ProjectInventory, spec: SearchSpec, component_type: str | None, components: list[JsonDict]
+) -> AsyncGenerator[_HitCandidate, None]:
+    candidates = None
+    if spec.search_type == 'textual' and spec._literals is not None:
+        index = inventory.text_index(
+            f'configurations:{component_type}',
+            components,
+            lambda: (
+                ((component.get('id'), config.get('id')), _configuration_texts(config))
+                for component in components
+                for config in component.get('configurations', [])
+            ),
+        )
+        candidates = index.candidates(spec._literals)
+    elif _searches_mappings_only(spec):
+        # Only the configurations and rows whose input or output mappings mention a pattern can match.
+        lineage = inventory.lineage_index(component_type, components)
+        candidates = lineage.find_mentioning_keys(spec._combined_pattern)
+        candidates.update(key[:2] for key in list(candidates))
 
     allowed_transformations = 'transformation' in spec.item_types or component_type is None
     allowed_components = (
@@ -228,6 +327,8 @@ async def _fetch_configs(
         for config in component.get('configurations', []):
             if not (config_id := config.get('id')):
                 continue
+            if candidates is not None and (component_id, config_id) not in candidates:
+                continue
 
             config_name = config.get('name')
             config_description = config.get('description')
@@ -235,25 +336,31 @@ async def _fetch_configs(
 
             if spec.search_type == 'textual':
                 if matches := spec.match_texts([config_id, config_name, config_description]):
-                    yield SearchHit(
-                        component_id=component_id,
-                        configuration_id=config_id,
-                        item_type=item_type,
-                        updated=config_updated,
-                        name=config_name,
-                        description=config_description,
-                    ).set_matches(matches)
+                    yield _HitCandidate(
+                        {
+                            'component_id': component_id,
+                            'configuration_id': config_id,
+                            'item_type': item_type,
+                            'updated': config_updated,
+                            'name': config_name,
+                            'description': config_description,
+                        },
+                        matches,
+                    )
             elif spec.search_type == 'config-based' and (
-                matches := spec.match_configuration_scopes(config.get('configuration'))
+                matches := _match_configuration(inventory, spec, (component_id, config_id), config)
             ):
-                yield SearchHit(
-                    component_id=component_id,
-                    configuration_id=config_id,
-                    item_type=item_type,
-                    updated=config_updated,
-                    name=config_name,
-                    description=config_description,
-                ).set_matches(matches)
+                yield _HitCandidate(
+                    {
+                        'component_id': component_id,
+                        'configuration_id': config_id,
+                        'item_type': item_type,
+                        'updated': config_updated,
+                        'name': config_name,
+                        'description': config_description,
+                    },
+                    matches,
+                )
 
             for row in config.get('rows', []):
                 if not (row_id := row.get('id')):
@@ -264,28 +371,46 @@ async def _fetch_configs(
 
                 if spec.search_type == 'textual':
                     if matches := spec.match_texts([row_id, row_name, row_description]):
-                        yield SearchHit(
-                            component_id=component_id,
-                            configuration_id=config_id,
-                            configuration_row_id=row_id,
-                            item_type='configuration-row',
-                            updated=config_updated or _get_field_value(row, ['created']),
-                            name=row_name,
-                            description=row_description,
-                        ).set_matches(matches)
-
-                elif spec.search_type == 'config-based' and (
-                    matches := spec.match_configuration_scopes(row.get('configuration'))
+                        yield _HitCandidate(
+                            {
+                                'component_id': component_id,
+                                'configuration_id': config_id,
+                                'configuration_row_id': row_id,
+                                'item_type': 'configuration-row',
+                                'updated': config_updated or _get_field_value(row, ['created']) or '',
+                                'name': row_name,
+                                'description': row_description,
+                            },
+                            matches,
+                        )
+
+                elif (
+                    spec.search_type == 'config-based'
+                    and (candidates is None or (component_id, config_id, row_id) in candidates)
+                    and (matches := _match_configuration(inventory, spec, (component_id, config_id, row_id), row))
                 ):
-                    yield SearchHit(
-                        component_id=component_id,
-                        configuration_id=config_id,
-                        configuration_row_id=row_id,
-                        item_type='configuration-row',
-                        updated=config_updated or _get_field_value(row, ['created']),
-                        name=row_name,
-                        description=row_description,
-                    ).set_matches(matches)
+                    yield _HitCandidate(
+                        {
+                            'component_id': component_id,
+                            'configuration_id': config_id,
+                            'configuration_row_id': row_id,
+                            'item_type': 'configuration-row',
+                            'updated': config_updated or _get_field_value(row, ['created']) or '',
+                            'name': row_name,
+                            'description': row_description,
+                        },
+                        matches,
+                    )
+
+
+def _searches_mappings_only(spec: SearchSpec) -> bool:
+    """Checks if the config-based search looks for literal patterns only in the input and output mappings."""
+    return (
+        spec.search_type == 'config-based'
+        and spec._prune_unmatched
+        and bool(spec.search_scopes)
+        and all(is_mapping_scope(scope) for scope in spec.search_scopes)
+    )
 
 
 @tool_errors()
@@ -342,6 +467,13 @@ async def search(
         ),
     ] = DEFAULT_GLOBAL_SEARCH_LIMIT,
     offset: Annotated[int, Field(description='Number of matching items to skip for pagination (default: 0).')] = 0,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description='The `next_cursor` of the previous page, to get the next page of the same search '
+            '(pass the same patterns, item types and other parameters). Overrides `offset`.'
+        ),
+    ] = None,
 ) -> SearchOutput:
     """
     Searches for Keboola items (tables, buckets, components, configurations, transformations, flows, data-apps, etc.)
@@ -391,6 +523,8 @@ async def search(
     - Multiple patterns work as OR condition - matches items containing ANY of the patterns
     - Each result includes the item's ID, name, creation date, and relevant metadata; the response also carries
       `total` and `by_type` counts and the `branch_scope` the hits come from
+    - To get the next page, pass the returned `next_cursor` as `cursor` with the same parameters (faster than
+      increasing `offset`)
     - textual search prefers the current branch; on zero hits it automatically retries across all branches of the
       project and marks the response with branch_scope="all-branches"
     - scopes (config-based) narrow matching to specific JSONPath areas within configurations; matching is performed
@@ -400,8 +534,11 @@ async def search(
     IMPORTANT:
     - Always use this tool when the user mentions a name but you don't have the exact ID
     - The search returns IDs that you can use with other tools (e.g., get_tables, get_configs, get_flows)
-    - Results are ordered by the `updated` field, most recent first. `updated` is the item's last update time
-      when available, or its creation time otherwise (textual/global-search hits expose only the creation time).
+    - Results are ordered by the `updated` field, most recent first. Textual search with plain-text patterns may
+      rank the results by how well their names or IDs match the patterns first (an exact match, then a pattern
+      starting a word, then a pattern elsewhere) and by `updated` only among equally good matches. `updated` is
+      the item's last update time when available, or its creation time otherwise (textual/global-search hits expose
+      only the creation time).
     - Textual search matches names only, with tokenized full-text matching (case/diacritics-insensitive; not
       typo-corrected; no regex). It may not return every item the legacy enumeration did. To find items by
       description or by table column, use get_tables; to find items by configuration content, use config-based search.
@@ -488,7 +625,20 @@ async def search(
 
     client = KeboolaClient.from_state(ctx.session.state)
 
-    if search_type == 'textual' and await client.storage_client.is_enabled(GLOBAL_SEARCH_FEATURE):
+    snapshot_id = None
+    if cursor:
+        try:
+            snapshot_id, offset = SearchCursors.decode(cursor)
+        except ValueError as e:
+            raise ToolError(f'{e} Pass the `next_cursor` of the previous page or use `offset`.') from e
+
+    if snapshot_id and (output := await _search_snapshot_page(client, spec, snapshot_id, limit, offset)):
+        LOG.debug(f'Served the search page at offset {offset} from the snapshot {snapshot_id}.')
+    elif cursor:
+        # Only the enumeration returns cursors, so its next pages are enumerated again, too, keeping the hits
+        # of the following pages in a snapshot.
+        output = await _enumeration_search(client, spec, limit=limit, offset=offset, keep_snapshot=True)
+    elif search_type == 'textual' and await client.has_feature(GLOBAL_SEARCH_FEATURE):
         if mode == 'regex':
             raise ToolError(
                 'Regex patterns are not supported for textual search — it is a tokenized full-text name search. '
@@ -528,24 +678,28 @@ async def search(
     return output
 
 
-async def _enumeration_search(client: KeboolaClient, spec: SearchSpec, limit: int, offset: int) -> SearchOutput:
+async def _enumeration_search(
+    client: KeboolaClient, spec: SearchSpec, limit: int, offset: int, keep_snapshot: bool = False
+) -> SearchOutput:
     """
     Searches by enumerating the project's items client-side. Used for config-based search (which has no
     server-side equivalent) and as the legacy fallback for textual search in projects without the
     global-search feature.
+
+    :param keep_snapshot: Whether to keep the hits beyond the page in a snapshot for the cursor of the next pages,
+        which is done when the caller is paging by a cursor. Otherwise only the hits up to the page are selected.
     """
     # Determine which types to fetch
     types_to_fetch = set(spec.item_types) if spec.item_types else set()
 
-    # Fetch items concurrently based on requested types
-    tasks = []
-    all_hits: list[SearchHit] = []
+    # The sources of the matching items, enumerated concurrently
+    sources: list[AsyncGenerator[_HitCandidate, None]] = []
 
     if not types_to_fetch or 'bucket' in types_to_fetch:
-        tasks.append(_fetch_buckets(client, spec))
+        sources.append(_fetch_buckets(client, spec))
 
     if not types_to_fetch or 'table' in types_to_fetch:
-        tasks.append(_fetch_tables(client, spec))
+        sources.append(_fetch_tables(client, spec))
 
     if not types_to_fetch or types_to_fetch & {
         'configuration',
@@ -555,46 +709,154 @@ async def _enumeration_search(client: KeboolaClient, spec: SearchSpec, limit: in
         'workspace',
         'data-app',
     }:
-        tasks.append(fetch_configurations(client, spec))
+        sources.append(_fetch_all_configs(client, spec))
 
-    # Gather all results
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # The textual search with literal patterns ranks the hits by how well their names or IDs match the patterns,
+    # the most recently updated first among equally good hits.
+    literals = spec._literals if spec.search_type == 'textual' else None
 
-    # Process results
+    # The hits beyond the page are selected only to be kept for the cursor of the next pages.
+    selection_size = max(offset + limit, SearchCursors.MAX_SNAPSHOT_HITS) if keep_snapshot else offset + limit
+
+    async def _select(source_index: int, source: AsyncGenerator[_HitCandidate, None]) -> _TopHits:
+        top_hits = _TopHits(selection_size, literals)
+        async for candidate in source:
+            # The configuration endpoint returns every config type at once, so narrow to the requested types to match
+            # the global-search path (e.g. item_types=['configuration-row'] must not leak 'configuration' hits).
+            if not types_to_fetch or candidate.item_type in types_to_fetch:
+                top_hits.add(candidate, source_index)
+        return top_hits
+
+    results = await asyncio.gather(*(_select(i, source) for i, source in enumerate(sources)), return_exceptions=True)
+
+    top_hits = _TopHits(selection_size, literals)
     for result in results:
         if isinstance(result, Exception):
             # TODO: report this somehow to the AI assistant
             LOG.warning(f'Error fetching items: {result}')
             continue
         else:
-            all_hits.extend(result)
-
-    # The configuration endpoint returns every config type at once, so narrow to the requested types to match
-    # the global-search path (e.g. item_types=['configuration-row'] must not leak 'configuration' hits).
-    if types_to_fetch:
-        all_hits = [hit for hit in all_hits if hit.item_type in types_to_fetch]
-
-    # TODO: Should we sort by the item type too?
-    all_hits.sort(
-        key=lambda x: (
-            x.updated,
-            x.bucket_id or x.table_id or x.component_id or x.configuration_id or x.configuration_row_id,
-        ),
-        reverse=True,
+            top_hits.merge(result)
+
+    ranked = top_hits.ranked()
+    total = sum(top_hits.by_type.values())
+    next_cursor = None
+    if (next_offset := offset + limit) < total:
+        snapshot_id = None
+        if keep_snapshot and next_offset < len(ranked):
+            snapshot = SearchSnapshot(await _get_search_key(client, spec), ranked, total, dict(top_hits.by_type))
+            snapshot_id = SearchCursors.save(snapshot)
+        next_cursor = SearchCursors.encode(snapshot_id, next_offset)
+
+    return SearchOutput(
+        hits=[candidate.to_hit() for candidate in ranked[offset:next_offset]],
+        total=total,
+        by_type=dict(top_hits.by_type),
+        branch_scope='current-branch',
+        next_cursor=next_cursor,
     )
 
-    by_type: dict[str, int] = defaultdict(int)
-    for hit in all_hits:
-        by_type[hit.item_type] += 1
 
+async def _search_snapshot_page(
+    client: KeboolaClient, spec: SearchSpec, snapshot_id: str, limit: int, offset: int
+) -> SearchOutput | None:
+    """Gets the page of the hits kept by the enumeration search, None if they are no longer kept or not all of them."""
+    snapshot = SearchCursors.load(snapshot_id, await _get_search_key(client, spec))
+    if snapshot is None or (offset + limit > len(snapshot.ranked) and len(snapshot.ranked) < snapshot.total):
+        return None
+
+    next_offset = offset + limit
     return SearchOutput(
-        hits=all_hits[offset : offset + limit],
-        total=len(all_hits),
-        by_type=dict(by_type),
+        hits=[candidate.to_hit() for candidate in snapshot.ranked[offset:next_offset]],
+        total=snapshot.total,
+        by_type=dict(snapshot.by_type),
         branch_scope='current-branch',
+        next_cursor=SearchCursors.encode(snapshot_id, next_offset) if next_offset < snapshot.total else None,
+    )
+
+
+async def _get_search_key(client: KeboolaClient, spec: SearchSpec) -> Hashable:
+    """Identifies the search and the project branch and token it is run with."""
+    return (
+        client.storage_api_url,
+        await client.get_project_id(),
+        client.branch_id,
+        token_fingerprint(client.bearer_token or client.token),
+        spec.search_type,
+        tuple(spec.patterns),
+        tuple(spec.item_types),
+        spec.pattern_mode,
+        spec.case_sensitive,
+        tuple(spec.search_scopes),
     )
 
 
+class _TopHits:
+    """
+    Selects the best ranked of the matching items as they are enumerated, keeping only as many of them as
+    the requested page needs, and counts all the matching items by their type.
+    """
+
+    def __init__(self, size: int, literals: Sequence[str] | None) -> None:
+        """
+        :param size: The number of the best ranked items to keep.
+        :param literals: The literal patterns of the textual search to rank the items by, None to rank them
+            by their update time only.
+        """
+        self._size = size
+        self._literals = literals
+        # A min-heap of the kept items, the worst ranked on the top; the items are ordered by the item's rank and then
+        # by the source's and the item's position, so that they keep the enumeration order among equally ranked items.
+        self._heap: list[tuple[tuple[int, str, str], tuple[int, int], _HitCandidate]] = []
+        self._count = 0
+        self.by_type: dict[str, int] = defaultdict(int)
+
+    def _rank(self, candidate: _HitCandidate) -> tuple[int, str, str]:
+        fields = candidate.fields
+        quality = 0
+        if self._literals:
+            hit_id = (
+                fields.get('configuration_row_id')
+                or fields.get('configuration_id')
+                or fields.get('table_id')
+                or fields.get('bucket_id')
+                or fields.get('component_id')
+            )
+            quality = match_quality(self._literals, [fields.get('name'), fields.get('display_name'), hit_id])
+        # The item type is not ranked, the items of all the types compete by their match quality and update time.
+        sort_id = (
+            fields.get('bucket_id')
+            or fields.get('table_id')
+            or fields.get('component_id')
+            or fields.get('configuration_id')
+            or fields.get('configuration_row_id')
+        )
+        return quality, fields['updated'], sort_id
+
+    def add(self, candidate: _HitCandidate, source_index: int) -> None:
+        self.by_type[candidate.item_type] += 1
+        self._count += 1
+        if self._size > 0:
+            self._push((self._rank(candidate), (-source_index, -self._count), candidate))
+
+    def _push(self, entry: tuple[tuple[int, str, str], tuple[int, int], _HitCandidate]) -> None:
+        if len(self._heap) < self._size:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def merge(self, other: '_TopHits') -> None:
+        """Adds the items kept and counted by another selection."""
+        for item_type, count in other.by_type.items():
+            self.by_type[item_type] += count
+        for entry in other._heap:
+            self._push(entry)
+
+    def ranked(self) -> list[_HitCandidate]:
+        """Gets the kept items, the best ranked first."""
+        return [candidate for *_, candidate in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+
 class SuggestedComponentOutput(BaseModel):
     """Output of find_component_id tool."""
 
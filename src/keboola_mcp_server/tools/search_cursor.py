@@ -0,0 +1,72 @@
+"""Cursors paging through the hits of the client-side enumeration search.
+
+The enumeration search ranks all the matching items of the project, so requesting the next page by `offset`
+would enumerate and rank them all again. The first page selects only the items it returns and its cursor points
+to the offset of the next page. The page requested by such a cursor is searched again, but it keeps the ranked items
+(up to `SearchCursors.MAX_SNAPSHOT_HITS`) in a snapshot and returns a cursor pointing to the next page
+of the snapshot; the following pages are sliced from the snapshot. The snapshots expire after
+`SearchCursors.SNAPSHOT_CACHE_TTL` seconds, after which the cursor falls back to searching again from its offset.
+"""
+
+import secrets
+from collections.abc import Hashable, Sequence
+from typing import Any, NamedTuple
+
+from keboola_mcp_server.cache import TtlCache
+
+
+class SearchSnapshot(NamedTuple):
+    # Identifies the search and the token, project and branch it was run with
+    search_key: Hashable
+    # The best ranked matching items, the best first
+    ranked: Sequence[Any]
+    total: int
+    by_type: dict[str, int]
+
+
+class SearchCursors:
+    """The snapshots of the ranked hits of the searches, shared by all the sessions in the process."""
+
+    SNAPSHOT_CACHE_SIZE = 64
+    SNAPSHOT_CACHE_TTL = 600.0  # seconds
+    # The most items kept in a snapshot; the pages beyond them are searched again.
+    MAX_SNAPSHOT_HITS = 1_000
+
+    _snapshots: TtlCache[str, SearchSnapshot] = TtlCache(
+        max_size=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL, shared=True
+    )
+
+    @classmethod
+    def save(cls, snapshot: SearchSnapshot) -> str:
+        """
+        Keeps the snapshot.
+
+        :return: The ID of the snapshot.
+        """
+        snapshot_id = secrets.token_urlsafe(12)
+        cls._snapshots.put(snapshot_id, snapshot)
+        return snapshot_id
+
+    @classmethod
+    def load(cls, snapshot_id: str, search_key: Hashable) -> SearchSnapshot | None:
+        """Gets the snapshot of the search, None if it has expired or was taken by a different search."""
+        if (snapshot := cls._snapshots.get(snapshot_id)) is None or snapshot.search_key != search_key:
+            return None
+        return snapshot
+
+    @staticmethod
+    def encode(snapshot_id: str | None, offset: int) -> str:
+        """Creates the cursor of the page starting at the offset of the snapshot, or of the search if no snapshot."""
+        return f'{snapshot_id or ""}:{offset}'
+
+    @staticmethod
+    def decode(cursor: str) -> tuple[str | None, int]:
+        """
+        Reads the snapshot ID and the offset of the cursor.
+
+        :raises ValueError: If the cursor is malformed.
+        """
+        snapshot_id, separator, offset = cursor.rpartition(':')
+        if not separator or not offset.isdigit():
+            raise ValueError(f'Invalid search cursor: "{cursor}".')
+        return snapshot_id or None, int(offset)
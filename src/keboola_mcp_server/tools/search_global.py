@@ -11,6 +11,7 @@ from collections import defaultdict
 from collections.abc import Sequence
 from typing import Any, Literal, cast
 
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
 from keboola_mcp_server.clients.client import (
     CONDITIONAL_FLOW_COMPONENT_ID,
     DATA_APP_COMPONENT_ID,
@@ -32,6 +33,61 @@ from keboola_mcp_server.tools.search_models import (
 LOG = logging.getLogger(__name__)
 
 
+class GlobalSearchCache:
+    """
+    The `global-search` responses kept between the `search` tool calls, shared by all the sessions in the process.
+
+    The agents often repeat the same searches, so the responses are keyed by the project, the token, the branch and
+    the request parameters, and concurrent identical searches share a single request. The short
+    `RESPONSE_CACHE_TTL` bounds how long the items created or renamed meanwhile stay unnoticed, and the tools
+    changing the project's items call `invalidate`.
+    """
+
+    RESPONSE_CACHE_SIZE = 512
+    RESPONSE_CACHE_TTL = 30.0  # seconds
+
+    # (Storage API URL, project ID, token fingerprint, branch ID, query, API types, limit, offset, branch scope)
+    _responses: TtlCache[tuple[Any, ...], GlobalSearchResponse] = TtlCache(
+        max_size=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL, shared=True
+    )
+
+    @classmethod
+    async def search(
+        cls,
+        client: KeboolaClient,
+        query: str,
+        types: Sequence[ApiItemType],
+        limit: int,
+        offset: int,
+        branch_scope: Literal['current', 'all'],
+    ) -> GlobalSearchResponse:
+        """Gets the cached response of the global search or searches the client's project."""
+        key = (
+            client.storage_api_url,
+            await client.get_project_id(),
+            token_fingerprint(client.bearer_token or client.token),
+            client.branch_id,
+            query,
+            tuple(types),
+            limit,
+            offset,
+            branch_scope,
+        )
+        return await cls._responses.get_or_load(
+            key,
+            lambda: client.storage_client.global_search(
+                query=query, types=types, limit=limit, offset=offset, branch_scope=branch_scope
+            ),
+        )
+
+    @classmethod
+    async def invalidate(cls, client: KeboolaClient) -> None:
+        """Forgets the responses of the client's project kept for any token and branch."""
+        storage_api_url, project_id = client.storage_api_url, await client.get_project_id()
+        dropped = cls._responses.pop_matching(lambda key: key[:2] == (storage_api_url, project_id))
+        LOG.debug(f'Dropped {dropped} cached global-search responses of project {project_id}.')
+
+
 def _api_types_for(item_types: Sequence[SearchItemType]) -> list[ApiItemType]:
     """Maps the tool's item types to a deduplicated list of API types for the global-search endpoint."""
     api_types: list[ApiItemType] = []
@@ -125,8 +181,13 @@ async def _global_textual_search(
         return list(
             await asyncio.gather(
                 *(
-                    client.storage_client.global_search(
-                        query=pattern, types=api_types, limit=fetch_limit, offset=offset, branch_scope=branch_scope
+                    GlobalSearchCache.search(
+                        client,
+                        query=pattern,
+                        types=api_types,
+                        limit=fetch_limit,
+                        offset=offset,
+                        branch_scope=branch_scope,
                     )
                     for pattern in spec.patterns
                 )
@@ -0,0 +1,307 @@
+"""Indexes of the project items for the enumeration search.
+
+The trigram index maps the trigrams of the case- and diacritics-folded texts (names, IDs, descriptions) of the items
+to the items containing them. The search patterns that are plain literals are looked up in the index to get the few
+candidate items, which are then matched by the patterns as before; the other patterns (regular expressions) still need
+to scan all the items.
+
+The flattened configurations serve the config-based search, which matches the patterns against every JSON node
+of the configurations, and the literal matcher finds which of many literal patterns (e.g. table IDs) occur in a text
+in a single pass.
+"""
+
+import functools
+import json
+import re
+import unicodedata
+from collections.abc import Hashable, Iterable, Sequence
+from typing import Any, Generic, NamedTuple, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+# The keys and list indices leading from the configuration root to a JSON node
+JsonNodePath = tuple[str | int, ...]
+
+NGRAM_SIZE = 3
+
+
+@functools.cache
+def _fold_char(char: str) -> str:
+    decomposed = unicodedata.normalize('NFKD', char)
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-folds the text and strips its diacritics.
+
+    The characters are folded one by one, so a substring of a text folds to a substring of the folded text.
+    """
+    if text.isascii():
+        return text.lower()
+    return ''.join(map(_fold_char, text))
+
+
+def _ngrams(folded_text: str) -> set[str]:
+    return {folded_text[i : i + NGRAM_SIZE] for i in range(len(folded_text) - NGRAM_SIZE + 1)}
+
+
+class TrigramIndex(Generic[K]):
+    """Maps the trigrams of the folded texts of the documents to the keys of the documents."""
+
+    def __init__(self, documents: Iterable[tuple[K, Iterable[str | None]]]) -> None:
+        """
+        :param documents: The key and the texts of each document.
+        """
+        self._keys: list[K] = []
+        self._postings: dict[str, set[int]] = {}
+        for key, texts in documents:
+            position = len(self._keys)
+            self._keys.append(key)
+            for text in texts:
+                if not text:
+                    continue
+                for ngram in _ngrams(fold_text(text)):
+                    self._postings.setdefault(ngram, set()).add(position)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def candidates(self, literals: Sequence[str]) -> set[K] | None:
+        """
+        Gets the keys of the documents that may contain any of the literals. Every document containing
+        a literal (even ignoring the case) is returned, but the returned documents need not contain any.
+
+        :return: The candidate keys, or None if some literal is too short to be looked up.
+        """
+        positions: set[int] = set()
+        for literal in literals:
+            if not (ngrams := _ngrams(fold_text(literal))):
+                return None
+            postings = sorted((self._postings.get(ngram, set()) for ngram in ngrams), key=len)
+            positions |= postings[0].intersection(*postings[1:])
+        return {self._keys[position] for position in positions}
+
+
+def match_quality(literals: Sequence[str], texts: Iterable[str | None]) -> int:
+    """
+    Rates how well the texts match the literals: 3 if a text equals a literal, 2 if a literal starts a word
+    of a text, 1 if a literal is found elsewhere in a text and 0 if no literal is found. The case and the diacritics
+    are ignored.
+    """
+    folded_literals = [fold_text(literal) for literal in literals]
+    quality = 0
+    for text in texts:
+        if not text:
+            continue
+        folded_text = fold_text(text)
+        for literal in folded_literals:
+            if literal == folded_text:
+                return 3
+            elif literal in folded_text:
+                word_start = re.search(rf'(?:^|[\W_]){re.escape(literal)}', folded_text)
+                quality = max(quality, 2 if word_start else 1)
+    return quality
+
+
+class LiteralMatcher:
+    """
+    Finds which of the literal patterns occur in a text, in a single pass over the text.
+
+    The literals are compiled into a regular expression shaped as their prefix tree (e.g. `in.c-a` and `in.c-b` share
+    the `in.c-` branch), so matching many literals sharing prefixes, such as table IDs, costs about as much as matching
+    one. The expression is matched at every position of the text and yields the longest literal starting there;
+    the shorter literals that are its prefixes are added to the found literals.
+    """
+
+    # The longest literal compiled into the prefix tree expression; bounds the expression's nesting.
+    MAX_LITERAL_LENGTH = 256
+
+    def __init__(self, literals: Sequence[str], case_sensitive: bool) -> None:
+        self._case_sensitive = case_sensitive
+        keys = {self._get_key(literal) for literal in literals}
+        # The literals found when the longest literal found at a position is the key
+        self._found_literals: dict[str, set[str]] = {
+            key: {literal for literal in literals if key.startswith(self._get_key(literal))} for key in keys
+        }
+        self.pattern = re.compile(self._to_regex(self._build_trie(keys)), 0 if case_sensitive else re.IGNORECASE)
+        self._scanner = re.compile(f'(?=({self.pattern.pattern}))', self.pattern.flags)
+
+    @classmethod
+    def from_literals(cls, literals: Sequence[str], case_sensitive: bool) -> 'LiteralMatcher | None':
+        """
+        Creates the matcher of the literals.
+
+        :return: The matcher, or None if the literals are not suitable for it, i.e. they are too long or they are
+            matched case-insensitively and contain non-ASCII characters, which can have several lower-case forms.
+        """
+        if not literals or any(len(literal) > cls.MAX_LITERAL_LENGTH for literal in literals):
+            return None
+        if not case_sensitive and not all(literal.isascii() for literal in literals):
+            return None
+        return cls(literals, case_sensitive)
+
+    def _get_key(self, text: str) -> str:
+        return text if self._case_sensitive else text.lower()
+
+    @staticmethod
+    def _build_trie(keys: Iterable[str]) -> dict[str, Any]:
+        trie: dict[str, Any] = {}
+        for key in keys:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return trie
+
+    @classmethod
+    def _to_regex(cls, node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + cls._to_regex(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        regex = branches[0] if len(branches) == 1 else f'(?:{"|".join(branches)})'
+        # The longer literals are tried first.
+        return f'(?:{regex})?' if '' in node else regex
+
+    def find(self, text: str) -> set[str] | None:
+        """
+        Finds the literals occurring in the text.
+
+        :return: The found literals, or None if they cannot be told, which happens only for the rare non-ASCII
+            characters matched case-insensitively by an ASCII character (e.g. the long s).
+        """
+        found: set[str] = set()
+        for match in self._scanner.finditer(text):
+            if (literals := self._found_literals.get(self._get_key(match.group(1)))) is None:
+                return None
+            found |= literals
+        return found
+
+
+def stringify_json(value: Any) -> str:
+    """Serializes the JSON value the way the config-based search matches it."""
+    return json.dumps(value, sort_keys=True, default=str, ensure_ascii=False)
+
+
+class FlatJsonNode(NamedTuple):
+    path: JsonNodePath
+    # The node's value if it is a string, which is matched as is rather than as a JSON string literal
+    string_value: str | None
+    # The span of the node's JSON in the text of the configuration
+    start: int
+    end: int
+
+
+class FlatConfiguration:
+    """
+    A configuration flattened for the config-based search.
+
+    The configuration is serialized once to its JSON text; the JSON of each of its nodes is a slice of this text.
+    The nodes are listed in the order in which the JSONPath expression `$..*` finds them, the descendants of each
+    dict or list node forming a contiguous range of the list.
+    """
+
+    def __init__(self, text: str, nodes: list[FlatJsonNode], descendants: dict[JsonNodePath, tuple[int, int]]) -> None:
+        self._text = text
+        self._nodes = nodes
+        self._descendants = descendants
+
+    @classmethod
+    def from_configuration(cls, configuration: Any) -> 'FlatConfiguration | None':
+        """
+        Flattens the configuration.
+
+        :return: The flattened configuration, or None if the configuration is not plain JSON data.
+        """
+        parts: list[str] = []
+        spans: dict[JsonNodePath, tuple[int, int]] = {}
+        position = 0
+
+        def _dump(value: Any, path: JsonNodePath) -> bool:
+            nonlocal position
+            start = position
+            if isinstance(value, dict):
+                if not all(isinstance(key, str) for key in value):
+                    return False
+                parts.append('{')
+                position += 1
+                for i, key in enumerate(sorted(value)):
+                    key_text = f'{json.dumps(key, ensure_ascii=False)}: '
+                    parts.append(f', {key_text}' if i else key_text)
+                    position += len(parts[-1])
+                    if not _dump(value[key], (*path, key)):
+                        return False
+                parts.append('}')
+                position += 1
+            elif isinstance(value, list):
+                parts.append('[')
+                position += 1
+                for i, item in enumerate(value):
+                    if i:
+                        parts.append(', ')
+                        position += 2
+                    if not _dump(item, (*path, i)):
+                        return False
+                parts.append(']')
+                position += 1
+            elif isinstance(value, tuple):
+                return False
+            else:
+                parts.append(stringify_json(value))
+                position += len(parts[-1])
+            spans[path] = (start, position)
+            return True
+
+        if not _dump(configuration, ()):
+            return None
+        text = ''.join(parts)
+        if text != stringify_json(configuration):
+            return None
+
+        nodes: list[FlatJsonNode] = []
+        descendants: dict[JsonNodePath, tuple[int, int]] = {}
+
+        # Mirrors jsonpath_ng's `..*`: the values of a dict first, then the descendants of each value or list item.
+        def _visit(value: Any, path: JsonNodePath) -> None:
+            first = len(nodes)
+            if isinstance(value, dict):
+                for key, child in value.items():
+                    child_path = (*path, key)
+                    nodes.append(
+                        FlatJsonNode(child_path, child if isinstance(child, str) else None, *spans[child_path])
+                    )
+                for key, child in value.items():
+                    _visit(child, (*path, key))
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    _visit(item, (*path, i))
+            else:
+                return
+            descendants[path] = (first, len(nodes))
+
+        _visit(configuration, ())
+        return cls(text, nodes, descendants)
+
+    @property
+    def text(self) -> str:
+        """The JSON text of the whole configuration."""
+        return self._text
+
+    @property
+    def nodes(self) -> Sequence[FlatJsonNode]:
+        return self._nodes
+
+    def node_text(self, node: FlatJsonNode) -> str | None:
+        """Gets the text of the node matched by the config-based search, None for the nulls, which never match."""
+        if node.string_value is not None:
+            return node.string_value
+        text = self._text[node.start : node.end]
+        return None if text == 'null' else text
+
+    def descendant_range(self, path: JsonNodePath) -> tuple[int, int] | None:
+        """
+        Gets the range of the nodes that are the descendants of the dict or list node.
+
+        :return: The start and end index of the descendants, or None if the node is not a dict or list.
+        """
+        return self._descendants.get(path)
@@ -0,0 +1,315 @@
+"""In-memory inventory of the project items enumerated by the `search` tool and the usage lookups.
+
+Enumerating a big project means listing every bucket, the tables of every bucket with their columns and every
+component with its configurations and rows, which takes tens of seconds. The inventory keeps these listings in memory
+and refreshes them incrementally, so only the items that changed since the previous enumeration are downloaded again:
+
+- The buckets are listed on every refresh, that is a single request.
+- The tables of a bucket are listed again only when the bucket's `lastChangeDate` has changed, or when they were
+  listed more than `ProjectInventory.TABLES_RECHECK_INTERVAL` seconds ago.
+- The configurations are listed without their contents first; only the configurations whose `version` has changed
+  are then fetched, or the whole component type is listed again when too many of them have changed.
+
+The listings are returned as the same objects until they change, so the text indexes and the lineage indexes built
+over them (see :meth:`ProjectInventory.text_index` and :meth:`ProjectInventory.lineage_index`) are rebuilt only after
+a change, too.
+
+The storage metadata (e.g. descriptions) does not show in the bucket's `lastChangeDate`, so the tools changing it call
+:meth:`ProjectInventory.invalidate`, and the periodic recheck of the table listings picks up the metadata changed
+elsewhere (e.g. in the UI). The inventories themselves are kept until they are not used for
+`ProjectInventory.INVENTORY_CACHE_TTL` seconds.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Sequence
+from typing import Any, TypeVar
+
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
+from keboola_mcp_server.clients.base import JsonDict
+from keboola_mcp_server.clients.client import KeboolaClient
+from keboola_mcp_server.mcp import process_concurrently, unwrap_results
+from keboola_mcp_server.tools.search_index import FlatConfiguration, TrigramIndex
+from keboola_mcp_server.tools.search_lineage import LineageIndex
+from keboola_mcp_server.tools.storage_helpers import merged_bucket_list, merged_bucket_table_list
+
+LOG = logging.getLogger(__name__)
+
+T = TypeVar('T')
+K = TypeVar('K', bound=Hashable)
+
+# (Storage API URL, project ID, branch ID, token fingerprint); the branch ID is None for the default branch
+_InventoryKey = tuple[str, str, str | None, str | None]
+# (component ID, configuration ID)
+_ConfigKey = tuple[Any, Any]
+
+TABLE_INCLUDES = ['columns', 'columnMetadata']
+COMPONENT_INCLUDES = ['configuration', 'rows']
+
+
+class ProjectInventory:
+    """
+    The buckets, tables and component configurations of a project branch as seen by a token.
+
+    The inventories are shared by all the sessions in the process. They are keyed by the token, too, because
+    the tokens can have access to different buckets and components. The listings returned by the inventory are
+    shared by its callers and must not be modified.
+    """
+
+    INVENTORY_CACHE_SIZE = 64
+    INVENTORY_CACHE_TTL = 900.0  # seconds since the last use
+    # The tables of the buckets are listed again after this time even if the buckets have not changed,
+    # to pick up the metadata changes, which do not show in the bucket's lastChangeDate.
+    TABLES_RECHECK_INTERVAL = 60.0  # seconds
+    # When more configurations of a component type have changed, the whole type is listed again
+    # instead of fetching the changed configurations one by one.
+    MAX_CONFIG_DETAILS = 20
+
+    _inventories: TtlCache[_InventoryKey, 'ProjectInventory'] = TtlCache(
+        max_size=INVENTORY_CACHE_SIZE, ttl=INVENTORY_CACHE_TTL, shared=True
+    )
+
+    def __init__(self) -> None:
+        self._buckets: list[JsonDict] | None = None
+        # bucket ID -> (the bucket's lastChangeDate, the time of the listing, the tables)
+        self._bucket_tables: dict[str, tuple[str | None, float, list[JsonDict]]] = {}
+        self._tables: list[JsonDict] | None = None
+        self._components: dict[str | None, list[JsonDict]] = {}
+        self._text_indexes: dict[str, tuple[Sequence[JsonDict], TrigramIndex[Any]]] = {}
+        self._lineage_indexes: dict[str | None, tuple[Sequence[JsonDict], LineageIndex]] = {}
+        self._flat_configurations: dict[Hashable, tuple[Any, FlatConfiguration | None]] = {}
+        self._loading: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @classmethod
+    async def _get_key(cls, client: KeboolaClient) -> _InventoryKey:
+        return (
+            client.storage_api_url,
+            await client.get_project_id(),
+            client.branch_id,
+            token_fingerprint(client.bearer_token or client.token),
+        )
+
+    @classmethod
+    async def from_client(cls, client: KeboolaClient) -> 'ProjectInventory':
+        """Gets the inventory of the client's project branch and token."""
+        key = await cls._get_key(client)
+        if (inventory := cls._inventories.get(key)) is None:
+            inventory = cls()
+        # Put back on every use, so that only the unused inventories expire.
+        cls._inventories.put(key, inventory)
+        return inventory
+
+    @classmethod
+    async def invalidate(cls, client: KeboolaClient) -> None:
+        """Forgets the inventories of the client's project branch kept for any token."""
+        storage_api_url, project_id, branch_id, _ = await cls._get_key(client)
+        dropped = cls._inventories.pop_matching(lambda key: key[:3] == (storage_api_url, project_id, branch_id))
+        LOG.debug(f'Dropped {dropped} project inventories of project {project_id}, branch {branch_id}.')
+
+    async def _single_flight(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Runs the loader unless the same refresh is already running, in which case its result is awaited."""
+        if (future := self._loading.get(key)) is None:
+            future = asyncio.ensure_future(loader())
+            self._loading[key] = future
+
+            def _on_loaded(f: asyncio.Future[Any]) -> None:
+                if self._loading.get(key) is f:
+                    del self._loading[key]
+
+            future.add_done_callback(_on_loaded)
+
+        # Shielded so that a cancelled caller does not cancel the refresh the other callers are waiting for.
+        return await asyncio.shield(future)
+
+    async def list_buckets(self, client: KeboolaClient) -> list[JsonDict]:
+        """Lists the buckets visible from the client's branch."""
+        return await self._single_flight('buckets', lambda: self._refresh_buckets(client))
+
+    async def _refresh_buckets(self, client: KeboolaClient) -> list[JsonDict]:
+        buckets = await merged_bucket_list(client)
+        if buckets != self._buckets:
+            self._buckets = buckets
+        return self._buckets
+
+    async def list_tables(self, client: KeboolaClient) -> list[JsonDict]:
+        """Lists the tables of all the buckets visible from the client's branch, including their columns."""
+        return await self._single_flight('tables', lambda: self._refresh_tables(client))
+
+    async def _refresh_tables(self, client: KeboolaClient) -> list[JsonDict]:
+        buckets = await self.list_buckets(client)
+        cached = self._bucket_tables
+        now = time.monotonic()
+        bucket_ids = [bucket_id for bucket in buckets if (bucket_id := bucket.get('id'))]
+        changed_ids = [
+            bucket['id']
+            for bucket in buckets
+            if bucket.get('id')
+            and (
+                bucket['id'] not in cached
+                or bucket.get('lastChangeDate') is None
+                or cached[bucket['id']][0] != bucket.get('lastChangeDate')
+                or cached[bucket['id']][1] + self.TABLES_RECHECK_INTERVAL <= now
+            )
+        ]
+
+        async def _list_bucket_tables(bucket_id: str) -> list[JsonDict]:
+            return await merged_bucket_table_list(client, bucket_id, include=TABLE_INCLUDES)
+
+        if not changed_ids and self._tables is not None and bucket_ids == list(cached):
+            return self._tables
+
+        results = await process_concurrently(changed_ids, _list_bucket_tables)
+        listed = dict(zip(changed_ids, unwrap_results(results, 'Failed to list the tables of some buckets')))
+        LOG.debug(f'Listed the tables of {len(listed)} changed buckets out of {len(bucket_ids)}.')
+
+        last_change_dates = {bucket['id']: bucket.get('lastChangeDate') for bucket in buckets if bucket.get('id')}
+        bucket_tables: dict[str, tuple[str | None, float, list[JsonDict]]] = {}
+        for bucket_id in bucket_ids:
+            if bucket_id not in listed:
+                bucket_tables[bucket_id] = cached[bucket_id]
+            elif bucket_id in cached and cached[bucket_id][2] == listed[bucket_id]:
+                # The same tables are kept as the same objects, so that the indexes over them are kept, too.
+                bucket_tables[bucket_id] = (last_change_dates[bucket_id], now, cached[bucket_id][2])
+            else:
+                bucket_tables[bucket_id] = (last_change_dates[bucket_id], now, listed[bucket_id])
+
+        unchanged = (
+            self._tables is not None
+            and bucket_ids == list(cached)
+            and all(bucket_tables[bucket_id][2] is cached[bucket_id][2] for bucket_id in bucket_ids)
+        )
+        self._bucket_tables = bucket_tables
+        if not unchanged:
+            self._tables = [table for *_, tables in bucket_tables.values() for table in tables]
+        return self._tables
+
+    async def list_components(self, client: KeboolaClient, component_type: str | None = None) -> list[JsonDict]:
+        """
+        Lists the components with their configurations and configuration rows.
+
+        :param component_type: The type of the components to list, all the components if None.
+        """
+        return await self._single_flight(
+            ('components', component_type), lambda: self._refresh_components(client, component_type)
+        )
+
+    async def _refresh_components(self, client: KeboolaClient, component_type: str | None) -> list[JsonDict]:
+        cached = self._components.get(component_type)
+        components = None
+        if cached is not None:
+            components = await self._update_components(client, component_type, cached)
+        if components is None:
+            components = await client.storage_client.component_list(component_type, include=COMPONENT_INCLUDES)
+        self._components[component_type] = components
+        self._prune_flat_configurations()
+        return components
+
+    def _prune_flat_configurations(self) -> None:
+        """Forgets the flattened configurations and rows that are no longer listed."""
+        listed_keys: set[Hashable] = set()
+        for components in self._components.values():
+            for component in components:
+                for config in component.get('configurations', []):
+                    config_key = (component.get('id'), config.get('id'))
+                    listed_keys.add(config_key)
+                    listed_keys.update((*config_key, row.get('id')) for row in config.get('rows', []))
+        for key in self._flat_configurations.keys() - listed_keys:
+            del self._flat_configurations[key]
+
+    async def _update_components(
+        self, client: KeboolaClient, component_type: str | None, cached: list[JsonDict]
+    ) -> list[JsonDict] | None:
+        """
+        Brings the cached components up to date, fetching only the configurations whose version has changed.
+
+        :return: The updated components, or None if too many configurations have changed.
+        """
+        cached_configs: dict[_ConfigKey, JsonDict] = {
+            (component.get('id'), config.get('id')): config
+            for component in cached
+            for config in component.get('configurations', [])
+        }
+        components = await client.storage_client.component_list(component_type)
+
+        changed: list[_ConfigKey] = []
+        for component in components:
+            for config in component.get('configurations', []):
+                key = (component.get('id'), config.get('id'))
+                version = config.get('version')
+                if version is None or key not in cached_configs or cached_configs[key].get('version') != version:
+                    changed.append(key)
+
+        if not changed and len(cached_configs) == sum(len(c.get('configurations', [])) for c in components):
+            return cached
+        elif len(changed) > self.MAX_CONFIG_DETAILS:
+            return None
+
+        async def _fetch_config(key: _ConfigKey) -> JsonDict:
+            component_id, config_id = key
+            return await client.storage_client.configuration_detail(component_id, config_id)
+
+        results = await process_concurrently(changed, _fetch_config)
+        fetched = dict(zip(changed, unwrap_results(results, 'Failed to fetch some configurations')))
+        LOG.debug(f'Fetched {len(fetched)} changed configurations of component type {component_type}.')
+
+        return [
+            component
+            | {
+                'configurations': [
+                    fetched.get(key) or cached_configs[key]
+                    for config in component.get('configurations', [])
+                    if (key := (component.get('id'), config.get('id')))
+                ]
+            }
+            for component in components
+        ]
+
+    def text_index(
+        self,
+        name: str,
+        items: Sequence[JsonDict],
+        get_documents: Callable[[], Iterable[tuple[K, Iterable[str | None]]]],
+    ) -> TrigramIndex[K]:
+        """
+        Gets the text index of a listing, built when the listing is indexed for the first time or has changed.
+
+        :param name: The name of the index.
+        :param items: The listing returned by the inventory.
+        :param get_documents: Gets the key and the texts of each document to index.
+        """
+        indexed_items, index = self._text_indexes.get(name, (None, None))
+        if indexed_items is not items or index is None:
+            index = TrigramIndex(get_documents())
+            self._text_indexes[name] = (items, index)
+            LOG.debug(f'Built the text index "{name}" of {len(index)} documents.')
+        return index
+
+    def lineage_index(self, component_type: str | None, components: Sequence[JsonDict]) -> LineageIndex:
+        """
+        Gets the lineage index of a component listing, rebuilt when the listing has changed. The entries
+        of the configurations and rows whose version has not changed are taken over from the previous index.
+
+        :param component_type: The type of the listed components, None for all the components.
+        :param components: The listing returned by :meth:`list_components`.
+        """
+        indexed_components, index = self._lineage_indexes.get(component_type, (None, None))
+        if indexed_components is not components or index is None:
+            index = LineageIndex(components, previous=index)
+            self._lineage_indexes[component_type] = (components, index)
+        return index
+
+    def flat_configuration(self, key: Hashable, version: Any, configuration: JsonDict) -> FlatConfiguration | None:
+        """
+        Gets the configuration flattened for the config-based search, flattened again only when its version changes.
+
+        :param key: Identifies the configuration or configuration row.
+        :param version: The version of the configuration or configuration row.
+        :param configuration: The configuration's JSON.
+        """
+        cached_version, flat = self._flat_configurations.get(key, (None, None))
+        if version is None or cached_version != version:
+            flat = FlatConfiguration.from_configuration(configuration)
+            if version is not None:
+                self._flat_configurations[key] = (version, flat)
+        return flat
@@ -0,0 +1,164 @@
+"""Reverse lineage index: the configurations reading or writing the tables and buckets in their mappings.
+
+The index is built from a component listing with the configurations and rows (see
+:meth:`ProjectInventory.lineage_index`). It maps each string in the input and output mappings
+(`storage.input` and `storage.output`), e.g. a table ID in `storage.input.tables[0].source`, to the configurations
+and configuration rows containing it. The table IDs are also mapped under their bucket IDs.
+
+The index also keeps the JSON texts of the mappings in a single corpus, so the literal patterns searched for
+in the mappings are found in one pass over the corpus instead of matching every configuration.
+"""
+
+import bisect
+import logging
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from keboola_mcp_server.clients.base import JsonDict
+from keboola_mcp_server.tools.components.utils import get_nested
+from keboola_mcp_server.tools.search_index import JsonNodePath, stringify_json
+from keboola_mcp_server.tools.search_models import get_jsonpath_str
+
+LOG = logging.getLogger(__name__)
+
+MAPPING_SCOPES = ('storage.input', 'storage.output')
+
+# (component ID, configuration ID) or (component ID, configuration ID, configuration row ID)
+LineageKey = tuple[str, ...]
+
+
+class LineageReference(NamedTuple):
+    component_id: str
+    component_type: str | None
+    configuration_id: str
+    configuration_row_id: str | None
+    name: str | None
+    updated: str | None
+    # The JSONPath of the string within the configuration, e.g. storage.input.tables[0].source
+    used_in: str
+
+
+class _ConfigurationLineage(NamedTuple):
+    # The version and the update timestamp of the configuration or row the lineage was built from
+    version: tuple[Any, str | None]
+    # The mapped strings and the references to them
+    references: list[tuple[str, LineageReference]]
+    # The JSON texts of the input and output mappings
+    mapping_text: str
+
+
+class LineageIndex:
+    """Maps the strings in the input and output mappings of the configurations to the configurations using them."""
+
+    def __init__(self, components: Sequence[JsonDict], previous: 'LineageIndex | None' = None) -> None:
+        """
+        :param components: The components with their configurations and configuration rows.
+        :param previous: The index of an older listing of the components, whose entries are reused
+            for the configurations and rows of the same version.
+        """
+        self._lineages: dict[LineageKey, _ConfigurationLineage] = {}
+        self._references: dict[str, list[LineageReference]] = defaultdict(list)
+        reused = 0
+
+        for component in components:
+            if not (component_id := component.get('id')):
+                continue
+            for config in component.get('configurations', []):
+                if not (config_id := config.get('id')):
+                    continue
+                config_updated = get_nested(config, 'currentVersion.created') or config.get('created')
+                items = [((component_id, config_id), config, None, config_updated)]
+                items.extend(
+                    ((component_id, config_id, row_id), row, row_id, config_updated or row.get('created'))
+                    for row in config.get('rows', [])
+                    if (row_id := row.get('id'))
+                )
+                for key, item, row_id, updated in items:
+                    version = (item.get('version'), updated)
+                    old_lineage = previous._lineages.get(key) if previous else None
+                    if old_lineage is not None and version[0] is not None and old_lineage.version == version:
+                        lineage = old_lineage
+                        reused += 1
+                    else:
+                        reference = LineageReference(
+                            component_id=component_id,
+                            component_type=component.get('type'),
+                            configuration_id=config_id,
+                            configuration_row_id=row_id,
+                            name=item.get('name'),
+                            updated=updated,
+                            used_in='',
+                        )
+                        lineage = self._get_lineage(version, reference, item.get('configuration'))
+                    self._lineages[key] = lineage
+                    for value, reference in lineage.references:
+                        self._references[value].append(reference)
+
+        # The mapping texts separated by newlines, which the JSON texts escape, so no literal spans two of them
+        keys_with_mappings = [key for key, lineage in self._lineages.items() if lineage.mapping_text]
+        self._corpus_keys: list[LineageKey] = keys_with_mappings
+        self._corpus_offsets: list[int] = []
+        offset = 0
+        for key in keys_with_mappings:
+            self._corpus_offsets.append(offset)
+            offset += len(self._lineages[key].mapping_text) + 1
+        self._corpus = '\n'.join(self._lineages[key].mapping_text for key in keys_with_mappings)
+        LOG.debug(f'Built the lineage index of {len(self._lineages)} configurations and rows, reused {reused}.')
+
+    @staticmethod
+    def _get_lineage(
+        version: tuple[Any, str | None], reference: LineageReference, configuration: JsonDict | None
+    ) -> _ConfigurationLineage:
+        references: list[tuple[str, LineageReference]] = []
+        mapping_texts: list[str] = []
+        for scope in MAPPING_SCOPES:
+            path: JsonNodePath = tuple(scope.split('.'))
+            if (mapping := get_nested(configuration or {}, scope)) is None:
+                continue
+            mapping_texts.append(stringify_json(mapping))
+            for string_path, value in _iter_strings(mapping, path):
+                used_in = reference._replace(used_in=get_jsonpath_str(string_path))
+                references.append((value, used_in))
+                # Tables (e.g. in.c-bucket.table) are used by their buckets, too.
+                if value.count('.') >= 2 and (bucket_id := value.rsplit('.', 1)[0]) != value:
+                    references.append((bucket_id, used_in))
+        return _ConfigurationLineage(version, references, '\n'.join(mapping_texts))
+
+    def get_references(self, target_id: str) -> list[LineageReference]:
+        """Gets the references to the table or bucket ID in the input and output mappings."""
+        return self._references.get(target_id, [])
+
+    def find_mentioning_keys(self, pattern: re.Pattern) -> set[LineageKey]:
+        """
+        Finds the configurations and rows whose mappings' JSON texts the pattern matches. The pattern must not match
+        across a newline.
+
+        :return: The keys of the configurations and rows.
+        """
+        keys: set[LineageKey] = set()
+        position = 0
+        while (match := pattern.search(self._corpus, position)) is not None:
+            index = bisect.bisect_right(self._corpus_offsets, match.start()) - 1
+            keys.add(self._corpus_keys[index])
+            # Continue after the mapping text containing the match.
+            position = self._corpus_offsets[index] + len(self._lineages[self._corpus_keys[index]].mapping_text) + 1
+        return keys
+
+
+def _iter_strings(value: Any, path: JsonNodePath) -> Iterable[tuple[JsonNodePath, str]]:
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, child in value.items():
+            yield from _iter_strings(child, (*path, key))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _iter_strings(item, (*path, index))
+
+
+def is_mapping_scope(scope: str) -> bool:
+    """Checks if the JSONPath scope of the config-based search is within the input or output mapping."""
+    scope = scope.removeprefix('$.')
+    return any(re.match(rf'{re.escape(mapping_scope)}(?:$|[.\[])', scope) for mapping_scope in MAPPING_SCOPES)
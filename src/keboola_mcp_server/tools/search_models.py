@@ -13,13 +13,14 @@ from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Literal
 
 import jsonpath_ng
-from jsonpath_ng.jsonpath import JSONPath
+from jsonpath_ng.jsonpath import DatumInContext, Fields, Index, JSONPath, Root
 from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from keboola_mcp_server.clients.base import JsonDict
 from keboola_mcp_server.clients.storage import ItemType as ApiItemType
 from keboola_mcp_server.links import Link
 from keboola_mcp_server.tools.components.utils import _normalize_jsonpath
+from keboola_mcp_server.tools.search_index import FlatConfiguration, JsonNodePath, LiteralMatcher
 
 LOG = logging.getLogger(__name__)
 
@@ -83,6 +84,11 @@ SEARCH_ITEM_TYPE_TO_API_TYPES: Mapping[SearchItemType, Sequence[ApiItemType]] =
     'state': ('state',),
 }
 
+# The characters that make a regular expression something else than a plain literal.
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+# The characters escaped in the JSON strings.
+_JSON_ESCAPED_CHARS = re.compile(r'["\\\x00-\x1f]')
+
 SearchType = Literal['textual', 'config-based']
 SearchPatternMode = Literal['regex', 'literal']
 SearchBranchScope = Literal['current-branch', 'all-branches']
@@ -192,6 +198,11 @@ class SearchOutput(BaseModel):
         "branch context and the search was widened to the whole project; check each hit's branch_id/branch_name "
         'to see where it lives.',
     )
+    next_cursor: str | None = Field(
+        default=None,
+        description='Pass as `cursor` (with the same search parameters) to get the next page faster than by `offset`; '
+        'None when the page is the last one or the search pages by `offset` only.',
+    )
 
 
 class SearchSpec(BaseModel):
@@ -205,7 +216,15 @@ class SearchSpec(BaseModel):
 
     _component_types: Sequence[str] = PrivateAttr(default_factory=tuple)
     _compiled_patterns: list[re.Pattern] = PrivateAttr(default_factory=list)
+    # Matches wherever any of the patterns matches; None if the patterns cannot be combined
+    _combined_pattern: re.Pattern | None = PrivateAttr(default=None)
+    # Finds all the literal patterns matching a text at once
+    _literal_matcher: LiteralMatcher | None = PrivateAttr(default=None)
+    # Whether the patterns are literals found in the JSON text of a dict or list if found in any of its nodes
+    _prune_unmatched: bool = PrivateAttr(default=False)
     _clean_patterns: list[str] = PrivateAttr(default_factory=list)
+    # The literals one of which is found in every text matched by the patterns; None if unknown
+    _literals: list[str] | None = PrivateAttr(default=None)
     _all_nodes_expr: JSONPath | None = PrivateAttr(default=None)
     # Tuple fields: (original_scope, parsed_scope_expr, parsed_descendants_expr)
     _scope_exprs: list[tuple[str, JSONPath, JSONPath]] = PrivateAttr(default_factory=list)
@@ -222,8 +241,21 @@ class SearchSpec(BaseModel):
             self._compiled_patterns = [re.compile(re.escape(pattern), flags) for pattern in cleaned_patterns]
         else:
             self._compiled_patterns = [re.compile(pattern, flags) for pattern in cleaned_patterns]
+        if self.pattern_mode == 'literal' and len(cleaned_patterns) > 1:
+            self._literal_matcher = LiteralMatcher.from_literals(cleaned_patterns, self.case_sensitive)
+        if self._literal_matcher is not None:
+            self._combined_pattern = self._literal_matcher.pattern
+        else:
+            self._combined_pattern = _combine_patterns(self._compiled_patterns, flags)
 
         self._clean_patterns = cleaned_patterns
+        self._literals = _get_pattern_literals(cleaned_patterns, self.pattern_mode)
+        # A literal without the escaped characters found in a string is found in the string's JSON, too.
+        self._prune_unmatched = (
+            self._combined_pattern is not None
+            and self._literals is not None
+            and not any(_JSON_ESCAPED_CHARS.search(literal) for literal in self._literals)
+        )
         return self
 
     @model_validator(mode='after')
@@ -277,6 +309,10 @@ class SearchSpec(BaseModel):
         if not haystack:
             return []
 
+        if self._literal_matcher is not None and (found := self._literal_matcher.find(haystack)) is not None:
+            matches = [pattern for pattern in self._clean_patterns if pattern in found]
+            return matches if self.return_all_matched_patterns else matches[:1]
+
         matches: list[str] = []
         for pattern, compiled in zip(self._clean_patterns, self._compiled_patterns):
             if compiled.search(haystack):
@@ -307,17 +343,69 @@ class SearchSpec(BaseModel):
                     return matches
         return matches
 
-    def match_configuration_scopes(self, configuration: JsonDict | None) -> list[PatternMatch]:
+    def _find_matches_in_nodes(
+        self, flat: FlatConfiguration, node_ranges: Iterable[tuple[int, int]]
+    ) -> list[PatternMatch]:
+        """Finds pattern matches on the ranges of the nodes of a flattened configuration."""
+        matches: list[PatternMatch] = []
+        for first, end in node_ranges:
+            # The start and end indices of the descendants of the nodes not matched by any literal pattern
+            pruned: dict[int, int] = {}
+            index = first
+            while index < end:
+                if index in pruned:
+                    index = pruned.pop(index)
+                    continue
+                node = flat.nodes[index]
+                index += 1
+                if not (text := flat.node_text(node)):
+                    continue
+                if self._combined_pattern is not None and not self._combined_pattern.search(text):
+                    descendants = flat.descendant_range(node.path) if self._prune_unmatched else None
+                    if descendants and descendants[0] < descendants[1]:
+                        pruned[descendants[0]] = descendants[1]
+                    continue
+                if matched := self.match_patterns(text):
+                    matches.append(PatternMatch(scope=get_jsonpath_str(node.path), patterns=matched))
+                    if not self.return_all_matched_patterns:
+                        return matches
+        return matches
+
+    def _find_descendant_matches(
+        self, configuration: JsonDict, flat: FlatConfiguration | None, self_expr: JSONPath, desc_expr: JSONPath
+    ) -> list[PatternMatch]:
+        """Finds pattern matches on the descendants of the nodes matched by a scope expression."""
+        if flat is not None:
+            node_ranges: list[tuple[int, int]] = []
+            for jpath_match in self_expr.find(configuration):
+                if (path := get_datum_path(jpath_match)) is None:
+                    break
+                if (node_range := flat.descendant_range(path)) is not None:
+                    node_ranges.append(node_range)
+                elif isinstance(jpath_match.value, (dict, list)):
+                    break
+            else:
+                return self._find_matches_in_nodes(flat, node_ranges)
+
+        return self._find_matches_for_expr(configuration, desc_expr)
+
+    def match_configuration_scopes(
+        self, configuration: JsonDict | None, flat: FlatConfiguration | None = None
+    ) -> list[PatternMatch]:
         """
         Checks configuration fields within specified JSONPath scopes for pattern matches.
         Walks matching nodes within each scope and returns the exact path where the match
         was found. When no scopes are specified, walks the entire configuration.
 
         :param configuration: The configuration to match against the patterns.
+        :param flat: The flattened configuration, e.g. cached by the caller; the configuration is flattened here
+            if not provided.
         :return: List of PatternMatch with matching JSONPath scopes; empty list if no matches.
         """
         if configuration is None:
             return []
+        if flat is None:
+            flat = FlatConfiguration.from_configuration(configuration)
 
         if self.search_scopes:
             all_matches: list[PatternMatch] = []
@@ -330,7 +418,7 @@ class SearchSpec(BaseModel):
                 # If no scalar matches, search in descendants nodes
                 desc_matches: list[PatternMatch] = []
                 if not self_matches:
-                    desc_matches = self._find_matches_for_expr(configuration, desc_expr)
+                    desc_matches = self._find_descendant_matches(configuration, flat, self_expr, desc_expr)
                 for match in self_matches or desc_matches:
                     if match.scope in seen:
                         continue
@@ -339,8 +427,12 @@ class SearchSpec(BaseModel):
                     if not self.return_all_matched_patterns:
                         return all_matches
             return all_matches
-        else:
+        elif flat is not None:
             # No scope provided – search all descendants and return exact match paths.
+            if self._prune_unmatched and not self._combined_pattern.search(flat.text):
+                return []
+            return self._find_matches_in_nodes(flat, filter(None, [flat.descendant_range(())]))
+        else:
             return self._find_matches_for_expr(configuration, self._all_nodes_expr)
 
     def match_texts(self, texts: Iterable[str]) -> list[PatternMatch]:
@@ -359,6 +451,65 @@ class SearchSpec(BaseModel):
         return matches
 
 
+def _get_pattern_literals(patterns: Sequence[str], pattern_mode: SearchPatternMode) -> list[str] | None:
+    """
+    Gets the literals one of which is found in every text matched by the patterns. Supports the literal patterns
+    and the regular expressions that are plain literals or alternations of plain literals (e.g. "sales|revenue").
+
+    :return: The literals, or None if some pattern is a more complex regular expression.
+    """
+    if pattern_mode == 'literal':
+        return list(patterns)
+
+    literals: list[str] = []
+    for pattern in patterns:
+        for alternative in pattern.split('|'):
+            if not alternative or not _REGEX_METACHARACTERS.isdisjoint(alternative):
+                return None
+            literals.append(alternative)
+    return literals
+
+
+def _combine_patterns(compiled_patterns: Sequence[re.Pattern], flags: int) -> re.Pattern | None:
+    """
+    Combines the patterns into a single regular expression, which matches wherever any of the patterns matches.
+
+    :return: The combined expression, or None if the patterns cannot be combined, e.g. if they have groups,
+        which the backreferences refer to by their numbers.
+    """
+    if len(compiled_patterns) == 1:
+        return compiled_patterns[0]
+    if any(compiled.groups for compiled in compiled_patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{compiled.pattern})' for compiled in compiled_patterns), flags)
+    except re.error:
+        # e.g. the global inline flags, which are allowed only at the start of the expression
+        return None
+
+
+def get_datum_path(datum: DatumInContext) -> JsonNodePath | None:
+    """Gets the keys and list indices leading to the JSONPath match, None if it is not a plain JSON node."""
+    path: list[str | int] = []
+    while datum.context is not None:
+        if isinstance(datum.path, Fields) and len(datum.path.fields) == 1:
+            path.append(datum.path.fields[0])
+        elif isinstance(datum.path, Index) and len(datum.path.indices) == 1 and datum.path.indices[0] >= 0:
+            path.append(datum.path.indices[0])
+        else:
+            return None
+        datum = datum.context
+    return tuple(reversed(path)) if isinstance(datum.path, Root) else None
+
+
+def get_jsonpath_str(path: JsonNodePath) -> str:
+    """Gets the JSONPath of a JSON node in the format of the JSONPath matches of the node."""
+    jsonpath: JSONPath = Root()
+    for step in path:
+        jsonpath = jsonpath.child(Index(step) if isinstance(step, int) else Fields(step))
+    return _clean_jsonpath_path_str(str(jsonpath))
+
+
 def _clean_jsonpath_path_str(path_str: str) -> str:
     """Normalize a jsonpath_ng full_path string across library versions.
 
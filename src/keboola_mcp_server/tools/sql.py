@@ -4,7 +4,7 @@ import csv
 import logging
 from collections.abc import Awaitable
 from io import StringIO
-from typing import Annotated
+from typing import Annotated, TypeVar
 
 from fastmcp import Context, FastMCP
 from fastmcp.tools import FunctionTool
@@ -20,15 +20,16 @@ from starlette.requests import Request
 
 from keboola_mcp_server.errors import tool_errors
 from keboola_mcp_server.mcp import get_http_request_or_none
-from keboola_mcp_server.workspace import JobSubmittedInfo, QueryResult, SqlSelectData, WorkspaceManager
+from keboola_mcp_server.workspace import JobSubmittedInfo, QueryResultStream, WorkspaceManager
 
 LOG = logging.getLogger(__name__)
+T = TypeVar('T')
 
 SQL_TOOLS_TAG = 'sql'
 MAX_ROWS = 10_000
 MAX_CHARS = 50_000
 # How often to check whether the HTTP client has disconnected during a long query.
-# Mirrors the 1 s job-poll cadence in `_Workspace.execute_query`.
+# Comparable to the job-status poll cadence of `_Workspace.execute_query`, see `QueryPollingStrategy`.
 _DISCONNECT_POLL_INTERVAL = 1.0
 
 
@@ -75,9 +76,7 @@ async def _drain(*tasks: asyncio.Task) -> None:
     await asyncio.shield(asyncio.gather(*(_cancel_and_drain(t) for t in tasks)))
 
 
-async def _execute_watching_disconnect(
-    query_coro: Awaitable[QueryResult], request: Request, query_name: str
-) -> QueryResult:
+async def _execute_watching_disconnect(query_coro: Awaitable[T], request: Request, query_name: str) -> T:
     """Run `query_coro`, cancelling it — and thus the backend job, via `execute_query`'s
     `CancelledError` handler — if the HTTP client disconnects first.
 
@@ -212,6 +211,21 @@ async def _emit_job_submitted_progress(ctx: Context, progress_token: ProgressTok
     )
 
 
+async def _write_csv(result: QueryResultStream) -> str:
+    """Encodes the query result to CSV page by page, as the pages are fetched."""
+    output = StringIO()
+    writer = csv.writer(output)
+    if result.columns:
+        writer.writerow(result.columns)
+        async for page in result.pages():
+            writer.writerows(page)
+    else:
+        # non-SELECT query, this should not really happen, because this tool is for running SELECT queries
+        writer.writerow(['message'])
+        writer.writerow([result.message])
+    return output.getvalue()
+
+
 class QueryDataOutput(BaseModel):
     """Output model for SQL query results."""
 
@@ -246,6 +260,16 @@ async def query_data(
         ),
     ],
     ctx: Context,
+    use_cache: Annotated[
+        bool,
+        Field(
+            description=(
+                'Return the result of the same query run within the last few minutes, if none of the tables it '
+                'reads has been imported to since. Use it when repeating an exploratory query; keep it false when '
+                'the data must be fresh.'
+            )
+        ),
+    ] = False,
 ) -> QueryDataOutput:
     """
     Executes an SQL SELECT query to get the data from the underlying database.
@@ -314,35 +338,28 @@ async def query_data(
     async def _on_job_submitted(info: JobSubmittedInfo) -> None:
         await _emit_job_submitted_progress(ctx, progress_token, info)
 
-    query_coro = workspace_manager.execute_query(
-        sql_query,
-        max_rows=MAX_ROWS,
-        max_chars=MAX_CHARS,
-        on_job_submitted=_on_job_submitted if progress_token is not None else None,
-    )
+    async def _execute() -> tuple[QueryResultStream, str | None]:
+        stream = await workspace_manager.execute_query_stream(
+            sql_query,
+            max_rows=MAX_ROWS,
+            max_chars=MAX_CHARS,
+            on_job_submitted=_on_job_submitted if progress_token is not None else None,
+            use_cache=use_cache,
+        )
+        return stream, (await _write_csv(stream) if stream.is_ok else None)
+
     # The disconnect race only buys us anything on the HTTP path, where the client can actually
     # drop the socket (Kai kills the sandbox SDK process on STOP). With no HTTP request bound
     # (stdio / background workers) nothing can disconnect, so run the query directly.
+    # The result pages are fetched while the CSV is being written, so the race covers them too.
     request = get_http_request_or_none()
     if request is None:
-        result = await query_coro
+        result, csv_data = await _execute()
     else:
-        result = await _execute_watching_disconnect(query_coro, request, query_name)
+        result, csv_data = await _execute_watching_disconnect(_execute(), request, query_name)
     if result.is_ok:
         LOG.info(' '.join(filter(None, [f'Query "{query_name}" executed successfully.', result.message])))
-        if result.data:
-            data = result.data
-        else:
-            # non-SELECT query, this should not really happen, because this tool is for running SELECT queries
-            data = SqlSelectData(columns=['message'], rows=[{'message': result.message}])
-
-        # Convert to CSV
-        output = StringIO()
-        writer = csv.DictWriter(output, fieldnames=data.columns)
-        writer.writeheader()
-        writer.writerows(data.rows)
-
-        return QueryDataOutput(query_name=query_name, csv_data=output.getvalue(), message=result.message)
+        return QueryDataOutput(query_name=query_name, csv_data=csv_data, message=result.message)
 
     else:
         # Surface cancellation cleanly: the workspace already produced a precise message
@@ -14,7 +14,7 @@ from pydantic import AliasChoices, BaseModel, Field, model_validator
 from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.errors import tool_errors
 from keboola_mcp_server.mcp import KeboolaMcpServer, toon_serializer_compact
-from keboola_mcp_server.tools.storage.tools import STORAGE_TOOLS_TAG, BucketDetail
+from keboola_mcp_server.tools.storage.tools import STORAGE_TOOLS_TAG, BucketDetail, invalidate_storage_caches
 
 LOG = logging.getLogger(__name__)
 
@@ -206,6 +206,7 @@ async def link_shared_bucket(
         source_bucket_id=source_bucket_id,
         display_name=display_name,
     )
+    await invalidate_storage_caches(client)
     # The link POST's response shape isn't reliably documented (the reference PHP client only
     # ever reads `id` off it), so fetch the bucket explicitly rather than trust it matches
     # BucketDetail -- the link has already committed server-side and is non-idempotent, so a
@@ -1,5 +1,6 @@
 """Storage-related tools for the MCP server (buckets, tables, etc.)."""
 
+import asyncio
 import logging
 from collections import defaultdict
 from collections.abc import Iterable, Sequence
@@ -12,11 +13,12 @@ from mcp.types import ToolAnnotations
 from pydantic import AliasChoices, BaseModel, Field, SerializeAsAny, field_serializer, model_validator
 
 from keboola_mcp_server.clients.base import JsonDict
-from keboola_mcp_server.clients.client import KeboolaClient, get_metadata_property
+from keboola_mcp_server.clients.client import KeboolaClient, MetadataIndex, get_metadata_property
 from keboola_mcp_server.config import MetadataField
 from keboola_mcp_server.errors import tool_errors
 from keboola_mcp_server.links import Link, ProjectLinksManager
 from keboola_mcp_server.mcp import (
+    DEFAULT_CONCURRENCY,
     KeboolaMcpServer,
     process_concurrently,
     toon_serializer,
@@ -24,20 +26,25 @@ from keboola_mcp_server.mcp import (
     unwrap_results,
 )
 from keboola_mcp_server.tools.components.utils import get_nested
+from keboola_mcp_server.tools.search_global import GlobalSearchCache
+from keboola_mcp_server.tools.search_inventory import ProjectInventory
 from keboola_mcp_server.tools.storage.usage import (
     ComponentUsageReference,
-    find_id_usage,
+    find_table_usage,
     get_created_by,
     get_last_updated_by,
 )
 from keboola_mcp_server.tools.storage_helpers import (
+    BucketListing,
+    StorageDetailCache,
     has_storage_branches,
     merged_bucket_detail,
     merged_bucket_list,
     merged_table_detail,
+    merged_table_details,
 )
 from keboola_mcp_server.utils import parse_iso_timestamp
-from keboola_mcp_server.workspace import WorkspaceManager
+from keboola_mcp_server.workspace import WorkspaceManager, get_backend_path
 
 LOG = logging.getLogger(__name__)
 
@@ -47,6 +54,12 @@ BUCKET_ID_PARTS = 2
 TABLE_ID_PARTS = 3
 COLUMN_ID_PARTS = 4
 
+# The number of buckets from which their tables are listed after looking them up in a listing of all the buckets
+BUCKET_LISTING_MIN_IDS = 10
+# The number of tables of a bucket whose details are looked up in the listing of the bucket's tables
+TABLE_LISTING_MIN_IDS = 5
+TABLE_LISTING_INCLUDES = ['columns', 'columnMetadata', 'metadata']
+
 
 def add_storage_tools(mcp: KeboolaMcpServer) -> None:
     """Adds tools to the MCP server."""
@@ -212,23 +225,19 @@ class BucketDetail(BaseModel):
 
     @model_validator(mode='before')
     @classmethod
-    def set_description(cls, values: dict[str, Any]) -> dict[str, Any]:
+    def set_metadata_fields(cls, values: dict[str, Any]) -> dict[str, Any]:
+        metadata = MetadataIndex(values.get('metadata', []))
         # KBC metadata holds the curated, user-editable description (update_descriptions writes here).
         # The legacy top-level `description` field is auto-generated (e.g. "Bucket created by
         # Transformation API") and stale for linked/shared buckets, so metadata must take precedence.
-        metadata = values.get('metadata', [])
         description = (
-            get_metadata_property(metadata, MetadataField.SHARED_DESCRIPTION)
-            or get_metadata_property(metadata, MetadataField.DESCRIPTION)
+            metadata.get(MetadataField.SHARED_DESCRIPTION)
+            or metadata.get(MetadataField.DESCRIPTION)
             or values.get('description')
         )
         values['description'] = description or None
-        return values
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_branch_id(cls, values: dict[str, Any]) -> dict[str, Any]:
-        branch_id = get_metadata_property(values.get('metadata', []), MetadataField.FAKE_DEVELOPMENT_BRANCH)
+        branch_id = metadata.get(MetadataField.FAKE_DEVELOPMENT_BRANCH)
         if branch_id:
             values['branch_id'] = branch_id
             values['prod_id'] = values['id'].replace(f'c-{branch_id}-', 'c-')
@@ -348,21 +357,18 @@ class TableSummary(BaseModel):
 
     @model_validator(mode='before')
     @classmethod
-    def set_description(cls, values: dict[str, Any]) -> dict[str, Any]:
+    def set_metadata_fields(cls, values: dict[str, Any]) -> dict[str, Any]:
+        metadata = MetadataIndex(values.get('metadata', []))
         # KBC.description metadata holds the curated, user-editable description and must win over the
         # legacy top-level `description` field, which is auto-generated and stale for linked tables.
         description = (
-            get_metadata_property(values.get('metadata', []), MetadataField.DESCRIPTION)
+            metadata.get(MetadataField.DESCRIPTION)
             or get_metadata_property(get_nested(values, 'sourceTable.metadata', default=[]), MetadataField.DESCRIPTION)
             or values.get('description')
         )
         values['description'] = description or None
-        return values
 
-    @model_validator(mode='before')
-    @classmethod
-    def set_branch_id(cls, values: dict[str, Any]) -> dict[str, Any]:
-        branch_id = get_metadata_property(values.get('metadata', []), MetadataField.FAKE_DEVELOPMENT_BRANCH)
+        branch_id = metadata.get(MetadataField.FAKE_DEVELOPMENT_BRANCH)
         if branch_id:
             values['branch_id'] = branch_id
             values['prod_id'] = values['id'].replace(f'c-{branch_id}-', 'c-')
@@ -490,8 +496,23 @@ class DescriptionUpdateGroups(BaseModel):
     column_updates_by_table: dict[str, dict[str, str]] = Field(description='Column updates by table ID.')
 
 
-async def _find_buckets(client: KeboolaClient, bucket_id: str) -> tuple[BucketDetail | None, BucketDetail | None]:
-    prod_raw, dev_raw = await merged_bucket_detail(client, bucket_id)
+async def _find_buckets(
+    client: KeboolaClient,
+    bucket_id: str,
+    listing: BucketListing | None = None,
+    storage: StorageDetailCache | None = None,
+) -> tuple[BucketDetail | None, BucketDetail | None]:
+    """
+    Finds the production and dev branch versions of the bucket.
+
+    :param listing: The already fetched listing of the buckets to look the bucket up in, instead of requesting
+        the bucket details.
+    :param storage: The cache of the bucket details to reuse.
+    """
+    if listing:
+        prod_raw, dev_raw = listing.merged_bucket_detail(bucket_id)
+    else:
+        prod_raw, dev_raw = await merged_bucket_detail(client, bucket_id, storage)
 
     prod_bucket: BucketDetail | None = None
     dev_bucket: BucketDetail | None = None
@@ -515,7 +536,11 @@ async def _find_buckets(client: KeboolaClient, bucket_id: str) -> tuple[BucketDe
         from keboola_mcp_server.tools.storage_helpers import _safe_bucket_detail
 
         prod_id = bucket_id.replace(f'c-{client.branch_id}-', 'c-')
-        if raw := await _safe_bucket_detail(client, prod_id, branch_id='default'):
+        if listing:
+            raw = listing.get_default_bucket(prod_id)
+        else:
+            raw = await _safe_bucket_detail(client, prod_id, storage, branch_id='default')
+        if raw:
             bucket = BucketDetail.model_validate(raw).with_lineage_metadata(raw)
             if not bucket.branch_id:
                 prod_bucket = bucket
@@ -574,9 +599,11 @@ async def get_buckets(
 
     if bucket_ids:
         has_sb = await has_storage_branches(client)
+        # The cache lists all the buckets, which pays off only for many of them.
+        storage = await StorageDetailCache.from_client(client) if len(bucket_ids) >= BUCKET_LISTING_MIN_IDS else None
 
         async def _fetch_bucket_detail(bucket_id: str) -> BucketDetail | str:
-            prod_bucket, dev_bucket = await _find_buckets(client, bucket_id)
+            prod_bucket, dev_bucket = await _find_buckets(client, bucket_id, storage=storage)
             if prod_bucket or dev_bucket:
                 return await _combine_buckets(client, links_manager, prod_bucket, dev_bucket, storage_branches=has_sb)
             else:
@@ -673,8 +700,8 @@ async def get_tables(
     - With `bucket_ids`: Summaries of tables (ID, name, description, primary key).
     - With `table_ids`: Full details including columns, data types, and fully qualified database names.
     - With `table_ids` and `include_usage`: Full details plus components / transformations that use the tables
-      in their input / output mappings. Use only when explicitly needed or evident from context; usage calculation
-      might be demanding in big projects.
+      in their input / output mappings, i.e. whose mapping values equal the table ID. Use only
+      when explicitly needed or evident from context; usage calculation might be demanding in big projects.
 
     COLUMN DATA TYPES:
     - database_native_type: The actual type in the storage backend (Snowflake, BigQuery, etc.)
@@ -704,22 +731,44 @@ async def get_tables(
 
     tables_by_id: dict[str, TableDetail | TableSummary] = {}
     missing_ids: list[str] = []
+    # The cache lists all the buckets, which pays off only for many buckets or tables.
+    storage = None
+    if len(bucket_ids) >= BUCKET_LISTING_MIN_IDS or len(table_ids) >= BUCKET_LISTING_MIN_IDS:
+        storage = await StorageDetailCache.from_client(client)
 
     if bucket_ids:
-        for table in await _list_tables(bucket_ids, client, links_manager):
+        for table in await _list_tables(bucket_ids, client, links_manager, storage):
             tables_by_id[table.id] = table
 
     if table_ids:
+        # Touch the WorkspaceManager to initialize the workspace before launching the concurrent tasks
+        # to prevent race condition and initializing multiple database backend workspaces.
+        _ = await workspace_manager.get_workspace_id()
+
+        # Many tables of a bucket are cheaper to look up in the bucket's table listing than to fetch one by one.
+        table_ids_by_bucket: dict[str, set[str]] = defaultdict(set)
+        for table_id in table_ids:
+            if table_id.count('.') == TABLE_ID_PARTS - 1:
+                table_ids_by_bucket[table_id.rpartition('.')[0]].add(table_id)
+        listed_table_ids = [sorted(ids) for ids in table_ids_by_bucket.values() if len(ids) >= TABLE_LISTING_MIN_IDS]
+        listed_tables_by_id: dict[str, tuple[JsonDict | None, JsonDict | None]] = {}
+        if listed_table_ids:
+            listings = await process_concurrently(
+                listed_table_ids,
+                lambda _table_ids: merged_table_details(
+                    client, _table_ids, include=TABLE_LISTING_INCLUDES, storage=storage
+                ),
+            )
+            for listed_tables in unwrap_results(listings, 'Failed to list the tables of one or more buckets'):
+                listed_tables_by_id.update(listed_tables)
 
         async def _fetch_table_detail(_table_id: str) -> TableDetail | str:
-            if _table := await _get_table(_table_id, client, workspace_manager, links_manager):
+            listed_tables = listed_tables_by_id.get(_table_id)
+            if _table := await _get_table(_table_id, client, workspace_manager, links_manager, listed_tables, storage):
                 return _table
             else:
                 return _table_id
 
-        # Touch the WorkspaceManager to initialize the workspace before launching the concurrent tasks
-        # to prevent race condition and initializing multiple database backend workspaces.
-        _ = await workspace_manager.get_workspace_id()
         results = await process_concurrently(table_ids, _fetch_table_detail)
 
         for table_detail_or_id in unwrap_results(results, 'Failed to fetch one or more tables'):
@@ -731,11 +780,8 @@ async def get_tables(
         # Add the component usage to the table detail
         if include_usage:
             prod_ids_to_ids = {table.prod_id: table.id for table in tables_by_id.values()}
-            usage_by_ids = await find_id_usage(
-                client,
-                list(prod_ids_to_ids.keys()),
-                ['configuration', 'configuration-row', 'transformation'],
-                ['storage.input', 'storage.output'],
+            usage_by_ids = await find_table_usage(
+                client, list(prod_ids_to_ids.keys()), ['configuration', 'configuration-row', 'transformation']
             )
             # Initialize the used_by list for all tables to avoid None values which could confuse the model.
             # Usage only applies to full table details; summaries (from bucket listing) carry no used_by.
@@ -756,14 +802,9 @@ async def get_tables(
     ).pack_links()
 
 
-async def _get_table(
-    table_id: str,
-    client: KeboolaClient,
-    workspace_manager: WorkspaceManager,
-    links_manager: ProjectLinksManager,
-) -> TableDetail | None:
-    prod_table, dev_table = await merged_table_detail(client, table_id)
-
+def _select_raw_table(
+    client: KeboolaClient, prod_table: JsonDict | None, dev_table: JsonDict | None
+) -> JsonDict | None:
     # Validate metadata: prod should not have branch metadata, dev should match our branch
     if prod_table:
         branch_id = get_metadata_property(prod_table.get('metadata', []), MetadataField.FAKE_DEVELOPMENT_BRANCH)
@@ -775,7 +816,35 @@ async def _get_table(
         if branch_id != client.branch_id:
             dev_table = None
 
-    raw_table = dev_table or prod_table
+    return dev_table or prod_table
+
+
+def _has_table_detail_data(raw_table: JsonDict) -> bool:
+    """
+    Checks if the listed table carries all the data of the table detail that the `TableDetail` is built from.
+    The aliases need the column metadata of their source tables, which the listings lack.
+    """
+    return 'columns' in raw_table and get_backend_path(raw_table) is not None and not raw_table.get('sourceTable')
+
+
+async def _get_table(
+    table_id: str,
+    client: KeboolaClient,
+    workspace_manager: WorkspaceManager,
+    links_manager: ProjectLinksManager,
+    listed_tables: tuple[JsonDict | None, JsonDict | None] | None = None,
+    storage: StorageDetailCache | None = None,
+) -> TableDetail | None:
+    """
+    Gets the full detail of the table.
+
+    :param listed_tables: The production and dev versions of the table looked up in the table listings
+        (see `merged_table_details`). They are used instead of the table detail unless they lack its data.
+    :param storage: The cache of the table details to reuse.
+    """
+    raw_table = _select_raw_table(client, *listed_tables) if listed_tables else None
+    if listed_tables is None or (raw_table and not _has_table_detail_data(raw_table)):
+        raw_table = _select_raw_table(client, *await merged_table_detail(client, table_id, storage))
     if not raw_table:
         return None
 
@@ -790,28 +859,24 @@ async def _get_table(
 
     column_info = []
     for col_name in raw_columns:
-        col_meta = raw_column_metadata.get(col_name, [])
-        source_col_meta = raw_source_column_metadata.get(col_name, [])
+        col_meta = MetadataIndex(raw_column_metadata.get(col_name, []))
+        source_col_meta = MetadataIndex(raw_source_column_metadata.get(col_name, []))
 
-        description: str | None = get_metadata_property(col_meta, MetadataField.DESCRIPTION)
+        description: str | None = col_meta.get(MetadataField.DESCRIPTION)
         if not description:
-            description = get_metadata_property(source_col_meta, MetadataField.DESCRIPTION)
+            description = source_col_meta.get(MetadataField.DESCRIPTION)
 
-        base_type: str | None = get_metadata_property(
-            col_meta, MetadataField.DATATYPE_BASETYPE, preferred_providers=['user']
-        )
+        base_type: str | None = col_meta.get(MetadataField.DATATYPE_BASETYPE, preferred_providers=['user'])
         if not base_type:
-            base_type = get_metadata_property(
-                source_col_meta, MetadataField.DATATYPE_BASETYPE, preferred_providers=['user']
-            )
+            base_type = source_col_meta.get(MetadataField.DATATYPE_BASETYPE, preferred_providers=['user'])
 
-        native_type: str | None = get_metadata_property(col_meta, MetadataField.DATATYPE_TYPE)
+        native_type: str | None = col_meta.get(MetadataField.DATATYPE_TYPE)
         if not native_type:
-            native_type = get_metadata_property(source_col_meta, MetadataField.DATATYPE_TYPE)
+            native_type = source_col_meta.get(MetadataField.DATATYPE_TYPE)
 
-        nullable_str: str | None = get_metadata_property(col_meta, MetadataField.DATATYPE_NULLABLE)
+        nullable_str: str | None = col_meta.get(MetadataField.DATATYPE_NULLABLE)
         if not nullable_str:
-            nullable_str = get_metadata_property(source_col_meta, MetadataField.DATATYPE_NULLABLE)
+            nullable_str = source_col_meta.get(MetadataField.DATATYPE_NULLABLE)
 
         if native_type is None:
             native_type = 'STRING' if sql_dialect == 'BigQuery' else 'VARCHAR'
@@ -854,6 +919,7 @@ async def _list_tables(
     bucket_ids: Sequence[str],
     client: KeboolaClient,
     links_manager: ProjectLinksManager,
+    storage: StorageDetailCache | None = None,
 ) -> Iterable[TableSummary]:
     """Retrieves all tables in a specific bucket with their basic (summary) information.
 
@@ -862,38 +928,72 @@ async def _list_tables(
     emitting them as null. Fetch a specific table by ID (``_get_table``) for the full detail.
     """
     has_sb = await has_storage_branches(client)
-    tables_by_prod_id: dict[str, TableSummary] = {}
     sapi_includes = ['metadata', 'columnMetadata', 'sourceMetadata', 'sourceColumnMetadata']
-
-    for bucket_id in bucket_ids:
-        prod_bucket, dev_bucket = await _find_buckets(client, bucket_id)
-
-        if prod_bucket:
-            raw_table_data = await client.storage_client.bucket_table_list(
+    # Looking many buckets up in a listing of all the buckets takes fewer requests than fetching their details.
+    listing = None
+    if len(bucket_ids) >= BUCKET_LISTING_MIN_IDS:
+        listing = storage.listing if storage else await BucketListing.fetch(client)
+    # All the requests of all the buckets share the concurrency limit.
+    semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+    async def _list_prod_tables(prod_bucket: BucketDetail | None) -> list[TableSummary]:
+        if not prod_bucket:
+            return []
+        async with semaphore:
+            raw_table_data = await (storage or client.storage_client).bucket_table_list(
                 prod_bucket.id, include=sapi_includes, branch_id='default'
             )
-            for raw in raw_table_data:
-                table_name = cast(str, raw.get('name', ''))
-                table = TableSummary.model_validate(
-                    raw | {'links': [links_manager.get_table_detail_link(prod_bucket.id, table_name)]}
-                )
-                assert table.id == table.prod_id, f'Table ID mismatch: {table.id} != {table.prod_id}'
-                tables_by_prod_id[table.id] = table
-
-        if dev_bucket:
-            dev_branch_id = client.branch_id if has_sb else 'default'
-            raw_table_data = await client.storage_client.bucket_table_list(
+        tables = []
+        for raw in raw_table_data:
+            table_name = cast(str, raw.get('name', ''))
+            table = TableSummary.model_validate(
+                raw | {'links': [links_manager.get_table_detail_link(prod_bucket.id, table_name)]}
+            )
+            assert table.id == table.prod_id, f'Table ID mismatch: {table.id} != {table.prod_id}'
+            tables.append(table)
+        return tables
+
+    async def _list_dev_tables(dev_bucket: BucketDetail | None) -> list[TableSummary]:
+        if not dev_bucket:
+            return []
+        dev_branch_id = client.branch_id if has_sb else 'default'
+        async with semaphore:
+            raw_table_data = await (storage or client.storage_client).bucket_table_list(
                 dev_bucket.id, include=sapi_includes, branch_id=dev_branch_id
             )
-            for raw in raw_table_data:
-                table = TableSummary.model_validate(raw)
-                tables_by_prod_id[table.prod_id] = table.model_copy(
+        tables = []
+        for raw in raw_table_data:
+            table = TableSummary.model_validate(raw)
+            tables.append(
+                table.model_copy(
                     update={
                         'id': table.prod_id,
                         'branch_id': None,
                         'links': [links_manager.get_table_detail_link(dev_bucket.id, table.name)],
                     }
                 )
+            )
+        return tables
+
+    async def _list_bucket_tables(bucket_id: str) -> tuple[list[TableSummary], list[TableSummary]]:
+        if listing:
+            prod_bucket, dev_bucket = await _find_buckets(client, bucket_id, listing)
+        else:
+            async with semaphore:
+                prod_bucket, dev_bucket = await _find_buckets(client, bucket_id, storage=storage)
+        prod_tables, dev_tables = await asyncio.gather(_list_prod_tables(prod_bucket), _list_dev_tables(dev_bucket))
+        return prod_tables, dev_tables
+
+    # The semaphore limits the requests, the buckets' tasks themselves are not limited.
+    results = await process_concurrently(bucket_ids, _list_bucket_tables, max_concurrency=max(len(bucket_ids), 1))
+
+    # The dev tables shade the prod tables, the later buckets the earlier ones, as when listed one by one.
+    tables_by_prod_id: dict[str, TableSummary] = {}
+    for prod_tables, dev_tables in unwrap_results(results, 'Failed to list the tables of one or more buckets'):
+        for table in prod_tables:
+            tables_by_prod_id[table.id] = table
+        for table in dev_tables:
+            tables_by_prod_id[table.id] = table
 
     return tables_by_prod_id.values()
 
@@ -946,6 +1046,18 @@ def _group_updates_by_type(updates: list[DescriptionUpdate]) -> DescriptionUpdat
     )
 
 
+async def invalidate_storage_caches(client: KeboolaClient) -> None:
+    """
+    Forgets the buckets, tables and search results of the client's project kept between the tool calls.
+    The tools changing the buckets, the tables or their metadata call it after the change.
+    """
+    await asyncio.gather(
+        ProjectInventory.invalidate(client),
+        StorageDetailCache.invalidate(client),
+        GlobalSearchCache.invalidate(client),
+    )
+
+
 async def _update_bucket_description(client: KeboolaClient, bucket_id: str, description: str) -> UpdateItemResult:
     """Update a bucket description."""
     try:
@@ -959,61 +1071,57 @@ async def _update_bucket_description(client: KeboolaClient, bucket_id: str, desc
         return UpdateItemResult(item_id=bucket_id, success=False, error=str(e))
 
 
-async def _update_table_description(client: KeboolaClient, table_id: str, description: str) -> UpdateItemResult:
-    """Update a table description."""
-    try:
-        response = await client.storage_client.table_metadata_update(
-            table_id=table_id,
-            metadata={MetadataField.DESCRIPTION: description},
-            columns_metadata={},
-        )
-        raw_metadata = cast(list[JsonDict], response.get('metadata', []))
-        description_entry = next(entry for entry in raw_metadata if entry.get('key') == MetadataField.DESCRIPTION)
-        return UpdateItemResult(item_id=table_id, success=True, timestamp=description_entry['timestamp'])
-    except Exception as e:
-        return UpdateItemResult(item_id=table_id, success=False, error=str(e))
-
-
-async def _update_column_descriptions(
-    client: KeboolaClient, table_id: str, column_updates: dict[str, str]
+async def _update_table_descriptions(
+    client: KeboolaClient, table_id: str, description: str | None, column_updates: dict[str, str]
 ) -> list[UpdateItemResult]:
-    """Update multiple column descriptions for a single table."""
+    """Update the description of a table and its columns in a single request."""
+    item_ids = ([table_id] if description is not None else []) + [
+        f'{table_id}.{column_name}' for column_name in column_updates
+    ]
     try:
         columns_metadata = {
-            column_name: [{'key': MetadataField.DESCRIPTION, 'value': description, 'columnName': column_name}]
-            for column_name, description in column_updates.items()
+            column_name: [{'key': MetadataField.DESCRIPTION, 'value': column_description, 'columnName': column_name}]
+            for column_name, column_description in column_updates.items()
         }
+        if description is not None:
+            response = await client.storage_client.table_metadata_update(
+                table_id=table_id,
+                metadata={MetadataField.DESCRIPTION: description},
+                columns_metadata=columns_metadata,
+            )
+        else:
+            response = await client.storage_client.table_metadata_update(
+                table_id=table_id,
+                columns_metadata=columns_metadata,
+            )
+    except Exception as e:
+        # If the entire table update fails, mark the table and all its columns as failed
+        return [UpdateItemResult(item_id=item_id, success=False, error=str(e)) for item_id in item_ids]
 
-        response = await client.storage_client.table_metadata_update(
-            table_id=table_id,
-            columns_metadata=columns_metadata,
-        )
-
-        column_metadata = cast(dict[str, list[JsonDict]], response.get('columnsMetadata', {}))
-        results = []
-
-        for column_name in column_updates:
-            try:
-                description_entry = next(
-                    entry
-                    for entry in column_metadata.get(column_name, [])
-                    if entry.get('key') == MetadataField.DESCRIPTION
-                )
-                results.append(
-                    UpdateItemResult(
-                        item_id=f'{table_id}.{column_name}', success=True, timestamp=description_entry['timestamp']
-                    )
+    results = []
+    if description is not None:
+        try:
+            raw_metadata = cast(list[JsonDict], response.get('metadata', []))
+            description_entry = next(entry for entry in raw_metadata if entry.get('key') == MetadataField.DESCRIPTION)
+            results.append(UpdateItemResult(item_id=table_id, success=True, timestamp=description_entry['timestamp']))
+        except Exception as e:
+            results.append(UpdateItemResult(item_id=table_id, success=False, error=str(e)))
+
+    column_metadata = cast(dict[str, list[JsonDict]], response.get('columnsMetadata', {}))
+    for column_name in column_updates:
+        try:
+            description_entry = next(
+                entry for entry in column_metadata.get(column_name, []) if entry.get('key') == MetadataField.DESCRIPTION
+            )
+            results.append(
+                UpdateItemResult(
+                    item_id=f'{table_id}.{column_name}', success=True, timestamp=description_entry['timestamp']
                 )
-            except Exception as e:
-                results.append(UpdateItemResult(item_id=f'{table_id}.{column_name}', success=False, error=str(e)))
+            )
+        except Exception as e:
+            results.append(UpdateItemResult(item_id=f'{table_id}.{column_name}', success=False, error=str(e)))
 
-        return results
-    except Exception as e:
-        # If the entire table update fails, mark all columns as failed
-        return [
-            UpdateItemResult(item_id=f'{table_id}.{column_name}', success=False, error=str(e))
-            for column_name in column_updates
-        ]
+    return results
 
 
 @tool_errors()
@@ -1044,34 +1152,50 @@ async def update_descriptions(
       updates=[DescriptionUpdate(item_id="in.c-my-bucket.my-table.my_column", description="New column description")]
     """
     client = KeboolaClient.from_state(ctx.session.state)
-    results: list[UpdateItemResult] = []
+    invalid_results: dict[int, UpdateItemResult] = {}
     valid_updates: list[DescriptionUpdate] = []
 
     # Handle invalid item_ids first and filter valid ones
-    for update in updates:
+    for position, update in enumerate(updates):
         try:
             _parse_item_id(update.item_id)
             valid_updates.append(update)
         except ValueError as e:
-            results.append(
-                UpdateItemResult(item_id=update.item_id, success=False, error=f'Invalid item_id format: {e}')
+            invalid_results[position] = UpdateItemResult(
+                item_id=update.item_id, success=False, error=f'Invalid item_id format: {e}'
             )
 
-    # Process valid updates
+    # Process valid updates concurrently, one request per bucket and one per table including its columns
     grouped_updates = _group_updates_by_type(valid_updates)
-    for bucket_id, description in grouped_updates.bucket_updates.items():
-        result = await _update_bucket_description(client, bucket_id, description)
-        results.append(result)
+    table_ids = list(dict.fromkeys([*grouped_updates.table_updates, *grouped_updates.column_updates_by_table]))
+
+    async def _update(item_id: str) -> list[UpdateItemResult]:
+        if item_id in grouped_updates.bucket_updates:
+            return [await _update_bucket_description(client, item_id, grouped_updates.bucket_updates[item_id])]
+        return await _update_table_descriptions(
+            client,
+            item_id,
+            grouped_updates.table_updates.get(item_id),
+            grouped_updates.column_updates_by_table.get(item_id, {}),
+        )
 
-    for table_id, description in grouped_updates.table_updates.items():
-        result = await _update_table_description(client, table_id, description)
-        results.append(result)
+    update_results = await process_concurrently([*grouped_updates.bucket_updates, *table_ids], _update)
+    results_by_id = {
+        result.item_id: result
+        for item_results in unwrap_results(update_results, 'Failed to update the descriptions')
+        for result in item_results
+    }
 
-    for table_id, column_updates in grouped_updates.column_updates_by_table.items():
-        table_results = await _update_column_descriptions(client, table_id, column_updates)
-        results.extend(table_results)
+    # Report the results in the order of the updates, once per item
+    results: list[UpdateItemResult] = []
+    for position, update in enumerate(updates):
+        if (result := invalid_results.get(position) or results_by_id.pop(update.item_id, None)) is not None:
+            results.append(result)
 
     successful = sum(1 for r in results if r.success)
     failed = len(results) - successful
+    if successful:
+        # The descriptions are metadata, their changes do not show in the buckets' lastChangeDate.
+        await invalidate_storage_caches(client)
 
     return UpdateDescriptionsOutput(results=results, total_processed=len(results), successful=successful, failed=failed)
@@ -1,21 +1,16 @@
-from collections import defaultdict
 from collections.abc import Mapping, Sequence
-from typing import cast
 
 from pydantic import BaseModel, Field
 
 from keboola_mcp_server.clients.base import JsonStruct
 from keboola_mcp_server.clients.client import (
     KeboolaClient,
-    get_metadata_property,
+    MetadataIndex,
 )
 from keboola_mcp_server.config import MetadataField
-from keboola_mcp_server.tools.search import (
-    SearchComponentItemType,
-    SearchItemType,
-    SearchSpec,
-    fetch_configurations,
-)
+from keboola_mcp_server.tools.search import SearchComponentItemType
+from keboola_mcp_server.tools.search_inventory import ProjectInventory
+from keboola_mcp_server.tools.search_models import SEARCH_ITEM_TYPE_TO_COMPONENT_TYPES
 from keboola_mcp_server.utils import parse_iso_timestamp
 
 
@@ -33,54 +28,54 @@ class UsageById(BaseModel):
     usage_references: list[ComponentUsageReference]
 
 
-async def find_id_usage(
+async def find_table_usage(
     client: KeboolaClient,
     target_ids: Sequence[str],
     item_types: Sequence[SearchComponentItemType] | None = None,
-    scopes: Sequence[str] = (),
 ) -> list[UsageById]:
     """
-    Finds component configurations (including rows) that reference any of the target IDs in the specified configuration
-    scopes.
+    Finds component configurations (including rows) that read or write the target tables or buckets in their input
+    or output mappings. The IDs are looked up in the lineage index of the project's configurations.
+
+    Only the mapping values equal to a target ID, or the table IDs in a target bucket, match, and each match is reported
+    at the path of the value, e.g. `storage.input.tables[0].source`. Values merely containing an ID, e.g.
+    `out.c-b.orders_copy` for the table `out.c-b.orders`, and the mapping objects and lists around the matching values
+    are not reported, unlike in the config-based search of the mapping scopes.
 
     :param client: The Keboola client to use.
-    :param target_ids: The IDs to search for.
+    :param target_ids: The table or bucket IDs to look up.
     :param item_types: Item types to search for. Only component configuration item types are supported.
-    :param scopes: Dot-separated keys to search in the configuration.
     :return: A list of UsageById objects.
     """
 
     if not target_ids:
         return []
 
-    spec = SearchSpec(
-        patterns=target_ids,
-        # Casting SearchComponentItemType to SearchItemType since it is a subset of SearchItemType.
-        item_types=cast(Sequence[SearchItemType], item_types) or (),
-        search_scopes=scopes,
-        pattern_mode='literal',
-        search_type='config-based',
-        return_all_matched_patterns=True,
-    )
-
-    search_hits = await fetch_configurations(client, spec)
-
-    # group usage references by pattern = target_id
-    output: dict[str, list[ComponentUsageReference]] = defaultdict(list)
-    for search_hit in search_hits:
-        for match in search_hit.matches:
-            for target_id in match.patterns:
-                output[target_id].append(
-                    # TODO: Consider whether adding configuration description is useful, it could overload context.
-                    ComponentUsageReference(
-                        component_id=search_hit.component_id,
-                        configuration_id=search_hit.configuration_id,
-                        configuration_row_id=search_hit.configuration_row_id,
-                        configuration_name=search_hit.name,
-                        used_in=match.scope,
-                        timestamp=search_hit.updated,
-                    )
-                )
+    component_types = {
+        component_type
+        for item_type in item_types or ()
+        for component_type in SEARCH_ITEM_TYPE_TO_COMPONENT_TYPES.get(item_type, [])
+    }
+    inventory = await ProjectInventory.from_client(client)
+    components = await inventory.list_components(client)
+    lineage = inventory.lineage_index(None, components)
+
+    output: dict[str, list[ComponentUsageReference]] = {}
+    for target_id in dict.fromkeys(target_ids):
+        usage_references = [
+            ComponentUsageReference(
+                component_id=reference.component_id,
+                configuration_id=reference.configuration_id,
+                configuration_row_id=reference.configuration_row_id,
+                configuration_name=reference.name,
+                used_in=reference.used_in,
+                timestamp=reference.updated,
+            )
+            for reference in lineage.get_references(target_id)
+            if not component_types or reference.component_type in component_types
+        ]
+        if usage_references:
+            output[target_id] = usage_references
     return [
         UsageById(target_id=target_id, usage_references=usage_references)
         for target_id, usage_references in output.items()
@@ -96,9 +91,10 @@ def get_created_by(
     :return: The created by reference.
     """
     metadata_items = _coerce_metadata_list(metadata)
-    component_id = get_metadata_property(metadata_items, MetadataField.CREATED_BY_COMPONENT_ID)
-    configuration_id = get_metadata_property(metadata_items, MetadataField.CREATED_BY_CONFIGURATION_ID)
-    configuration_row_id = get_metadata_property(metadata_items, MetadataField.CREATED_BY_CONFIGURATION_ROW_ID)
+    metadata_index = MetadataIndex(metadata_items)
+    component_id = metadata_index.get(MetadataField.CREATED_BY_COMPONENT_ID)
+    configuration_id = metadata_index.get(MetadataField.CREATED_BY_CONFIGURATION_ID)
+    configuration_row_id = metadata_index.get(MetadataField.CREATED_BY_CONFIGURATION_ROW_ID)
     if component_id is None or configuration_id is None:
         return None
     timestamp = _get_latest_metadata_timestamp(
@@ -127,9 +123,10 @@ def get_last_updated_by(
     :return: The last updated by reference.
     """
     metadata_items = _coerce_metadata_list(metadata)
-    component_id = get_metadata_property(metadata_items, MetadataField.UPDATED_BY_COMPONENT_ID)
-    configuration_id = get_metadata_property(metadata_items, MetadataField.UPDATED_BY_CONFIGURATION_ID)
-    configuration_row_id = get_metadata_property(metadata_items, MetadataField.UPDATED_BY_CONFIGURATION_ROW_ID)
+    metadata_index = MetadataIndex(metadata_items)
+    component_id = metadata_index.get(MetadataField.UPDATED_BY_COMPONENT_ID)
+    configuration_id = metadata_index.get(MetadataField.UPDATED_BY_CONFIGURATION_ID)
+    configuration_row_id = metadata_index.get(MetadataField.UPDATED_BY_CONFIGURATION_ROW_ID)
     if component_id is None or configuration_id is None:
         return None
     timestamp = _get_latest_metadata_timestamp(
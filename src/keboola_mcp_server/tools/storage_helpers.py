@@ -13,8 +13,10 @@ the storage client bucket/table methods directly.
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
 from keboola_mcp_server.clients.base import JsonDict
 from keboola_mcp_server.clients.client import KeboolaClient, get_metadata_property
 from keboola_mcp_server.config import MetadataField
@@ -65,55 +67,294 @@ async def merged_bucket_table_list(client: KeboolaClient, bucket_id: str, **kwar
         return _filter_current_branch(raw, client.branch_id)
 
 
-async def merged_bucket_detail(client: KeboolaClient, bucket_id: str) -> tuple[JsonDict | None, JsonDict | None]:
+async def merged_bucket_detail(
+    client: KeboolaClient, bucket_id: str, storage: 'StorageDetailCache | None' = None
+) -> tuple[JsonDict | None, JsonDict | None]:
     """
     Fetch production and branch versions of a bucket.
 
+    Pass `storage` to reuse the cached bucket details.
+
     Returns (prod_raw, dev_raw) tuple. Either may be None if not found.
     """
     if await has_storage_branches(client):
         prod_raw, dev_raw = await asyncio.gather(
-            _safe_bucket_detail(client, bucket_id, branch_id='default'),
-            _safe_bucket_detail(client, bucket_id, branch_id=client.branch_id),
+            _safe_bucket_detail(client, bucket_id, storage, branch_id='default'),
+            _safe_bucket_detail(client, bucket_id, storage, branch_id=client.branch_id),
         )
         return prod_raw, dev_raw
     else:
         # Legacy: both prod and dev are accessible from the default endpoint
-        prod_raw = await _safe_bucket_detail(client, bucket_id, branch_id='default')
+        prod_raw = await _safe_bucket_detail(client, bucket_id, storage, branch_id='default')
         dev_raw = None
         if client.branch_id:
             if f'c-{client.branch_id}-' in bucket_id:
                 dev_id = bucket_id
             else:
                 dev_id = bucket_id.replace('c-', f'c-{client.branch_id}-')
-            dev_raw = await _safe_bucket_detail(client, dev_id, branch_id='default')
+            dev_raw = await _safe_bucket_detail(client, dev_id, storage, branch_id='default')
         return prod_raw, dev_raw
 
 
-async def merged_table_detail(client: KeboolaClient, table_id: str) -> tuple[JsonDict | None, JsonDict | None]:
+class BucketListing:
+    """
+    Production and branch versions of the buckets looked up in the listings of all the buckets.
+
+    Resolving many buckets this way takes one or two listing requests instead of a detail request or two per bucket.
+    The buckets are listed with their metadata, so that they are told apart by branch like the bucket details.
+    """
+
+    def __init__(
+        self, client: KeboolaClient, default_buckets: list[JsonDict], branch_buckets: list[JsonDict] | None
+    ) -> None:
+        """
+        :param client: The client whose branch the buckets are resolved for.
+        :param default_buckets: The buckets listed from the default endpoint.
+        :param branch_buckets: The buckets listed from the branch endpoint, None unless storage-branches are used.
+        """
+        self._branch_id = client.branch_id
+        self._default_buckets = {bucket['id']: bucket for bucket in default_buckets if bucket.get('id')}
+        self._branch_buckets = (
+            {bucket['id']: bucket for bucket in branch_buckets if bucket.get('id')}
+            if branch_buckets is not None
+            else None
+        )
+
+    @classmethod
+    async def fetch(cls, client: KeboolaClient) -> 'BucketListing':
+        """Lists the buckets from the default endpoint, and from the branch endpoint with storage-branches."""
+        if await has_storage_branches(client):
+            default_buckets, branch_buckets = await asyncio.gather(
+                client.storage_client.bucket_list(include=['metadata'], branch_id='default'),
+                client.storage_client.bucket_list(include=['metadata'], branch_id=client.branch_id),
+            )
+            return cls(client, default_buckets, branch_buckets)
+        else:
+            return cls(client, await client.storage_client.bucket_list(include=['metadata'], branch_id='default'), None)
+
+    def get_default_bucket(self, bucket_id: str) -> JsonDict | None:
+        """Looks up the bucket from the default endpoint, like `_safe_bucket_detail(..., branch_id='default')`."""
+        return self._default_buckets.get(bucket_id)
+
+    def get_bucket(self, bucket_id: str, branch_id: str | None) -> JsonDict | None:
+        """Looks up the bucket as listed from the endpoint of the branch, the default endpoint if not listed."""
+        if branch_id and branch_id != 'default' and self._branch_buckets is not None:
+            return self._branch_buckets.get(bucket_id)
+        return self._default_buckets.get(bucket_id)
+
+    def merged_bucket_detail(self, bucket_id: str) -> tuple[JsonDict | None, JsonDict | None]:
+        """Looks up the production and branch versions of a bucket, like `merged_bucket_detail`."""
+        if self._branch_buckets is not None:
+            return self._default_buckets.get(bucket_id), self._branch_buckets.get(bucket_id)
+        else:
+            prod_raw = self._default_buckets.get(bucket_id)
+            dev_raw = None
+            if self._branch_id:
+                if f'c-{self._branch_id}-' in bucket_id:
+                    dev_id = bucket_id
+                else:
+                    dev_id = bucket_id.replace('c-', f'c-{self._branch_id}-')
+                dev_raw = self._default_buckets.get(dev_id)
+            return prod_raw, dev_raw
+
+
+class StorageDetailCache:
+    """
+    Raw bucket and table payloads (`bucket_detail`, `table_detail` and `bucket_table_list` responses) kept between
+    the tool calls looking up many buckets or tables.
+
+    The payloads are shared by all the sessions in the process, keyed by the project, the token, the branch endpoint
+    and the ID. An instance is created per tool call: it lists the buckets once (see `BucketListing`) and reuses
+    a payload only while the `lastChangeDate` of its bucket in the listing has not changed. A change to any table
+    of a bucket, e.g. an import, moves the bucket's date, so the bucket details, the listings of the buckets' tables
+    and the table details are all checked without any further requests.
+
+    Not every metadata change (e.g. a description edited in the UI) moves these dates, so the payloads expire after
+    `PAYLOAD_CACHE_TTL` seconds, and the tools changing the metadata call `invalidate`.
+
+    The instance has the methods of the storage client it caches, so it can be passed to the helpers in place of it.
+    The payloads are shared, so only their shallow copies are returned.
+    """
+
+    PAYLOAD_CACHE_SIZE = 2048
+    PAYLOAD_CACHE_TTL = 60.0  # seconds
+
+    # (Storage API URL, project ID, token fingerprint, branch endpoint, payload kind, ID, includes, dates)
+    _payloads: TtlCache[tuple[Any, ...], Any] = TtlCache(
+        max_size=PAYLOAD_CACHE_SIZE, ttl=PAYLOAD_CACHE_TTL, shared=True
+    )
+
+    def __init__(self, client: KeboolaClient, scope: tuple[Any, ...], listing: BucketListing) -> None:
+        self._client = client
+        self._scope = scope
+        self.listing = listing
+
+    @staticmethod
+    async def _get_scope(client: KeboolaClient) -> tuple[Any, ...]:
+        return (
+            client.storage_api_url,
+            await client.get_project_id(),
+            token_fingerprint(client.bearer_token or client.token),
+        )
+
+    @classmethod
+    async def from_client(cls, client: KeboolaClient) -> 'StorageDetailCache':
+        """Lists the buckets to check the cached payloads of the client's project against."""
+        scope, listing = await asyncio.gather(cls._get_scope(client), BucketListing.fetch(client))
+        return cls(client, scope, listing)
+
+    @classmethod
+    async def invalidate(cls, client: KeboolaClient) -> None:
+        """Forgets the payloads of the client's project kept for any token and branch."""
+        storage_api_url, project_id, _ = await cls._get_scope(client)
+        dropped = cls._payloads.pop_matching(lambda key: key[:2] == (storage_api_url, project_id))
+        LOG.debug(f'Dropped {dropped} cached storage payloads of project {project_id}.')
+
+    def _get_branch_endpoint(self, branch_id: str | None) -> str:
+        return branch_id or self._client.branch_id or 'default'
+
+    def _get_bucket_dates(self, bucket_id: str, branch_id: str) -> tuple[Any, ...] | None:
+        bucket = self.listing.get_bucket(bucket_id, branch_id)
+        if not bucket or not (last_change_date := bucket.get('lastChangeDate')):
+            return None
+        return (last_change_date,)
+
+    async def _get_or_fetch(
+        self,
+        kind: str,
+        item_id: str,
+        branch_id: str,
+        includes: tuple[str, ...],
+        dates: tuple[Any, ...] | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        if dates is None:
+            # Without the dates the payload could not be checked later.
+            return await fetch()
+        key = (*self._scope, branch_id, kind, item_id, includes, dates)
+        return await self._payloads.get_or_load(key, fetch)
+
+    async def bucket_detail(self, bucket_id: str, branch_id: str | None = None) -> JsonDict:
+        """Gets the bucket detail, see `AsyncStorageClient.bucket_detail`."""
+        endpoint = self._get_branch_endpoint(branch_id)
+        payload = await self._get_or_fetch(
+            'bucket',
+            bucket_id,
+            endpoint,
+            (),
+            self._get_bucket_dates(bucket_id, endpoint),
+            lambda: self._client.storage_client.bucket_detail(bucket_id, branch_id=branch_id),
+        )
+        return dict(payload)
+
+    async def table_detail(self, table_id: str, branch_id: str | None = None) -> JsonDict:
+        """Gets the table detail, see `AsyncStorageClient.table_detail`."""
+        endpoint = self._get_branch_endpoint(branch_id)
+        payload = await self._get_or_fetch(
+            'table',
+            table_id,
+            endpoint,
+            (),
+            self._get_bucket_dates(table_id.rpartition('.')[0], endpoint),
+            lambda: self._client.storage_client.table_detail(table_id, branch_id=branch_id),
+        )
+        return dict(payload)
+
+    async def bucket_table_list(
+        self, bucket_id: str, include: list[str] | None = None, branch_id: str | None = None
+    ) -> list[JsonDict]:
+        """Lists the tables of the bucket, see `AsyncStorageClient.bucket_table_list`."""
+        endpoint = self._get_branch_endpoint(branch_id)
+        payload = await self._get_or_fetch(
+            'tables',
+            bucket_id,
+            endpoint,
+            tuple(include or ()),
+            self._get_bucket_dates(bucket_id, endpoint),
+            lambda: self._client.storage_client.bucket_table_list(bucket_id, include=include, branch_id=branch_id),
+        )
+        return [dict(table) for table in payload]
+
+
+async def merged_table_detail(
+    client: KeboolaClient, table_id: str, storage: StorageDetailCache | None = None
+) -> tuple[JsonDict | None, JsonDict | None]:
     """
     Fetch production and branch versions of a table.
 
+    Pass `storage` to reuse the cached table details.
+
     Returns (prod_raw, dev_raw) tuple. Either may be None if not found.
     """
     if await has_storage_branches(client):
         prod_raw, dev_raw = await asyncio.gather(
-            _safe_table_detail(client, table_id, branch_id='default'),
-            _safe_table_detail(client, table_id, branch_id=client.branch_id),
+            _safe_table_detail(client, table_id, storage, branch_id='default'),
+            _safe_table_detail(client, table_id, storage, branch_id=client.branch_id),
         )
         return prod_raw, dev_raw
     else:
-        prod_raw = await _safe_table_detail(client, table_id, branch_id='default')
+        prod_raw = await _safe_table_detail(client, table_id, storage, branch_id='default')
         dev_raw = None
         if client.branch_id:
             if f'c-{client.branch_id}-' in table_id:
                 dev_id = table_id
             else:
                 dev_id = table_id.replace('c-', f'c-{client.branch_id}-')
-            dev_raw = await _safe_table_detail(client, dev_id, branch_id='default')
+            dev_raw = await _safe_table_detail(client, dev_id, storage, branch_id='default')
         return prod_raw, dev_raw
 
 
+async def merged_table_details(
+    client: KeboolaClient, table_ids: Sequence[str], include: list[str], storage: StorageDetailCache | None = None
+) -> dict[str, tuple[JsonDict | None, JsonDict | None]]:
+    """
+    Look up production and branch versions of tables in the listings of their buckets' tables.
+
+    Like `merged_table_detail` for each table, but with one or two listing requests per bucket instead of one or two
+    detail requests per table. The listed tables carry only the data requested by `include`. Pass `storage` to reuse
+    the cached listings.
+
+    Returns (prod_raw, dev_raw) tuples by the table IDs. Either may be None if not found.
+    """
+    if await has_storage_branches(client):
+        branch_ids = ['default', client.branch_id]
+        dev_ids = {table_id: table_id for table_id in table_ids}
+    else:
+        branch_ids = ['default']
+        dev_ids = {}
+        if client.branch_id:
+            for table_id in table_ids:
+                if f'c-{client.branch_id}-' in table_id:
+                    dev_ids[table_id] = table_id
+                else:
+                    dev_ids[table_id] = table_id.replace('c-', f'c-{client.branch_id}-')
+
+    # (bucket ID, branch ID) of the listings; the legacy branch tables are listed from the default endpoint
+    listing_keys = {(table_id.rpartition('.')[0], 'default') for table_id in table_ids}
+    listing_keys.update((dev_id.rpartition('.')[0], branch_ids[-1]) for dev_id in dev_ids.values())
+    listing_keys_list = sorted(listing_keys, key=str)
+    listings = await asyncio.gather(
+        *(
+            _safe_bucket_table_list(client, bucket_id, storage, include=include, branch_id=branch_id)
+            for bucket_id, branch_id in listing_keys_list
+        )
+    )
+    tables_by_key = {
+        (table['id'], branch_id): table
+        for (_, branch_id), listing in zip(listing_keys_list, listings)
+        for table in listing
+        if table.get('id')
+    }
+
+    return {
+        table_id: (
+            tables_by_key.get((table_id, 'default')),
+            tables_by_key.get((dev_ids[table_id], branch_ids[-1])) if table_id in dev_ids else None,
+        )
+        for table_id in table_ids
+    }
+
+
 def _filter_current_branch(items: list[JsonDict], branch_id: str | None) -> list[JsonDict]:
     """Filter out items belonging to other dev branches (legacy mode).
 
@@ -138,24 +379,42 @@ def _merge_by_id(prod_data: list[JsonDict], branch_data: list[JsonDict]) -> list
     return merged
 
 
-async def _safe_bucket_detail(client: KeboolaClient, bucket_id: str, **kwargs: Any) -> JsonDict | None:
+async def _safe_bucket_detail(
+    client: KeboolaClient, bucket_id: str, storage: StorageDetailCache | None = None, **kwargs: Any
+) -> JsonDict | None:
     """Fetch bucket detail, returning None on 404."""
     import httpx
 
     try:
-        return await client.storage_client.bucket_detail(bucket_id, **kwargs)
+        return await (storage or client.storage_client).bucket_detail(bucket_id, **kwargs)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return None
         raise
 
 
-async def _safe_table_detail(client: KeboolaClient, table_id: str, **kwargs: Any) -> JsonDict | None:
+async def _safe_bucket_table_list(
+    client: KeboolaClient, bucket_id: str, storage: StorageDetailCache | None = None, **kwargs: Any
+) -> list[JsonDict]:
+    """List tables of a bucket, returning an empty list on 404."""
+    import httpx
+
+    try:
+        return await (storage or client.storage_client).bucket_table_list(bucket_id, **kwargs)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return []
+        raise
+
+
+async def _safe_table_detail(
+    client: KeboolaClient, table_id: str, storage: StorageDetailCache | None = None, **kwargs: Any
+) -> JsonDict | None:
     """Fetch table detail, returning None on 404."""
     import httpx
 
     try:
-        return await client.storage_client.table_detail(table_id, **kwargs)
+        return await (storage or client.storage_client).table_detail(table_id, **kwargs)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return None
@@ -1,22 +1,28 @@
 import abc
 import asyncio
+import contextlib
 import json
 import logging
 import re
 import time
 import uuid
-from collections.abc import Awaitable, Callable, Mapping, Sequence
-from typing import Any, Literal, cast
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
+from typing import Any, Literal, NamedTuple, cast, overload
 from urllib.parse import urlunparse
 
+import sqlglot
 from httpx import HTTPStatusError
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic.dataclasses import dataclass
+from pydantic_core import ArgsKwargs
+from sqlglot import exp
 
+from keboola_mcp_server.cache import TtlCache, token_fingerprint
 from keboola_mcp_server.clients.base import JsonDict
 from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.clients.query import QueryServiceClient
 from keboola_mcp_server.clients.storage import AsyncStorageClient
+from keboola_mcp_server.polling import QueryPollingStrategy
 from keboola_mcp_server.tools.storage_helpers import has_storage_branches
 
 LOG = logging.getLogger(__name__)
@@ -98,13 +104,68 @@ QueryStatus = Literal['ok', 'error']
 SqlSelectDataRow = Mapping[str, Any]
 
 
+class _SqlSelectRowsView(Sequence[SqlSelectDataRow]):
+    """Read-only view of the selected rows creating the column: value dictionaries only when accessed."""
+
+    def __init__(self, columns: Sequence[str], values: Sequence[Sequence[Any]]) -> None:
+        self._columns = columns
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> SqlSelectDataRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[SqlSelectDataRow]: ...
+
+    def __getitem__(self, index: int | slice) -> SqlSelectDataRow | Sequence[SqlSelectDataRow]:
+        if isinstance(index, slice):
+            return _SqlSelectRowsView(self._columns, self._values[index])
+        return dict(zip(self._columns, self._values[index]))
+
+    def __iter__(self) -> Iterator[SqlSelectDataRow]:
+        return (dict(zip(self._columns, row)) for row in self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 @dataclass(frozen=True)
 class SqlSelectData:
     columns: Sequence[str] = Field(description='Names of the columns returned from SQL select.')
-    rows: Sequence[SqlSelectDataRow] = Field(
-        description='Selected rows, each row is a dictionary of column: value pairs.'
+    values: Sequence[Sequence[Any]] = Field(
+        description='Selected rows, each row is a list of values in the order of the columns.'
     )
 
+    @model_validator(mode='before')
+    @classmethod
+    def _accept_rows(cls, data: Any) -> Any:
+        """Accepts the rows given as dictionaries of column: value pairs in the former `rows` field."""
+        kwargs = data.kwargs if isinstance(data, ArgsKwargs) else data
+        if not isinstance(kwargs, dict) or 'rows' not in kwargs or 'values' in kwargs:
+            return data
+        kwargs = dict(kwargs)
+        rows = kwargs.pop('rows')
+        kwargs['values'] = [[row.get(col) for col in kwargs.get('columns', ())] for row in rows]
+        return ArgsKwargs(data.args, kwargs) if isinstance(data, ArgsKwargs) else kwargs
+
+    @staticmethod
+    def from_rows(columns: Sequence[str], rows: Iterable[SqlSelectDataRow]) -> 'SqlSelectData':
+        """Creates the data from the rows given as dictionaries of column: value pairs."""
+        return SqlSelectData(columns=columns, values=[[row.get(col) for col in columns] for row in rows])
+
+    @property
+    def rows(self) -> Sequence[SqlSelectDataRow]:
+        """Selected rows, each row is a dictionary of column: value pairs; the dictionaries are created lazily."""
+        return _SqlSelectRowsView(self.columns, self.values)
+
 
 @dataclass(frozen=True)
 class QueryResult:
@@ -123,27 +184,134 @@ class QueryResult:
         return not self.is_ok
 
 
+class QueryResultStream:
+    """
+    The result of an SQL query whose selected rows are fetched from the Query Service page by page
+    while the stream is iterated, so that only a single page of rows is held in memory at a time.
+    The pages can be iterated only once.
+    """
+
+    _SELECTED_ROWS_MSG = 'Returning {rows} of {total} selected rows.'
+
+    def __init__(
+        self,
+        status: QueryStatus,
+        message: str | None = None,
+        *,
+        columns: Sequence[str] = (),
+        total_rows: int | None = None,
+        pages: AsyncGenerator[list[list[Any]], None] | None = None,
+    ) -> None:
+        """
+        :param status: The status of running the SQL query.
+        :param message: Either an error message or the information from the query execution.
+        :param columns: The names of the selected columns; empty for non-SELECT queries.
+        :param total_rows: The total number of rows selected by the query.
+        :param pages: The pages of the selected rows, each row is a list of values in the order of the columns.
+        """
+        self._status = status
+        self._message = message
+        self._columns = list(columns)
+        self._total_rows = total_rows
+        self._pages = pages
+        self._row_count = 0
+
+    @property
+    def status(self) -> QueryStatus:
+        return self._status
+
+    @property
+    def is_ok(self) -> bool:
+        return self._status == 'ok'
+
+    @property
+    def is_error(self) -> bool:
+        return not self.is_ok
+
+    @property
+    def columns(self) -> Sequence[str]:
+        return self._columns
+
+    @property
+    def row_count(self) -> int:
+        """The number of rows iterated so far."""
+        return self._row_count
+
+    @property
+    def total_rows(self) -> int | None:
+        """The total number of rows selected by the query."""
+        return self._total_rows
+
+    @property
+    def query_message(self) -> str | None:
+        """The message from the query execution, without the number of rows iterated so far."""
+        return self._message
+
+    @property
+    def message(self) -> str | None:
+        """The query message; for SELECT queries it reports the number of rows iterated so far."""
+        if not self._columns:
+            return self._message
+        selected_rows_msg = self._SELECTED_ROWS_MSG.format(rows=self._row_count, total=self._total_rows)
+        return ' '.join(filter(None, [self._message, selected_rows_msg]))
+
+    async def pages(self) -> AsyncIterator[list[list[Any]]]:
+        """Yields the pages of the selected rows as they are fetched."""
+        if self._pages is None:
+            return
+        # Closing the pages when the iteration stops early cancels any page request that is still in flight.
+        async with contextlib.aclosing(self._pages) as pages:
+            async for page in pages:
+                self._row_count += len(page)
+                yield page
+
+    async def collect(self) -> QueryResult:
+        """Fetches all the remaining pages and returns them as a single query result."""
+        if self.is_error:
+            return QueryResult(status=self._status, data=None, message=self._message)
+        if not self._columns:
+            return QueryResult(status=self._status, message=self._message)
+        values = [row async for page in self.pages() for row in page]
+        return QueryResult(
+            status=self._status, data=SqlSelectData(columns=self._columns, values=values), message=self.message
+        )
+
+    def with_pages(self, pages: AsyncGenerator[list[list[Any]], None]) -> 'QueryResultStream':
+        """Creates a stream of the same query result whose selected rows are taken from the given pages."""
+        return QueryResultStream(
+            self._status, self._message, columns=self._columns, total_rows=self._total_rows, pages=pages
+        )
+
+
 class _Workspace(abc.ABC):
     _QUERY_TIMEOUT = 300.0  # 5 minutes
     _CANCELLATION_TIMEOUT = 30.0  # 30 seconds to wait for cancellation
-    _SELECTED_ROWS_MSG = 'Returning {rows} of {total} selected rows.'
-    _PAGE_SIZE = 1_000
+    _PAGE_SIZE = 1_000  # the first results page size when the result is limited by the number of chars
+    _MIN_PAGE_SIZE = 100  # the smallest results page the Query Service returns
+    _MAX_PAGE_SIZE = 10_000  # the largest results page the Query Service returns
 
-    @staticmethod
-    def _next_poll_interval(elapsed_seconds: float) -> float:
-        """Job-status polling interval for `execute_query`: fast at first, capped at 20s."""
-        if elapsed_seconds < 10:
-            return 1.0
-        if elapsed_seconds < 30:
-            return 2.0
-        if elapsed_seconds < 120:
-            return 5.0
-        return 20.0
+    @classmethod
+    def _rows_to_fetch(cls, max_rows: int | None, max_chars: int | None, rows_count: int, chars_count: int) -> int:
+        """
+        The number of rows to request in the next results page. Without the chars limit the rows are fetched
+        in the largest pages the Query Service allows, so that the whole result takes as few round-trips
+        as possible. With the chars limit the first page has `_PAGE_SIZE` rows and the next pages are sized
+        to the rows expected to fit the remaining chars, estimated from the average row length seen so far.
+        """
+        if max_chars is None:
+            page_size = cls._MAX_PAGE_SIZE
+        elif rows_count == 0 or chars_count == 0:
+            page_size = cls._PAGE_SIZE
+        else:
+            expected_rows = -(-(max_chars - chars_count) * rows_count // chars_count)  # rounded up
+            page_size = min(max(expected_rows, cls._MIN_PAGE_SIZE), cls._MAX_PAGE_SIZE)
+        return page_size if max_rows is None else min(page_size, max_rows - rows_count)
 
     def __init__(self, workspace_id: int, client: KeboolaClient) -> None:
         self._workspace_id = workspace_id
         self._client = client
         self._qsclient: QueryServiceClient | None = None
+        self._polling = QueryPollingStrategy.for_workspace(workspace_id)
 
     @property
     def id(self) -> int:
@@ -222,7 +390,25 @@ class _Workspace(abc.ABC):
         on_job_submitted: JobSubmittedCallback | None = None,
     ) -> QueryResult:
         """
-        Runs a given SQL query through the Query Service.
+        Runs a given SQL query through the Query Service and fetches all its results.
+        See :meth:`execute_query_stream` for the parameters.
+        """
+        result = await self.execute_query_stream(
+            sql_query, max_rows=max_rows, max_chars=max_chars, on_job_submitted=on_job_submitted
+        )
+        return await result.collect()
+
+    async def execute_query_stream(
+        self,
+        sql_query: str,
+        *,
+        max_rows: int | None = None,
+        max_chars: int | None = None,
+        on_job_submitted: JobSubmittedCallback | None = None,
+    ) -> QueryResultStream:
+        """
+        Runs a given SQL query through the Query Service. Only the first page of the results is fetched
+        before returning, the other pages are fetched while the returned stream is iterated.
 
         The Query Service is backend-agnostic; the SQL itself must follow the dialect of the
         workspace backend (see :meth:`get_sql_dialect` / :meth:`get_quoted_name`).
@@ -268,6 +454,7 @@ class _Workspace(abc.ABC):
                     raise
                 except Exception as exc:
                     LOG.warning(f'on_job_submitted callback raised for job_id={job_id}: {exc!r} — continuing')
+            poll_count = 1
             while (job_status := await self._qsclient.get_job_status(job_id)) and job_status['status'] not in [
                 'completed',
                 'failed',
@@ -276,12 +463,13 @@ class _Workspace(abc.ABC):
             ]:
                 elapsed_time = time.perf_counter() - ts_start
                 # Back off polling frequency for long-running queries so a multi-minute query
-                # isn't status-checked hundreds of times. Sleep is clamped to the time left so
-                # it never overshoots the timeout, though the last status check before the
-                # deadline may still land up to one full interval (max 20s) early.
+                # isn't status-checked hundreds of times, see `QueryPollingStrategy`. Sleep is clamped
+                # to the time left so it never overshoots the timeout, though the last status check
+                # before the deadline may still land up to one full interval (max 20s) early.
                 remaining = self._QUERY_TIMEOUT - elapsed_time
-                sleep_for = max(min(self._next_poll_interval(elapsed_time), remaining), 0.0)
+                sleep_for = max(min(self._polling.next_interval(elapsed_time), remaining), 0.0)
                 await asyncio.sleep(sleep_for)
+                poll_count += 1
                 elapsed_time = time.perf_counter() - ts_start
                 if elapsed_time > self._QUERY_TIMEOUT:
                     # Cancel the query before raising timeout error. Inline the reason (rather than
@@ -332,93 +520,124 @@ class _Workspace(abc.ABC):
         # message, which is misleading — we already know the job reached a terminal CANCELLED
         # state. Return a clear cancel result instead and skip the results fetch entirely.
         terminal_status = job_status['status']
+        duration = time.perf_counter() - ts_start
+        LOG.info(
+            f'Query job finished: job_id={job_id}, status={terminal_status}, '
+            f'duration={duration:.2f} seconds, status_polls={poll_count}'
+        )
+        if terminal_status == 'completed':
+            self._polling.record_query(duration)
         if terminal_status in ('canceled', 'cancelled'):
             LOG.info(f'Query was cancelled (terminal status={terminal_status}): job_id={job_id}')
-            return QueryResult(status='error', data=None, message='Query was cancelled')
+            return QueryResultStream(status='error', message='Query was cancelled')
 
         statement_id = cast(list[JsonDict], job_status['statements'])[0]['id']
 
-        # Fetch results with pagination
-        all_rows: list[list[Any]] = []
-        all_rows_chars: int = 0
-        columns: list[str] = []
-        offset = 0
-        page_size = self._PAGE_SIZE
-        message: str | None = None
-        total_query_rows: int | None = None
-
-        while True:
-            if max_rows is not None:
-                remaining = max_rows - len(all_rows)
-                if remaining <= 0:
-                    break
-                rows_to_fetch = min(page_size, remaining)
-            else:
-                rows_to_fetch = page_size
-
-            results = await self._qsclient.get_job_results(
-                job_id,
-                statement_id,
-                offset=offset,
-                limit=max(rows_to_fetch, 100),  # QueryService requires 100 - 10_000
-            )
-
-            # Store message, total_query_rows and columns from the first response
-            if offset == 0:
-                status = results['status']
-                message = results['message']
-                total_query_rows = results.get('numberOfRows')
-
-                if status in ['failed', 'canceled', 'cancelled']:
-                    return QueryResult(status='error', data=None, message=self._format_error_message(message))
-                elif status != 'completed':
-                    raise ValueError(f'Unexpected query status: {status}')
-
-                columns = [col['name'] for col in cast(list[JsonDict], results['columns'])]
-
-            page_data = cast(list[list[Any]], results.get('data', []))
-            if not page_data:
-                break
-
-            page_data = page_data[:rows_to_fetch]
-            char_limit_reached = False
-            if max_chars is not None:
-                for row in page_data:
-                    chars = sum(len(str(v)) for v in row if v is not None)
-                    if all_rows_chars + chars <= max_chars:
-                        all_rows.append(row)
-                        all_rows_chars += chars
-                    else:
-                        # The first row that does not fit ends pagination so that the result
-                        # is a contiguous prefix; we must not skip this row and then append
-                        # later smaller rows that happen to fit.
-                        char_limit_reached = True
-                        break
-            else:
-                all_rows.extend(page_data)
+        rows_to_fetch = self._rows_to_fetch(max_rows, max_chars, 0, 0)
+        results = await self._qsclient.get_job_results(
+            job_id,
+            statement_id,
+            offset=0,
+            limit=max(rows_to_fetch, self._MIN_PAGE_SIZE),  # QueryService requires 100 - 10_000
+        )
 
-            if len(page_data) < rows_to_fetch:
-                break
+        status = results['status']
+        message = results['message']
+        if status in ['failed', 'canceled', 'cancelled']:
+            return QueryResultStream(status='error', message=self._format_error_message(message))
+        elif status != 'completed':
+            raise ValueError(f'Unexpected query status: {status}')
+
+        columns = [col['name'] for col in cast(list[JsonDict], results['columns'])]
+        if not columns:
+            return QueryResultStream(status='ok', message=message)
+
+        return QueryResultStream(
+            status='ok',
+            message=message,
+            columns=columns,
+            total_rows=results.get('numberOfRows'),
+            pages=self._fetch_result_pages(job_id, statement_id, results, max_rows=max_rows, max_chars=max_chars),
+        )
 
-            if max_rows is not None and len(all_rows) >= max_rows:
-                break
+    async def _fetch_result_pages(
+        self,
+        job_id: str,
+        statement_id: str,
+        first_results: JsonDict,
+        *,
+        max_rows: int | None,
+        max_chars: int | None,
+    ) -> AsyncGenerator[list[list[Any]], None]:
+        """
+        Yields the pages of the query results. While a page is being consumed, the next one is already being
+        fetched (one page lookahead); the lookahead is cancelled when the consumer stops iterating early.
+        The `max_rows` and `max_chars` limits are applied as the pages arrive, the result is always
+        a contiguous prefix of the selected rows and no page is requested once a limit is reached.
 
-            if char_limit_reached or (max_chars is not None and all_rows_chars >= max_chars):
-                break
+        :param first_results: The already fetched first page of the results.
+        """
+        results = first_results
+        next_results: asyncio.Future[JsonDict] | None = None
+        offset = 0
+        rows_count = 0
+        chars_count = 0
 
-            offset += len(page_data)
+        try:
+            while True:
+                rows_to_fetch = self._rows_to_fetch(max_rows, max_chars, rows_count, chars_count)
+                page_data = cast(list[list[Any]], results.get('data', []))[:rows_to_fetch]
+                if not page_data:
+                    return
+
+                page = page_data
+                char_limit_reached = False
+                if max_chars is not None:
+                    page = []
+                    for row in page_data:
+                        chars = sum(len(str(v)) for v in row if v is not None)
+                        if chars_count + chars <= max_chars:
+                            page.append(row)
+                            chars_count += chars
+                        else:
+                            # The first row that does not fit ends pagination so that the result
+                            # is a contiguous prefix; we must not skip this row and then append
+                            # later smaller rows that happen to fit.
+                            char_limit_reached = True
+                            break
+
+                rows_count += len(page)
+                offset += len(page_data)
+                has_next_page = not (
+                    len(page_data) < rows_to_fetch
+                    or (max_rows is not None and rows_count >= max_rows)
+                    or char_limit_reached
+                    or (max_chars is not None and chars_count >= max_chars)
+                )
+                if has_next_page:
+                    next_rows_to_fetch = self._rows_to_fetch(max_rows, max_chars, rows_count, chars_count)
+                    next_results = asyncio.ensure_future(
+                        self._qsclient.get_job_results(
+                            job_id,
+                            statement_id,
+                            offset=offset,
+                            limit=max(next_rows_to_fetch, self._MIN_PAGE_SIZE),  # QueryService requires 100 - 10_000
+                        )
+                    )
 
-        rows = [dict(zip(columns, row)) for row in all_rows]
+                if page:
+                    yield page
 
-        if columns:
-            message = ' '.join(
-                filter(None, [message, self._SELECTED_ROWS_MSG.format(rows=len(rows), total=total_query_rows)])
-            )
-            query_result = QueryResult(status='ok', data=SqlSelectData(columns=columns, rows=rows), message=message)
-        else:
-            query_result = QueryResult(status='ok', message=message)
+                if next_results is None:
+                    return
+                results = await next_results
+                next_results = None
 
-        return query_result
+        finally:
+            if next_results is not None:
+                next_results.cancel()
+                # Waits for the cancelled request to finish, without raising its cancellation or failure.
+                await asyncio.wait([next_results])
 
     async def get_branch_id(self) -> str:
         if not self._qsclient:
@@ -562,10 +781,79 @@ class _WspInfo:
         return _WspInfo(id=_id, schema=_schema, backend=backend, credentials=credentials, readonly=readonly)
 
 
+# (Storage API URL, project ID, branch ID, workspace schema, token fingerprint); the branch ID is None for the default
+# branch, the workspace schema is None for the workspace managed by the MCP server, which all the tokens share,
+# and so is the token fingerprint
+_WspCacheKey = tuple[str, str, str | None, str | None, str | None]
+# (Storage API URL, token fingerprint, workspace ID, branch ID, normalized SQL, max rows, max chars)
+_QueryCacheKey = tuple[str, str | None, int, str | None, str, int | None, int | None]
+
+# The functions whose results differ from one run of the same query to another.
+_VOLATILE_SQL_FUNCTIONS = (
+    exp.CurrentDate,
+    exp.CurrentDatetime,
+    exp.CurrentTime,
+    exp.CurrentTimestamp,
+    exp.CurrentTimestampLTZ,
+    exp.Rand,
+    exp.Randn,
+    exp.Randstr,
+    exp.Uuid,
+)
+
+
+class _CachedQueryResult(NamedTuple):
+    status: QueryStatus
+    message: str | None
+    columns: Sequence[str]
+    total_rows: int | None
+    values: Sequence[Sequence[Any]]
+    last_import_dates: Mapping[str, str | None]  # table ID -> the table's lastImportDate when the query ran
+
+    def to_stream(self) -> QueryResultStream:
+        async def _pages() -> AsyncGenerator[list[list[Any]], None]:
+            if self.values:
+                yield [list(row) for row in self.values]
+
+        return QueryResultStream(
+            self.status, self.message, columns=self.columns, total_rows=self.total_rows, pages=_pages()
+        )
+
+
 class WorkspaceManager:
     STATE_KEY = 'workspace_manager'
     MCP_WORKSPACE_COMPONENT_ID = 'keboola.mcp-server-tool'
 
+    WORKSPACE_CACHE_SIZE = 1_024
+    WORKSPACE_CACHE_TTL = 900.0  # seconds
+    # The number of MCP component configurations whose workspaces are listed concurrently.
+    WORKSPACE_LOOKUP_CONCURRENCY = 10
+    # Polling of the workspace creation job: starts fast and backs off exponentially up to the maximum interval.
+    WORKSPACE_JOB_POLL_INITIAL_INTERVAL = 0.5  # seconds
+    WORKSPACE_JOB_POLL_MAX_INTERVAL = 5.0  # seconds
+    # HTTP status codes of the Query Service responses meaning that the cached workspace is no longer usable.
+    _WORKSPACE_REJECTED_STATUS_CODES = frozenset({403, 404})
+
+    # The workspace a project branch resolves to is the same for all sessions, so the resolved workspaces
+    # are shared by all managers in the process. Concurrent lookups of the same workspace are coalesced,
+    # so a burst of sessions on a fresh project provisions a single workspace; see `_get_workspace()`.
+    # An explicitly requested workspace is kept per token, because each token must be checked to have access to it.
+    _workspace_info_cache: TtlCache[_WspCacheKey, _WspInfo] = TtlCache(
+        max_size=WORKSPACE_CACHE_SIZE, ttl=WORKSPACE_CACHE_TTL, shared=True
+    )
+
+    QUERY_CACHE_SIZE = 256
+    QUERY_CACHE_TTL = 300.0  # seconds
+    # Results with more characters than this (counted the same way as the `max_chars` limit) are not cached.
+    QUERY_CACHE_MAX_RESULT_CHARS = 100_000
+
+    # Exploratory queries are often repeated within a conversation, so their results can be cached process-wide
+    # when the caller opts in, see `execute_query_stream()`. The results are kept per token, so a token never gets
+    # the results of a query it has not been allowed to run.
+    _query_result_cache: TtlCache[_QueryCacheKey, _CachedQueryResult] = TtlCache(
+        max_size=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL, shared=True
+    )
+
     @classmethod
     def from_state(cls, state: Mapping[str, Any]) -> 'WorkspaceManager':
         instance = state[cls.STATE_KEY]
@@ -618,6 +906,20 @@ class WorkspaceManager:
         self._provisioning_client: AsyncStorageClient | None = None
         self._workspace: _Workspace | None = None
         self._table_info_cache: dict[str, DbTableInfo] = {}
+        # table ID -> the lastImportDate of the table when its info was resolved, see `execute_query_stream()`
+        self._table_import_dates: dict[str, str | None] = {}
+        self._workspace_cache_key: _WspCacheKey | None = None
+
+    async def _get_workspace_cache_key(self) -> _WspCacheKey:
+        if self._workspace_cache_key is None:
+            self._workspace_cache_key = (
+                self._client.storage_api_url,
+                await self._client.get_project_id(),
+                self._client.branch_id,
+                self._workspace_schema,
+                token_fingerprint(self._client.bearer_token or self._client.token) if self._workspace_schema else None,
+            )
+        return self._workspace_cache_key
 
     async def _provisioning_storage_client(self) -> AsyncStorageClient:
         """
@@ -688,11 +990,20 @@ class WorkspaceManager:
         read access to the MCP component's own configs — no project-wide workspace
         listing, no branch-metadata pointer, and therefore no elevated metadata write
         that a read-only user's token would be denied.
+
+        The configurations are looked up concurrently, but the workspace of the first configuration in the listing
+        order wins, so that all sessions keep using the same workspace.
         """
         component_id = self.MCP_WORKSPACE_COMPONENT_ID
-        for config in await self._client.storage_client.configuration_list(component_id):
-            config_id = str(config['id'])
-            for sapi_wsp_info in await self._client.storage_client.workspace_list_for_config(component_id, config_id):
+        configs = await self._client.storage_client.configuration_list(component_id)
+        semaphore = asyncio.Semaphore(self.WORKSPACE_LOOKUP_CONCURRENCY)
+
+        async def _list_workspaces(config: JsonDict) -> list[JsonDict]:
+            async with semaphore:
+                return await self._client.storage_client.workspace_list_for_config(component_id, str(config['id']))
+
+        for sapi_wsp_infos in await asyncio.gather(*(_list_workspaces(config) for config in configs)):
+            for sapi_wsp_info in sapi_wsp_infos:
                 assert isinstance(sapi_wsp_info, dict)
                 info = _WspInfo.from_sapi_info(sapi_wsp_info)
                 if info.id and info.backend and info.schema and info.readonly:
@@ -713,7 +1024,7 @@ class WorkspaceManager:
         """
 
         # Verify token before creating workspace to ensure it has proper permissions
-        token_info = await self._client.storage_client.verify_token()
+        token_info = await self._client.get_token_info()
 
         # Check for defaultBackend parameter in token info under owner object
         owner_info = token_info.get('owner', {})
@@ -763,6 +1074,7 @@ class WorkspaceManager:
 
         job_id = resp['id']
         start_ts = time.perf_counter()
+        poll_interval = self.WORKSPACE_JOB_POLL_INITIAL_INTERVAL
         LOG.info(f'Requested new workspace: job_id={job_id}, timeout={timeout_sec:.2f} seconds')
 
         while True:
@@ -792,7 +1104,8 @@ class WorkspaceManager:
 
             else:
                 remaining_time = max(0.0, timeout_sec - duration)
-                await asyncio.sleep(min(5.0, remaining_time))
+                await asyncio.sleep(min(poll_interval, remaining_time))
+                poll_interval = min(poll_interval * 2, self.WORKSPACE_JOB_POLL_MAX_INTERVAL)
 
     def _init_workspace(self, info: _WspInfo) -> _Workspace:
         """Creates a new `Workspace` instance based on the workspace info."""
@@ -820,14 +1133,21 @@ class WorkspaceManager:
         if self._workspace:
             return self._workspace
 
+        # Concurrent sessions of the same project branch await a single lookup, so at most one workspace
+        # is provisioned per process when none exists yet.
+        cache_key = await self._get_workspace_cache_key()
+        info = await self._workspace_info_cache.get_or_load(cache_key, self._resolve_workspace)
+        self._workspace = self._init_workspace(info)
+        return self._workspace
+
+    async def _resolve_workspace(self) -> _WspInfo:
         if self._workspace_schema:
             # use the workspace that was explicitly requested
             # this workspace must never be written to the default branch metadata
             LOG.info(f'Looking up workspace by schema: {self._workspace_schema}')
             if info := await self._find_ws_by_schema(self._workspace_schema):
                 LOG.info(f'Found workspace: {info}')
-                self._workspace = self._init_workspace(info)
-                return self._workspace
+                return info
             else:
                 raise ValueError(
                     f'No Keboola workspace found or the workspace has no read-only storage access: '
@@ -838,8 +1158,7 @@ class WorkspaceManager:
         if info := await self._find_ws_in_branch():
             # use the workspace that has already been created by the MCP server and noted to the branch
             LOG.info(f'Found workspace: {info}')
-            self._workspace = self._init_workspace(info)
-            return self._workspace
+            return info
 
         # create a new workspace under the MCP component
         LOG.info('Creating workspace in the default branch.')
@@ -847,13 +1166,25 @@ class WorkspaceManager:
             # All tokens share the same read-only workspace, rediscovered by its
             # component id (see _find_ws_in_branch) — no branch-metadata pointer is
             # written, so no elevated metadata write is needed. Concurrent first-use
-            # may create more than one workspace; that is acceptable, _find_ws_in_branch
-            # returns the first match on the next lookup.
-            self._workspace = self._init_workspace(info)
-            return self._workspace
+            # within this process is coalesced in _get_workspace; other server replicas
+            # may still create more than one workspace, that is acceptable,
+            # _find_ws_in_branch returns the first match on the next lookup.
+            return info
         else:
             raise ValueError('Failed to initialize Keboola Workspace.')
 
+    async def _invalidate_workspace(self) -> None:
+        """
+        Forgets the workspace used by this manager, including its process-wide cache entry, so that the next call
+        looks the workspace up again.
+        """
+        if self._workspace:
+            LOG.info(f'Invalidating cached workspace: {self._workspace.id}')
+        self._workspace_info_cache.pop(await self._get_workspace_cache_key())
+        self._workspace = None
+        self._table_info_cache.clear()
+        self._table_import_dates.clear()
+
     async def execute_query(
         self,
         sql_query: str,
@@ -861,19 +1192,173 @@ class WorkspaceManager:
         max_rows: int | None = None,
         max_chars: int | None = None,
         on_job_submitted: JobSubmittedCallback | None = None,
+        use_cache: bool = False,
     ) -> QueryResult:
+        if use_cache:
+            result = await self.execute_query_stream(
+                sql_query,
+                max_rows=max_rows,
+                max_chars=max_chars,
+                on_job_submitted=on_job_submitted,
+                use_cache=True,
+            )
+            return await result.collect()
+
         workspace = await self._get_workspace()
-        return await workspace.execute_query(
-            sql_query,
-            max_rows=max_rows,
-            max_chars=max_chars,
-            on_job_submitted=on_job_submitted,
-        )
+        try:
+            return await workspace.execute_query(
+                sql_query,
+                max_rows=max_rows,
+                max_chars=max_chars,
+                on_job_submitted=on_job_submitted,
+            )
+        except HTTPStatusError as e:
+            await self._on_query_http_error(e)
+            raise
+
+    async def execute_query_stream(
+        self,
+        sql_query: str,
+        *,
+        max_rows: int | None = None,
+        max_chars: int | None = None,
+        on_job_submitted: JobSubmittedCallback | None = None,
+        use_cache: bool = False,
+    ) -> QueryResultStream:
+        """
+        Runs a given SQL query in the workspace, see :meth:`_Workspace.execute_query_stream`.
+
+        :param use_cache: If True, the result of a read-only query is taken from the process-wide query cache
+            when the same query with the same limits has already been run by the same token in the same workspace
+            and branch, and none of the tables it reads has been imported to since. A fresh result is cached once
+            the returned stream has been fully iterated. The `on_job_submitted` callback is not invoked for a cached
+            result.
+        """
+        workspace = await self._get_workspace()
+
+        cache_key: _QueryCacheKey | None = None
+        last_import_dates: Mapping[str, str | None] | None = None
+        if use_cache and (cacheable := self._parse_cacheable_query(workspace, sql_query)):
+            normalized_sql, table_ids = cacheable
+            cache_key = (
+                self._client.storage_api_url,
+                token_fingerprint(self._client.bearer_token or self._client.token),
+                workspace.id,
+                self._client.branch_id,
+                normalized_sql,
+                max_rows,
+                max_chars,
+            )
+            # The import dates seen when the tables were resolved cost no requests. They can only be older than
+            # the data the query reads, which makes the cached result fail the check below, never pass it wrongly.
+            last_import_dates = {table_id: self._table_import_dates.get(table_id) for table_id in table_ids}
+            if (cached := self._query_result_cache.get(cache_key)) is not None:
+                # Only a cached result is checked against the current import dates of its tables.
+                current_import_dates = await self._get_last_import_dates(table_ids)
+                if current_import_dates is None:
+                    cache_key = None
+                elif current_import_dates == cached.last_import_dates:
+                    LOG.info(f'Returning cached query result: workspace_id={workspace.id}')
+                    return cached.to_stream()
+                else:
+                    last_import_dates = current_import_dates
+
+        try:
+            result = await workspace.execute_query_stream(
+                sql_query,
+                max_rows=max_rows,
+                max_chars=max_chars,
+                on_job_submitted=on_job_submitted,
+            )
+        except HTTPStatusError as e:
+            await self._on_query_http_error(e)
+            raise
+
+        if cache_key is not None and last_import_dates is not None and result.is_ok and result.columns:
+            result = self._cache_when_consumed(result, cache_key, last_import_dates)
+        return result
+
+    def _parse_cacheable_query(self, workspace: _Workspace, sql_query: str) -> tuple[str, list[str]] | None:
+        """
+        Normalizes a read-only query and resolves the IDs of the Storage tables it reads.
+
+        :return: The normalized SQL and the table IDs, or None if the query must not be cached: it cannot be parsed,
+            it is not a single SELECT query, it calls a volatile function or it reads a table that has not been
+            resolved by :meth:`get_table_info` and whose imports therefore cannot be tracked.
+        """
+        dialect = workspace.get_sql_dialect().lower()
+        try:
+            statements = sqlglot.parse(sql_query, read=dialect)
+        except sqlglot.errors.SqlglotError:
+            return None
+        if len(statements) != 1 or not isinstance(query := statements[0], exp.Query):
+            return None
+        if query.find(*_VOLATILE_SQL_FUNCTIONS):
+            return None
+
+        table_ids_by_fqn = {
+            (info.fqn.db_name, info.fqn.schema_name, info.fqn.table_name): info.id
+            for info in self._table_info_cache.values()
+        }
+        cte_names = {cte.alias_or_name for cte in query.find_all(exp.CTE)}
+        table_ids: set[str] = set()
+        for table in query.find_all(exp.Table):
+            if not table.db and table.name in cte_names:
+                continue
+            if (table_id := table_ids_by_fqn.get((table.catalog, table.db, table.name))) is None:
+                return None
+            table_ids.add(table_id)
+
+        return query.sql(dialect=dialect), sorted(table_ids)
+
+    async def _get_last_import_dates(self, table_ids: Sequence[str]) -> Mapping[str, str | None] | None:
+        """Gets the current `lastImportDate` of the tables, or None if any of the tables cannot be looked up."""
+        try:
+            tables = await asyncio.gather(*(self._client.storage_client.table_detail(tid) for tid in table_ids))
+        except Exception as e:
+            LOG.debug(f'Failed to look up the tables of a cacheable query: {e}')
+            return None
+        return {tid: table.get('lastImportDate') for tid, table in zip(table_ids, tables)}
+
+    def _cache_when_consumed(
+        self, result: QueryResultStream, cache_key: _QueryCacheKey, last_import_dates: Mapping[str, str | None]
+    ) -> QueryResultStream:
+        """
+        Passes the result pages through and caches the selected rows once all the pages have been iterated.
+        Nothing is cached when the iteration stops early or the rows exceed `QUERY_CACHE_MAX_RESULT_CHARS`.
+        """
+
+        async def _pages() -> AsyncGenerator[list[list[Any]], None]:
+            values: list[list[Any]] | None = []
+            chars_count = 0
+            async with contextlib.aclosing(result.pages()) as pages:
+                async for page in pages:
+                    if values is not None:
+                        chars_count += sum(len(str(v)) for row in page for v in row if v is not None)
+                        if chars_count <= self.QUERY_CACHE_MAX_RESULT_CHARS:
+                            values.extend(page)
+                        else:
+                            values = None
+                    yield page
+
+            if values is not None:
+                cached = _CachedQueryResult(
+                    result.status, result.query_message, result.columns, result.total_rows, values, last_import_dates
+                )
+                self._query_result_cache.put(cache_key, cached)
+
+        return result.with_pages(_pages())
+
+    async def _on_query_http_error(self, error: HTTPStatusError) -> None:
+        # The workspace may have been deleted or its credentials revoked since it was cached.
+        if error.response.status_code in self._WORKSPACE_REJECTED_STATUS_CODES:
+            await self._invalidate_workspace()
 
     async def get_table_info(self, table: Mapping[str, Any]) -> DbTableInfo | None:
         # Whether an alias table is queryable depends on the backend (Snowflake materializes aliases
         # from linked buckets, BigQuery does not), so each workspace implementation makes that call.
         table_id = table['id']
+        self._table_import_dates[table_id] = table.get('lastImportDate')
         if table_id in self._table_info_cache:
             return self._table_info_cache[table_id]
 
@@ -1,3 +1,4 @@
+import asyncio
 import importlib.metadata
 import json
 from collections.abc import Mapping
@@ -8,8 +9,9 @@ import httpx
 import pytest
 from pytest_mock import MockerFixture
 
-from keboola_mcp_server.clients.base import RawKeboolaClient
-from keboola_mcp_server.clients.client import KeboolaClient, get_metadata_property
+from keboola_mcp_server.cache import token_fingerprint
+from keboola_mcp_server.clients.base import HttpConnectionPool, RawKeboolaClient
+from keboola_mcp_server.clients.client import KeboolaClient, MetadataIndex, get_metadata_property
 from keboola_mcp_server.clients.storage import AsyncStorageClient
 from keboola_mcp_server.config import ServerRuntimeInfo
 from keboola_mcp_server.mcp import SessionStateMiddleware
@@ -173,6 +175,80 @@ class TestRawKeboolaClient:
             assert '\\u010c' not in content_str
 
 
+class TestHttpConnectionPool:
+    @pytest.mark.asyncio
+    async def test_open_installs_and_closes_pool(self):
+        assert HttpConnectionPool.current() is None
+        async with HttpConnectionPool.open() as pool:
+            assert HttpConnectionPool.current() is pool
+            async with HttpConnectionPool.open() as nested:
+                assert nested is pool
+            assert HttpConnectionPool.current() is pool
+        assert HttpConnectionPool.current() is None
+
+        # The overlapping opens exiting out of order keep the pool until the last of them exits.
+        first, second = HttpConnectionPool.open(), HttpConnectionPool.open()
+        pool = await first.__aenter__()
+        assert await second.__aenter__() is pool
+        await first.__aexit__(None, None, None)
+        assert HttpConnectionPool.current() is pool
+        await second.__aexit__(None, None, None)
+        assert HttpConnectionPool.current() is None
+
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_client_per_host(self):
+        timeout = httpx.Timeout(5.0)
+        retry = RawKeboolaClient(base_api_url='https://api.example.com', api_token=None)._retry
+        async with HttpConnectionPool.open() as pool:
+            client = pool.get_client('https://connection.keboola.com/v2/storage', timeout=timeout, retry=retry)
+            assert pool.get_client('https://connection.keboola.com/v2/other', timeout=timeout, retry=retry) is client
+            assert pool.get_client('https://query.keboola.com/api/v1', timeout=timeout, retry=retry) is not client
+            assert (
+                pool.get_client('https://connection.keboola.com', timeout=httpx.Timeout(60.0), retry=retry)
+                is not client
+            )
+
+            # The shared client keeps no cookies, which would leak between the tokens.
+            request = httpx.Request('GET', 'https://connection.keboola.com/v2/storage')
+            client.cookies.extract_cookies(
+                httpx.Response(200, headers={'Set-Cookie': 'session=abc; Path=/'}, request=request)
+            )
+            assert not client.cookies
+
+            # The requests wait for a free pooled connection as long as for the response.
+            slow_client = pool.get_client(
+                'https://connection.keboola.com',
+                timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
+                retry=retry,
+            )
+            assert slow_client.timeout == httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=60.0)
+
+        # Closing the pool closes the pooled clients.
+        assert client.is_closed
+        assert slow_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_pooled_requests_keep_per_client_auth_headers(self, mocker: MockerFixture):
+        seen_tokens: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_tokens.append(request.headers.get('X-StorageAPI-Token'))
+            return httpx.Response(200, json={'ok': True})
+
+        async with HttpConnectionPool.open() as pool:
+            pooled = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            get_client = mocker.patch.object(pool, 'get_client', return_value=pooled)
+            client_a = RawKeboolaClient(base_api_url='https://connection.keboola.com/v2/storage', api_token='token-a')
+            client_b = RawKeboolaClient(base_api_url='https://connection.keboola.com/v2/storage', api_token='token-b')
+
+            assert await client_a.get('tokens/verify') == {'ok': True}
+            assert await client_b.get('tokens/verify') == {'ok': True}
+            assert pooled.is_closed is False
+
+        assert seen_tokens == ['token-a', 'token-b']
+        assert get_client.call_count == 2
+
+
 class TestAsyncStorageClient:
     @pytest.fixture
     def storage_client(self, mocker: MockerFixture) -> AsyncStorageClient:
@@ -479,6 +555,81 @@ class TestKeboolaClient:
         assert headers.get('X-StorageAPI-Token') == 'sapi_token_456'
         assert 'Authorization' not in headers
 
+    @pytest.mark.asyncio
+    async def test_token_info_is_fetched_once_per_token(self, mocker: MockerFixture) -> None:
+        verify_token = mocker.patch.object(
+            AsyncStorageClient,
+            'verify_token',
+            autospec=True,
+            return_value={'owner': {'id': 4214, 'features': ['global-search']}},
+        )
+        client = KeboolaClient(storage_api_url='https://connection.keboola.com', storage_api_token='sapi_token_456')
+        # A client for another branch but with the same token shares the cached response.
+        other_client = KeboolaClient(
+            storage_api_url='https://connection.keboola.com', storage_api_token='sapi_token_456', branch_id='123'
+        )
+
+        token_info, project_id, other_token_info = await asyncio.gather(
+            client.get_token_info(), client.get_project_id(), other_client.get_token_info()
+        )
+
+        assert project_id == '4214'
+        assert await other_client.has_feature('global-search') is True
+        verify_token.assert_awaited_once()
+        # Each call gets its own copy of the cached response.
+        token_info['owner']['id'] = 1
+        assert other_token_info['owner']['id'] == 4214
+        assert (await client.get_token_info())['owner']['id'] == 4214
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ('storage_token', 'bearer_token', 'invalidated', 'expected_calls'),
+        [
+            ('sapi_token_456', None, (), 1),
+            ('sapi_token_789', None, (), 2),
+            ('sapi_token_789', 'oauth_bearer_123', (), 1),
+            ('sapi_token_789', 'oauth_bearer_456', (), 2),
+            ('sapi_token_456', None, ('sapi_token_456',), 2),
+            ('sapi_token_456', None, ('sapi_token_789',), 1),
+            ('sapi_token_789', 'oauth_bearer_123', ('oauth_bearer_123',), 2),
+        ],
+        ids=[
+            'same_token',
+            'other_token',
+            'same_bearer',
+            'other_bearer',
+            'invalidated',
+            'other_invalidated',
+            'bearer_invalidated',
+        ],
+    )
+    async def test_token_info_is_cached_per_token(
+        self,
+        mocker: MockerFixture,
+        storage_token: str,
+        bearer_token: str | None,
+        invalidated: tuple[str, ...],
+        expected_calls: int,
+    ) -> None:
+        verify_token = mocker.patch.object(
+            AsyncStorageClient, 'verify_token', autospec=True, return_value={'owner': {'id': 4214}}
+        )
+        first_bearer = 'oauth_bearer_123' if bearer_token == 'oauth_bearer_123' else None
+        first_client = KeboolaClient(
+            storage_api_url='https://connection.keboola.com',
+            storage_api_token='sapi_token_456',
+            bearer_token=first_bearer,
+        )
+        second_client = KeboolaClient(
+            storage_api_url='https://connection.keboola.com', storage_api_token=storage_token, bearer_token=bearer_token
+        )
+
+        await first_client.get_project_id()
+        KeboolaClient.invalidate_token_info({token_fingerprint(token) for token in invalidated})
+        await second_client.get_project_id()
+
+        assert verify_token.await_count == expected_calls
+
 
 def test_flow_schema_cache_roundtrip():
     client = KeboolaClient(
@@ -688,6 +839,18 @@ def test_flow_schema_cache_roundtrip():
             None,
             'With provider',
         ),
+        # The first of the equally recent entries
+        (
+            [
+                {'key': 'description', 'value': 'First', 'timestamp': '2024-01-01T00:00:00Z'},
+                {'key': 'description', 'value': 'Second', 'timestamp': '2024-01-01T00:00:00Z'},
+            ],
+            'description',
+            None,
+            None,
+            None,
+            'First',
+        ),
     ],
     ids=[
         'basic_retrieval_by_key',
@@ -703,6 +866,7 @@ def test_flow_schema_cache_roundtrip():
         'none_value_returns_default',
         'combined_provider_and_timestamp',
         'no_provider_in_metadata',
+        'first_of_equally_recent',
     ],
 )
 def test_get_metadata_property(
@@ -713,7 +877,7 @@ def test_get_metadata_property(
     default: Any,
     expected: Any,
 ):
-    """Test get_metadata_property with various scenarios."""
+    """Test get_metadata_property and MetadataIndex with various scenarios."""
     result = get_metadata_property(
         metadata=metadata,
         key=key,
@@ -723,6 +887,9 @@ def test_get_metadata_property(
     )
     assert result == expected
 
+    index = MetadataIndex(metadata)
+    assert index.get(key, provider=provider, preferred_providers=preferred_providers, default=default) == expected
+
 
 class TestStepUpStorageClient:
     """
@@ -48,6 +48,8 @@ WRITE_CALLS: list[WriteCall] = [_create_config, _update_config, _create_row, _up
 @pytest.fixture
 def raw_client(mocker: MockerFixture) -> RawKeboolaClient:
     raw = mocker.AsyncMock(RawKeboolaClient)
+    raw.base_api_url = 'https://connection.test.keboola.com/v2/storage'
+    raw.headers = {'X-StorageAPI-Token': 'test-token'}
     raw.post.return_value = {'id': 'config-1', 'version': 1}
     raw.put.return_value = {'id': 'config-1', 'version': 2}
     # used by project_id() -> GET tokens/verify
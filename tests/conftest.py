@@ -3,6 +3,7 @@ from fastmcp import Context
 from mcp.server.session import ServerSession
 from mcp.shared.context import RequestContext
 
+from keboola_mcp_server.cache import clear_shared_caches
 from keboola_mcp_server.clients.ai_service import AIServiceClient
 from keboola_mcp_server.clients.base import RawKeboolaClient
 from keboola_mcp_server.clients.client import KeboolaClient
@@ -16,6 +17,14 @@ from keboola_mcp_server.mcp import CONVERSATION_ID, ServerState
 from keboola_mcp_server.workspace import WorkspaceManager
 
 
+@pytest.fixture(autouse=True)
+def _clear_process_caches():
+    """Keeps the process-wide caches from leaking the mocked API responses between tests."""
+    clear_shared_caches()
+    yield
+    clear_shared_caches()
+
+
 @pytest.fixture
 def keboola_client(mocker) -> KeboolaClient:
     """Creates mocked `KeboolaClient` instance with mocked sub-clients."""
@@ -35,6 +44,7 @@ def keboola_client(mocker) -> KeboolaClient:
     # Mock API clients
     client.storage_client = mocker.AsyncMock(AsyncStorageClient)
     client.storage_client.project_id.return_value = '69420'
+    client.get_project_id.return_value = '69420'
     client.jobs_queue_client = mocker.AsyncMock(JobsQueueClient)
     client.ai_service_client = mocker.AsyncMock(AIServiceClient)
     client.scheduler_client = mocker.AsyncMock(SchedulerClient)
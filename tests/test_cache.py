@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+from keboola_mcp_server.cache import TtlCache, clear_shared_caches, token_fingerprint
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_fingerprint():
+    assert token_fingerprint(None) is None
+    assert token_fingerprint('') is None
+    assert token_fingerprint('secret') == token_fingerprint('secret')
+    assert token_fingerprint('secret') != token_fingerprint('other')
+    assert 'secret' not in token_fingerprint('secret')
+
+
+@pytest.mark.parametrize(
+    ('elapsed', 'read_at', 'expected'),
+    [(0.0, None, 1), (59.9, None, 1), (60.0, None, None), (100.0, None, None), (60.0, 30.0, None)],
+    ids=['fresh', 'before_ttl', 'at_ttl', 'after_ttl', 'read_does_not_extend_ttl'],
+)
+def test_ttl_cache_expires_entries(elapsed: float, read_at: float | None, expected: int | None):
+    timer = FakeTimer()
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl=60, timer=timer)
+    cache.put('a', 1)
+    if read_at is not None:
+        timer.now = read_at
+        assert cache.get('a') == 1
+
+    timer.now = elapsed
+    assert cache.get('a') == expected
+    assert len(cache) == (1 if expected is not None else 0)
+
+
+@pytest.mark.parametrize(
+    ('accessed', 'expected'),
+    [
+        ([], {'a': None, 'b': 2, 'c': 3}),
+        (['a'], {'a': 1, 'b': None, 'c': 3}),
+        (['b'], {'a': None, 'b': 2, 'c': 3}),
+        (['b', 'a'], {'a': 1, 'b': None, 'c': 3}),
+        (['a', 'b'], {'a': None, 'b': 2, 'c': 3}),
+    ],
+    ids=['no_access', 'first_accessed', 'second_accessed', 'both_first_last', 'both_second_last'],
+)
+def test_ttl_cache_evicts_least_recently_used(accessed: list[str], expected: dict[str, int | None]):
+    cache: TtlCache[str, int] = TtlCache(max_size=2, ttl=60)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    for key in accessed:
+        assert cache.get(key) is not None
+    cache.put('c', 3)
+
+    assert {key: cache.get(key) for key in expected} == expected
+
+
+def test_ttl_cache_pop_matching():
+    cache: TtlCache[tuple[str, int], int] = TtlCache(max_size=10, ttl=60)
+    cache.put(('x', 1), 1)
+    cache.put(('x', 2), 2)
+    cache.put(('y', 1), 3)
+
+    assert cache.pop_matching(lambda k: k[0] == 'x') == 2
+    assert cache.pop(('y', 1)) == 3
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize(('shared', 'expected_size'), [(True, 0), (False, 1)], ids=['shared', 'not_shared'])
+def test_clear_shared_caches(shared: bool, expected_size: int):
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl=60, shared=shared)
+    cache.put('a', 1)
+
+    clear_shared_caches()
+
+    assert len(cache) == expected_size
+
+
+@pytest.mark.parametrize(('max_size', 'ttl'), [(0, 60), (10, 0)])
+def test_ttl_cache_invalid_settings(max_size: int, ttl: float):
+    with pytest.raises(ValueError):
+        TtlCache(max_size=max_size, ttl=ttl)
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_coalesces_concurrent_loads():
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl=60)
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*[cache.get_or_load('key', loader) for _ in range(5)])
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert await cache.get_or_load('key', loader) == 42
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_does_not_cache_failures():
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl=60)
+    attempts = 0
+
+    async def loader() -> int:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise RuntimeError('boom')
+        return 7
+
+    with pytest.raises(RuntimeError, match='boom'):
+        await cache.get_or_load('key', loader)
+    assert await cache.get_or_load('key', loader) == 7
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_get_or_load_survives_cancelled_caller():
+    cache: TtlCache[str, int] = TtlCache(max_size=10, ttl=60)
+    started = asyncio.Event()
+
+    async def loader() -> int:
+        started.set()
+        await asyncio.sleep(0.01)
+        return 1
+
+    first = asyncio.create_task(cache.get_or_load('key', loader))
+    await started.wait()
+    second = asyncio.create_task(cache.get_or_load('key', loader))
+    first.cancel()
+
+    assert await second == 1
+    assert cache.get('key') == 1
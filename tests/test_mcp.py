@@ -1,14 +1,16 @@
 import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import httpx
 import pytest
 from fastmcp import Context
 from fastmcp.exceptions import ToolError
 from pydantic import BaseModel, Field
 from starlette.requests import Request
 
+from keboola_mcp_server.cache import token_fingerprint
 from keboola_mcp_server.clients.auth_bridge import is_programmatic_token
 from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.config import Config, ServerRuntimeInfo
@@ -385,7 +387,7 @@ class TestToolsFilteringMiddleware:
     ) -> None:
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
         keboola_client.branch_id = branch_id
-        keboola_client.storage_client.verify_token = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
+        keboola_client.get_token_info = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
 
         data_app_tools = [
             'modify_streamlit_data_app',
@@ -435,7 +437,7 @@ class TestToolsFilteringMiddleware:
         visible_tools: set[str],
     ) -> None:
         keboola_client.bearer_token = bearer_token
-        keboola_client.storage_client.verify_token = AsyncMock(
+        keboola_client.get_token_info = AsyncMock(
             return_value={'owner': {'features': []}, 'admin': {'role': token_role}}
         )
 
@@ -491,7 +493,7 @@ class TestToolsFilteringMiddleware:
         expect_error: bool,
     ) -> None:
         keboola_client.bearer_token = bearer_token
-        keboola_client.storage_client.verify_token = AsyncMock(
+        keboola_client.get_token_info = AsyncMock(
             return_value={'owner': {'features': []}, 'admin': {'role': token_role}}
         )
 
@@ -536,7 +538,7 @@ class TestToolsFilteringMiddleware:
     ) -> None:
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
         keboola_client.branch_id = branch_id
-        keboola_client.storage_client.verify_token = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
+        keboola_client.get_token_info = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
 
         tool = _tool(tool_name)
         mcp_context_client.fastmcp = SimpleNamespace(get_tool=AsyncMock(return_value=tool))
@@ -579,7 +581,7 @@ class TestToolsFilteringMiddleware:
         expect_filtered: bool,
     ) -> None:
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
-        keboola_client.storage_client.verify_token = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
+        keboola_client.get_token_info = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
         keboola_client.metastore_client.list_objects = AsyncMock(
             return_value=[MagicMock()] if has_semantic_models else []
         )
@@ -633,7 +635,7 @@ class TestToolsFilteringMiddleware:
         expect_error: bool,
     ) -> None:
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
-        keboola_client.storage_client.verify_token = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
+        keboola_client.get_token_info = AsyncMock(return_value={'owner': {'features': []}, 'admin': {}})
         keboola_client.metastore_client.list_objects = AsyncMock(
             return_value=[MagicMock()] if has_semantic_models else []
         )
@@ -740,6 +742,94 @@ class TestSessionStateMiddleware:
         # a client's initial tools/list fetch must be fast; see create_session_state's docstring.
         assert captured_skip_token_exchange == [expected_skip_token_exchange]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ('storage_token', 'error', 'expected_calls', 'token_info_invalidated'),
+        [
+            ('test-token', None, 1, False),
+            ('test-token', ValueError('unrelated failure'), 1, False),
+            # e.g. a missing table, which does not invalidate the session state
+            (
+                'test-token',
+                httpx.HTTPStatusError('Not Found', request=MagicMock(), response=MagicMock(status_code=404)),
+                1,
+                False,
+            ),
+            (
+                'test-token',
+                httpx.HTTPStatusError('Unauthorized', request=MagicMock(), response=MagicMock(status_code=401)),
+                2,
+                True,
+            ),
+            ('test-token', ToolError('wrapped'), 1, False),
+            # The Storage token exchanged for a programmatic token would outlive its revocation.
+            ('kbc_pat_test-token', None, 2, False),
+        ],
+        ids=['success', 'other_error', 'http_404', 'http_401', 'tool_error_without_http_cause', 'programmatic_token'],
+    )
+    async def test_on_request_caches_session_state(
+        self, storage_token: str, error: Exception | None, expected_calls: int, token_info_invalidated: bool
+    ):
+        config = Config(storage_api_url='https://connection.test.keboola.com', storage_token=storage_token)
+        server_state = ServerState(config=config, runtime_info=ServerRuntimeInfo(transport='stdio'))
+
+        ctx = MagicMock(spec=Context)
+        ctx.session = SimpleNamespace(state={})
+        ctx.request_context.lifespan_context = server_state
+        context = SimpleNamespace(method='tools/call', fastmcp_context=ctx)
+
+        async def call_next(_):
+            if error:
+                raise error
+            return 'result'
+
+        create_session_state = AsyncMock(return_value={'client': 'cached'})
+        middleware = SessionStateMiddleware()
+
+        with (
+            patch.object(middleware, 'create_session_state', create_session_state),
+            patch('keboola_mcp_server.mcp.get_http_request_or_none', return_value=None),
+            patch.object(KeboolaClient, 'invalidate_token_info') as invalidate_token_info,
+        ):
+            for _ in range(2):
+                if error:
+                    with pytest.raises(type(error)):
+                        await middleware.on_request(context, call_next)
+                else:
+                    assert await middleware.on_request(context, call_next) == 'result'
+                assert ctx.session.state == {'client': 'cached', 'conversation_id': None}
+
+        assert create_session_state.await_count == expected_calls
+        # The rejected token's cached token information is dropped together with its session state.
+        expected_invalidations = [call({token_fingerprint(storage_token)})] * 2 if token_info_invalidated else []
+        assert invalidate_token_info.call_args_list == expected_invalidations
+
+    @pytest.mark.asyncio
+    async def test_on_request_does_not_share_session_state_across_tokens(self):
+        server_state = ServerState(
+            config=Config(storage_api_url='https://connection.test.keboola.com'),
+            runtime_info=ServerRuntimeInfo(transport='stdio'),
+        )
+        ctx = MagicMock(spec=Context)
+        ctx.session = SimpleNamespace(state={})
+        ctx.request_context.lifespan_context = server_state
+        context = SimpleNamespace(method='tools/call', fastmcp_context=ctx)
+
+        async def fake_create_session_state(cfg, _runtime_info, readonly=None, **_kwargs):
+            return {'token': cfg.storage_token}
+
+        async def call_next(_):
+            return ctx.session.state['token']
+
+        middleware = SessionStateMiddleware()
+        with patch.object(middleware, 'create_session_state', side_effect=fake_create_session_state) as create:
+            for token in ['token-a', 'token-b', 'token-a']:
+                http_rq = Request({'type': 'http', 'headers': [(b'x-storage-api-token', token.encode())]})
+                with patch('keboola_mcp_server.mcp.get_http_request_or_none', return_value=http_rq):
+                    assert await middleware.on_request(context, call_next) == token
+
+        assert create.await_count == 2
+
     @pytest.mark.parametrize(
         ('server_storage_api_url', 'headers', 'expected_storage_api_url'),
         [
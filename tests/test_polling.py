@@ -0,0 +1,65 @@
+import pytest
+
+from keboola_mcp_server.polling import QueryPollingStrategy
+
+
+@pytest.mark.parametrize(
+    ('recorded_durations', 'elapsed_seconds', 'expected_interval'),
+    [
+        ([], 0.0, 0.25),
+        ([], 2.5, 0.25),
+        ([], 10.0, 1.0),
+        ([], 25.0, 2.5),
+        ([], 120.0, 12.0),
+        ([], 200.0, 20.0),
+        ([], 600.0, 20.0),
+        # The check is scheduled at the expected end of the query instead of a full backoff interval later.
+        ([30.0], 29.0, 1.0),
+        ([30.0], 29.9, 0.25),
+        ([30.0], 10.0, 1.0),
+        # Once the query runs longer than expected, the regular backoff applies.
+        ([30.0], 40.0, 4.0),
+        ([10.0, 20.0], 12.0, 1.0),
+    ],
+    ids=[
+        'start',
+        'min_interval',
+        'backoff_10s',
+        'backoff_25s',
+        'backoff_120s',
+        'max_interval',
+        'max_interval_long_query',
+        'expected_end',
+        'expected_end_min_interval',
+        'backoff_before_expected_end',
+        'longer_than_expected',
+        'averaged_expected_end',
+    ],
+)
+def test_next_interval(recorded_durations: list[float], elapsed_seconds: float, expected_interval: float) -> None:
+    """Job-status polling interval must back off as the query keeps running and land on its expected end."""
+    strategy = QueryPollingStrategy()
+    for duration in recorded_durations:
+        strategy.record_query(duration)
+
+    assert strategy.next_interval(elapsed_seconds) == pytest.approx(expected_interval)
+
+
+@pytest.mark.parametrize(
+    ('recorded_durations', 'expected_duration'),
+    [([], None), ([30.0], 30.0), ([10.0, 20.0], 13.0), ([10.0, 20.0, 30.0], 18.1)],
+    ids=['no_query', 'one_query', 'two_queries', 'three_queries'],
+)
+def test_record_query_averages_durations(recorded_durations: list[float], expected_duration: float | None) -> None:
+    strategy = QueryPollingStrategy()
+    for duration in recorded_durations:
+        strategy.record_query(duration)
+
+    assert strategy.expected_duration == pytest.approx(expected_duration)
+
+
+def test_for_workspace_shares_strategy() -> None:
+    strategy = QueryPollingStrategy.for_workspace(1)
+
+    assert QueryPollingStrategy.for_workspace(1) is strategy
+    assert QueryPollingStrategy.for_workspace(2) is not strategy
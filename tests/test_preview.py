@@ -49,7 +49,7 @@ def _configure_preview_auth(mock_client, mocker, *, role='admin', features=(), b
     """
     mock_client.bearer_token = bearer_token
     mock_client.branch_id = branch_id
-    mock_client.storage_client.verify_token = mocker.AsyncMock(
+    mock_client.get_token_info = mocker.AsyncMock(
         return_value={'owner': {'features': list(features)}, 'admin': {'role': role}}
     )
 
@@ -933,7 +933,7 @@ class TestPreviewConfigDiff:
             return args[0]
 
         mock_client.storage_client.configuration_detail = mocker.AsyncMock(side_effect=mock_config_detail)
-        mock_client.storage_client.project_id = mocker.AsyncMock(return_value='test-project')
+        mock_client.get_project_id = mocker.AsyncMock(return_value='test-project')
         mock_client.encryption_client.encrypt = mocker.AsyncMock(side_effect=mock_encrypt)
         # Data app tools are allowed only on the main/production branch (branch_id=None).
         _configure_preview_auth(mock_client, mocker, role='admin', branch_id=None)
@@ -1,22 +1,63 @@
 import asyncio
+import logging
 from unittest.mock import AsyncMock, Mock, patch
 from urllib.parse import urlparse
 
 import pytest
 from httpx import HTTPStatusError, Request, Response
+from pydantic import TypeAdapter
 
 from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.clients.query import QueryServiceClient
-from keboola_mcp_server.workspace import JobSubmittedInfo, WorkspaceManager, _SnowflakeWorkspace
+from keboola_mcp_server.polling import QueryPollingStrategy
+from keboola_mcp_server.workspace import JobSubmittedInfo, SqlSelectData, WorkspaceManager, _SnowflakeWorkspace
+
+
+def test_sql_select_data_rows_are_a_lazy_dict_view() -> None:
+    data = SqlSelectData(columns=['id', 'name'], values=[[1, 'John'], [2, None]])
+
+    assert len(data.rows) == 2
+    assert data.rows == [{'id': 1, 'name': 'John'}, {'id': 2, 'name': None}]
+    assert data.rows[1] == {'id': 2, 'name': None}
+    assert data.rows[:1] == [{'id': 1, 'name': 'John'}]
+    assert data.rows != [{'id': 1, 'name': 'John'}]
+    assert SqlSelectData.from_rows(columns=data.columns, rows=data.rows) == data
+    # The rows are still accepted in the former `rows` field.
+    assert SqlSelectData(columns=data.columns, rows=data.rows) == data
+    assert TypeAdapter(SqlSelectData).validate_python({'columns': data.columns, 'rows': list(data.rows)}) == data
 
 
 @pytest.mark.parametrize(
-    ('elapsed_seconds', 'expected_interval'),
-    [(0.0, 1.0), (9.99, 1.0), (10.0, 2.0), (29.99, 2.0), (30.0, 5.0), (119.99, 5.0), (120.0, 20.0), (600.0, 20.0)],
+    ('max_rows', 'max_chars', 'rows_count', 'chars_count', 'expected'),
+    [
+        (None, None, 0, 0, 10_000),
+        (None, None, 20_000, 0, 10_000),
+        (50, None, 20, 0, 30),
+        (None, 50_000, 0, 0, 1_000),
+        (None, 50_000, 1_000, 10_000, 4_000),
+        (None, 50_000, 1_000, 20_001, 1_500),
+        (None, 50_000, 1_000, 49_000, 100),
+        (None, 50_000, 1_000, 1_000, 10_000),
+        (2_000, 50_000, 1_000, 10_000, 1_000),
+    ],
+    ids=[
+        'no_limits',
+        'no_limits_next_page',
+        'max_rows',
+        'max_chars_first_page',
+        'max_chars_short_rows',
+        'max_chars_rounded_up',
+        'max_chars_min_page',
+        'max_chars_max_page',
+        'max_rows_and_max_chars',
+    ],
 )
-def test_next_poll_interval_backs_off_over_time(elapsed_seconds: float, expected_interval: float) -> None:
-    """Job-status polling interval must back off as the query keeps running."""
-    assert _SnowflakeWorkspace._next_poll_interval(elapsed_seconds) == expected_interval
+def test_rows_to_fetch(
+    max_rows: int | None, max_chars: int | None, rows_count: int, chars_count: int, expected: int
+) -> None:
+    """With the chars limit the next pages are sized to the rows expected to fit the remaining chars."""
+    # noinspection PyProtectedMember
+    assert _SnowflakeWorkspace._rows_to_fetch(max_rows, max_chars, rows_count, chars_count) == expected
 
 
 @pytest.mark.asyncio
@@ -147,7 +188,7 @@ async def test_workspace_creation_cleans_up_config_on_failure():
     mock_storage_client = AsyncMock()
     mock_client.storage_client = mock_storage_client
 
-    mock_storage_client.verify_token.return_value = {'owner': {'defaultBackend': 'snowflake'}}
+    mock_client.get_token_info.return_value = {'owner': {'defaultBackend': 'snowflake'}}
     mock_storage_client.configuration_create.return_value = {'id': 'test-config-123', 'name': 'test'}
 
     mock_response = Mock(spec=Response)
@@ -340,6 +381,27 @@ async def test_execute_query_cancels_backend_when_cancelled_during_callback():
     qs_mock.get_job_results.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('running_polls', 'expected_polls'), [(0, 1), (2, 3)], ids=['finished', 'running'])
+async def test_execute_query_logs_status_polls(
+    running_polls: int, expected_polls: int, caplog: pytest.LogCaptureFixture, mocker
+):
+    """The number of the job status checks is logged and the query duration is learned by the polling strategy."""
+    workspace, qs_mock = _make_snowflake_workspace_with_mocked_qs(job_id='job-polls')
+    qs_mock.get_job_status.side_effect = [{'status': 'processing'}] * running_polls + [
+        {'status': 'completed', 'statements': [{'id': 'stmt-1'}]}
+    ]
+    mocker.patch.object(QueryPollingStrategy, 'MIN_INTERVAL', 0.0)
+
+    with caplog.at_level(logging.INFO, logger='keboola_mcp_server.workspace'):
+        result = await workspace.execute_query('SELECT 1')
+
+    assert result.is_ok
+    assert 'job_id=job-polls, status=completed' in caplog.text
+    assert f'status_polls={expected_polls}' in caplog.text
+    assert QueryPollingStrategy.for_workspace(1).expected_duration is not None
+
+
 def test_build_cancel_url_uses_raw_client_base_api_url():
     """build_cancel_url must produce an absolute URL clients can POST to without further assembly."""
     qs = QueryServiceClient.create(
@@ -391,7 +453,8 @@ async def test_workspace_creation_uses_step_up_client(tmp_path):
     mock_client.branch_id = None
     mock_storage_client = AsyncMock()
     mock_client.storage_client = mock_storage_client
-    mock_storage_client.verify_token.return_value = {'owner': {'id': 123, 'defaultBackend': 'snowflake'}}
+    mock_client.get_token_info.return_value = {'owner': {'id': 123, 'defaultBackend': 'snowflake'}}
+    mock_client.get_project_id.return_value = '123'
 
     mock_writer = AsyncMock()
     mock_writer.configuration_create.return_value = {'id': 'test-config-123', 'name': 'test'}
@@ -576,3 +639,161 @@ async def test_find_ws_in_branch_returns_none_when_no_mcp_workspace():
 
     manager = WorkspaceManager(mock_client)
     assert await manager._find_ws_in_branch() is None
+
+
+def _make_manager_client(project_id: str = '123', token: str = 'test-token') -> Mock:
+    mock_client = Mock(spec=KeboolaClient)
+    mock_client.storage_api_url = 'https://connection.keboola.com'
+    mock_client.token = token
+    mock_client.bearer_token = None
+    mock_client.branch_id = None
+    mock_client.storage_client = AsyncMock()
+    mock_client.get_project_id.return_value = project_id
+    mock_client.storage_client.configuration_list.return_value = [{'id': 'cfg-1'}]
+    mock_client.storage_client.workspace_list_for_config.return_value = [_wsp(3, True)]
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_find_ws_in_branch_returns_first_config_match_when_listed_concurrently():
+    """The config-scoped lookups run concurrently, yet the first matching config in the listing order wins."""
+    mock_client = _make_manager_client()
+    mock_client.storage_client.configuration_list.return_value = [{'id': 'cfg-1'}, {'id': 'cfg-2'}]
+
+    async def _list_for_config(component_id: str, config_id: str) -> list[dict]:
+        if config_id == 'cfg-1':
+            await asyncio.sleep(0.01)  # the first config answers last
+            return [_wsp(2, True)]
+        return [_wsp(3, True)]
+
+    mock_client.storage_client.workspace_list_for_config.side_effect = _list_for_config
+
+    info = await WorkspaceManager(mock_client)._find_ws_in_branch()
+
+    assert info is not None
+    assert info.id == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('first_schema', 'second_project_id', 'second_schema', 'second_token', 'expected_second_lookups'),
+    [
+        (None, '123', None, 'test-token', 0),
+        (None, '123', None, 'other-token', 0),
+        (None, '456', None, 'test-token', 1),
+        (None, '123', 'WORKSPACE_3', 'test-token', 1),
+        ('WORKSPACE_3', '123', 'WORKSPACE_3', 'test-token', 0),
+        ('WORKSPACE_3', '123', 'WORKSPACE_3', 'other-token', 1),
+    ],
+    ids=[
+        'same_project',
+        'managed_other_token',
+        'other_project',
+        'other_schema',
+        'explicit_same_token',
+        'explicit_other_token',
+    ],
+)
+async def test_workspace_resolution_is_cached_across_managers(
+    first_schema: str | None,
+    second_project_id: str,
+    second_schema: str | None,
+    second_token: str,
+    expected_second_lookups: int,
+):
+    """
+    Managers of the same project, branch and workspace schema share the resolved workspace; an explicitly
+    requested workspace is shared only by the managers of the same token.
+    """
+    first_client = _make_manager_client()
+    first_client.storage_client.workspace_list.return_value = [_wsp(3, True)]
+    second_client = _make_manager_client(second_project_id, second_token)
+    second_client.storage_client.workspace_list.return_value = [_wsp(3, True)]
+
+    assert await WorkspaceManager(first_client, first_schema).get_workspace_id() == 3
+    assert await WorkspaceManager(second_client, second_schema).get_workspace_id() == 3
+
+    def _lookups(storage_client: AsyncMock) -> int:
+        return storage_client.configuration_list.await_count + storage_client.workspace_list.await_count
+
+    assert _lookups(first_client.storage_client) == 1
+    assert _lookups(second_client.storage_client) == expected_second_lookups
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('status_code', 'invalidated'), [(404, True), (403, True), (500, False)])
+async def test_execute_query_invalidates_workspace_rejected_by_query_service(status_code: int, invalidated: bool):
+    """A workspace rejected by the Query Service is dropped from the cache and looked up again on the next call."""
+    mock_client = _make_manager_client()
+    manager = WorkspaceManager(mock_client)
+    workspace = await manager._get_workspace()
+
+    error = HTTPStatusError('rejected', request=Request('POST', 'https://query'), response=Response(status_code))
+    with patch.object(workspace, 'execute_query', AsyncMock(side_effect=error)), pytest.raises(HTTPStatusError):
+        await manager.execute_query('SELECT 1')
+
+    await manager._get_workspace()
+    await WorkspaceManager(mock_client)._get_workspace()
+    expected_lookups = 2 if invalidated else 1
+    assert mock_client.storage_client.configuration_list.await_count == expected_lookups
+
+
+def _make_provisioning_client(project_id: str = '123') -> Mock:
+    mock_client = _make_manager_client(project_id)
+    storage_client = mock_client.storage_client
+    storage_client.configuration_list.return_value = []
+    mock_client.get_token_info.return_value = {'owner': {'defaultBackend': 'snowflake'}}
+    storage_client.configuration_create.return_value = {'id': 'cfg-1'}
+    storage_client.workspace_create_for_config.return_value = {'id': 7}
+    storage_client.job_detail.return_value = {'status': 'success', 'results': {'id': 3}}
+    storage_client.workspace_detail.return_value = _wsp(3, True)
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_sessions_provision_single_workspace():
+    """Concurrent first use of a project branch creates one workspace that all the managers share."""
+    mock_client = _make_provisioning_client()
+
+    async def _slow_create(**kwargs) -> dict:
+        await asyncio.sleep(0.01)
+        return {'id': 7}
+
+    mock_client.storage_client.workspace_create_for_config.side_effect = _slow_create
+
+    ids = await asyncio.gather(*(WorkspaceManager(mock_client).get_workspace_id() for _ in range(5)))
+
+    assert ids == [3] * 5
+    mock_client.storage_client.configuration_create.assert_awaited_once()
+    mock_client.storage_client.workspace_create_for_config.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_provisioning_failure_is_not_cached():
+    mock_client = _make_provisioning_client()
+    mock_client.get_token_info.return_value = {'owner': {'defaultBackend': 'unknown'}}
+
+    results = await asyncio.gather(
+        *(WorkspaceManager(mock_client).get_workspace_id() for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+    mock_client.get_token_info.assert_awaited_once()
+
+    mock_client.get_token_info.return_value = {'owner': {'defaultBackend': 'snowflake'}}
+    assert await WorkspaceManager(mock_client).get_workspace_id() == 3
+
+
+@pytest.mark.asyncio
+async def test_workspace_creation_job_polling_backs_off_exponentially():
+    mock_client = _make_provisioning_client()
+    mock_client.storage_client.job_detail.side_effect = [{'status': 'processing'}] * 5 + [
+        {'status': 'success', 'results': {'id': 3}}
+    ]
+
+    with patch('keboola_mcp_server.workspace.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        info = await WorkspaceManager(mock_client)._create_ws()
+
+    assert info is not None
+    assert info.id == 3
+    assert [c.args[0] for c in mock_sleep.await_args_list] == [0.5, 1.0, 2.0, 4.0, 5.0]
@@ -181,6 +181,9 @@ class TestLinkSharedBucket:
     ) -> None:
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
         self._mock_link_then_detail(mocker, keboola_client, 'in.c-linked')
+        invalidate = mocker.patch(
+            'keboola_mcp_server.tools.storage.shared_buckets.invalidate_storage_caches', autospec=True
+        )
 
         result = await link_shared_bucket(
             mcp_context_client,
@@ -199,6 +202,8 @@ class TestLinkSharedBucket:
             display_name=None,
         )
         keboola_client.storage_client.bucket_detail.assert_called_once_with('in.c-linked')
+        # The new bucket shows in the cached listings right away.
+        invalidate.assert_awaited_once_with(keboola_client)
 
     async def test_accepts_integer_source_project_id(self, mocker: MockerFixture, mcp_context_client: Context) -> None:
         # Storage API project ids come back as JSON integers; the tool must not require the
@@ -16,6 +16,7 @@ from keboola_mcp_server.config import Config, MetadataField, ServerRuntimeInfo
 from keboola_mcp_server.links import Link, ProjectLinksManager
 from keboola_mcp_server.server import create_server
 from keboola_mcp_server.tools.storage.tools import (
+    BUCKET_LISTING_MIN_IDS,
     BucketCounts,
     BucketDetail,
     DescriptionUpdate,
@@ -1176,6 +1177,84 @@ async def test_get_tables(
         )
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('branch_id', 'change'),
+    [
+        (None, None),
+        ('1246948', None),
+        # A changed bucket, e.g. after an import to one of its tables, invalidates its tables' listings and details.
+        (None, 'bucket'),
+        # The description updates change neither the bucket nor the table dates, but invalidate both.
+        (None, 'descriptions'),
+    ],
+)
+async def test_get_tables_of_many_buckets(
+    branch_id: str | None,
+    change: str | None,
+    mocker: MockerFixture,
+    mcp_context_client: Context,
+    mock_update_bucket_description_response,
+) -> None:
+    """
+    Test that get_tables looks many buckets up in the bucket listing and lists their tables as one by one,
+    and that it reuses the listings and the table details until they change.
+    """
+    keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+    keboola_client.branch_id = branch_id
+    keboola_client.has_feature = mocker.AsyncMock(return_value=False)
+    buckets = _get_sapi_buckets()
+    tables = _get_sapi_tables()
+    keboola_client.storage_client.bucket_detail = mocker.AsyncMock(side_effect=_bucket_detail_side_effect)
+    keboola_client.storage_client.bucket_list = mocker.AsyncMock(side_effect=lambda **kwargs: buckets)
+    keboola_client.storage_client.bucket_table_list = mocker.AsyncMock(
+        side_effect=lambda bid, include=None, branch_id=None: [t for t in tables if t['id'].startswith(f'{bid}.')]
+    )
+    keboola_client.storage_client.table_detail = mocker.AsyncMock(side_effect=_table_detail_side_effect)
+    keboola_client.storage_client.bucket_metadata_update = mocker.AsyncMock(
+        return_value=mock_update_bucket_description_response
+    )
+    workspace_manager = WorkspaceManager.from_state(mcp_context_client.session.state)
+    workspace_manager.get_table_info = mocker.AsyncMock(return_value=None)
+    workspace_manager.get_quoted_name = mocker.AsyncMock(side_effect=lambda name: f'#{name}#')
+    workspace_manager.get_sql_dialect = mocker.AsyncMock(return_value='Snowflake')
+    bucket_ids = [f'in.c-missing-{i}' for i in range(BUCKET_LISTING_MIN_IDS - 1)] + ['in.c-foo']
+    table_ids = [f'in.c-missing-{i}.table' for i in range(BUCKET_LISTING_MIN_IDS - 1)] + ['in.c-foo.emails']
+
+    def _count_listings() -> int:
+        return sum(1 for c in keboola_client.storage_client.bucket_table_list.call_args_list if c.kwargs.get('include'))
+
+    def _count_details() -> int:
+        return sum(
+            1 for c in keboola_client.storage_client.table_detail.call_args_list if c.args[0].startswith('in.c-foo')
+        )
+
+    expected = await get_tables(mcp_context_client, ['in.c-foo'])
+    keboola_client.storage_client.bucket_detail.reset_mock()
+    keboola_client.storage_client.bucket_list.reset_mock()
+    keboola_client.storage_client.bucket_table_list.reset_mock()
+    result = await get_tables(mcp_context_client, bucket_ids)
+    await get_tables(mcp_context_client, table_ids=table_ids)
+
+    assert result == expected
+    keboola_client.storage_client.bucket_detail.assert_not_called()
+    keboola_client.storage_client.bucket_list.assert_called_with(include=['metadata'], branch_id='default')
+    # The payloads are checked against the bucket listing, the tables are not listed just for their dates.
+    assert all(c.kwargs.get('include') for c in keboola_client.storage_client.bucket_table_list.call_args_list)
+    listings, details = _count_listings(), _count_details()
+    assert listings and details
+
+    if change == 'bucket':
+        buckets[0] = buckets[0] | {'lastChangeDate': '2025-08-18T07:37:42+0200'}
+    elif change == 'descriptions':
+        await update_descriptions(mcp_context_client, [DescriptionUpdate(item_id='in.c-foo', description='Foo')])
+    await get_tables(mcp_context_client, bucket_ids)
+    await get_tables(mcp_context_client, table_ids=table_ids)
+
+    assert _count_listings() == listings * (2 if change else 1)
+    assert _count_details() == details * (2 if change else 1)
+
+
 @pytest.mark.parametrize(
     ('raw_data', 'expected_description'),
     [
@@ -1645,6 +1724,67 @@ async def test_update_descriptions_mixed_types_success(
     )
 
 
+@pytest.mark.asyncio
+async def test_update_descriptions_merges_table_and_column_updates(
+    mocker: MockerFixture, mcp_context_client, mock_update_bucket_description_response
+) -> None:
+    keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+    keboola_client.storage_client.bucket_metadata_update = mocker.AsyncMock(
+        return_value=mock_update_bucket_description_response,
+    )
+
+    async def _table_metadata_update(table_id, metadata=None, columns_metadata=None):
+        entry = {'key': MetadataField.DESCRIPTION, 'timestamp': '2024-01-01T00:00:00Z'}
+        return {
+            'metadata': [entry] if metadata else [],
+            'columnsMetadata': {column_name: [entry] for column_name in columns_metadata or {}},
+        }
+
+    keboola_client.storage_client.table_metadata_update = mocker.AsyncMock(side_effect=_table_metadata_update)
+
+    result = await update_descriptions(
+        ctx=mcp_context_client,
+        updates=[
+            DescriptionUpdate(item_id='in.c-test.table-a.col_1', description='Column 1'),
+            DescriptionUpdate(item_id='in.c-test-bucket', description='Bucket'),
+            DescriptionUpdate(item_id='invalid-path', description='Invalid'),
+            DescriptionUpdate(item_id='in.c-test.table-b', description='Table B'),
+            DescriptionUpdate(item_id='in.c-test.table-a', description='Table A'),
+            DescriptionUpdate(item_id='in.c-test.table-a.col_2', description='Column 2'),
+        ],
+    )
+
+    assert [(r.item_id, r.success) for r in result.results] == [
+        ('in.c-test.table-a.col_1', True),
+        ('in.c-test-bucket', True),
+        ('invalid-path', False),
+        ('in.c-test.table-b', True),
+        ('in.c-test.table-a', True),
+        ('in.c-test.table-a.col_2', True),
+    ]
+    assert result.successful == 5
+    assert result.failed == 1
+
+    # One request per table, with both the table and the column descriptions.
+    assert sorted(
+        keboola_client.storage_client.table_metadata_update.call_args_list, key=lambda c: c.kwargs['table_id']
+    ) == [
+        mocker.call(
+            table_id='in.c-test.table-a',
+            metadata={MetadataField.DESCRIPTION: 'Table A'},
+            columns_metadata={
+                'col_1': [{'key': MetadataField.DESCRIPTION, 'value': 'Column 1', 'columnName': 'col_1'}],
+                'col_2': [{'key': MetadataField.DESCRIPTION, 'value': 'Column 2', 'columnName': 'col_2'}],
+            },
+        ),
+        mocker.call(
+            table_id='in.c-test.table-b',
+            metadata={MetadataField.DESCRIPTION: 'Table B'},
+            columns_metadata={},
+        ),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_update_descriptions_invalid_path_error(mcp_context_client) -> None:
     """Test that invalid paths are handled gracefully."""
@@ -2040,3 +2180,65 @@ async def test_get_table_storage_branches(mocker: MockerFixture, mcp_context_cli
     keboola_client.storage_client.table_detail.assert_has_calls(
         [call('out.c-model.customers', branch_id='default'), call('out.c-model.customers', branch_id=branch_id)]
     )
+
+
+@pytest.mark.asyncio
+async def test_get_tables_looks_up_many_tables_in_bucket_listing(
+    mocker: MockerFixture, mcp_context_client: Context
+) -> None:
+    """Test that get_tables looks many tables of a bucket up in the bucket's table listings."""
+    branch_id = '35403'
+    keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+    keboola_client.branch_id = branch_id
+    keboola_client.has_feature = mocker.AsyncMock(return_value=True)
+
+    def _table(name: str, rows_count: int, **kwargs: Any) -> JsonDict:
+        return {
+            'id': f'out.c-model.{name}',
+            'name': name,
+            'displayName': name,
+            'primaryKey': [],
+            'rowsCount': rows_count,
+            'columns': ['id'],
+            'columnMetadata': {'id': [{'key': 'KBC.datatype.type', 'value': 'INT'}]},
+            'metadata': [],
+            'bucket': {'id': 'out.c-model', 'backendPath': ['KBC_USE4_3047', 'out.c-model']},
+        } | kwargs
+
+    prod_tables = [_table(f't{i}', 10) for i in range(5)] + [_table('alias', 10, sourceTable={'id': 'in.c-x.y'})]
+    branch_tables = [_table('t1', 20, metadata=[{'id': '300', 'key': 'KBC.createdBy.branch.id', 'value': branch_id}])]
+    keboola_client.storage_client.bucket_table_list = mocker.AsyncMock(
+        side_effect=lambda bid, include, branch_id: prod_tables if branch_id == 'default' else branch_tables
+    )
+
+    async def _table_detail(tid: str, branch_id: str) -> JsonDict:
+        if branch_id == 'default':
+            return prod_tables[-1]
+        raise httpx.HTTPStatusError(message='Not found', request=AsyncMock(), response=httpx.Response(status_code=404))
+
+    keboola_client.storage_client.table_detail = mocker.AsyncMock(side_effect=_table_detail)
+    workspace_manager = WorkspaceManager.from_state(mcp_context_client.session.state)
+    workspace_manager.get_table_info = mocker.AsyncMock(return_value=None)
+    workspace_manager.get_sql_dialect = mocker.AsyncMock(return_value='Snowflake')
+    workspace_manager.get_quoted_name = mocker.AsyncMock(side_effect=lambda name: f'"{name}"')
+
+    table_ids = [f'out.c-model.t{i}' for i in range(5)] + ['out.c-model.alias', 'out.c-model.missing']
+    result = await get_tables(mcp_context_client, table_ids=table_ids)
+
+    assert isinstance(result, GetTablesOutput)
+    assert [(table.id, table.rows_count) for table in result.tables] == [
+        ('out.c-model.t0', 10),
+        ('out.c-model.t1', 20),
+        ('out.c-model.t2', 10),
+        ('out.c-model.t3', 10),
+        ('out.c-model.t4', 10),
+        ('out.c-model.alias', 10),
+    ]
+    assert all(isinstance(table, TableDetail) and table.columns for table in result.tables)
+    assert result.tables_not_found == ['out.c-model.missing']
+    assert keboola_client.storage_client.bucket_table_list.call_count == 2
+    # The alias lacks the column metadata of its source table in the listing, so its detail is fetched.
+    keboola_client.storage_client.table_detail.assert_has_calls(
+        [call('out.c-model.alias', branch_id='default'), call('out.c-model.alias', branch_id=branch_id)]
+    )
+    assert keboola_client.storage_client.table_detail.call_count == 2
@@ -4,85 +4,113 @@ from typing import Any
 import pytest
 from pytest_mock import MockerFixture
 
+from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.config import MetadataField
-from keboola_mcp_server.tools.search import PatternMatch, SearchHit
 from keboola_mcp_server.tools.storage import usage as storage_usage
 
 
-def _sorted_usage(output: Sequence[storage_usage.UsageById]) -> list[storage_usage.UsageById]:
-    return sorted(output, key=lambda item: item.target_id)
-
-
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    ('hits', 'expected'),
+    ('target_ids', 'item_types', 'expected'),
     [
         (
-            [
-                SearchHit(
-                    component_id='keboola.ex-db',
-                    configuration_id='cfg-1',
-                    item_type='configuration',
-                    updated='2024-01-01T00:00:00Z',
-                    name='Config 1',
-                ).set_matches([PatternMatch(scope='storage.input', patterns=['id-1', 'id-2'])]),
-                SearchHit(
-                    component_id='keboola.ex-db',
-                    configuration_id='cfg-2',
-                    item_type='configuration',
-                    updated='2024-01-02T00:00:00Z',
-                    name='Config 2',
-                ).set_matches([PatternMatch(scope='storage.output', patterns=['id-1'])]),
-            ],
+            ['out.c-b.orders_clean'],
+            ['configuration'],
+            {'out.c-b.orders_clean': [('cfg-2', 'row-1', 'storage.input.tables[0].source')]},
+        ),
+        (
+            ['out.c-b.orders_clean'],
+            None,
             {
-                'id-1': [
-                    {
-                        'component_id': 'keboola.ex-db',
-                        'configuration_id': 'cfg-1',
-                        'configuration_row_id': None,
-                        'configuration_name': 'Config 1',
-                        'used_in': 'storage.input',
-                        'timestamp': '2024-01-01T00:00:00Z',
-                    },
-                    {
-                        'component_id': 'keboola.ex-db',
-                        'configuration_id': 'cfg-2',
-                        'configuration_row_id': None,
-                        'configuration_name': 'Config 2',
-                        'used_in': 'storage.output',
-                        'timestamp': '2024-01-02T00:00:00Z',
-                    },
-                ],
-                'id-2': [
-                    {
-                        'component_id': 'keboola.ex-db',
-                        'configuration_id': 'cfg-1',
-                        'configuration_row_id': None,
-                        'configuration_name': 'Config 1',
-                        'used_in': 'storage.input',
-                        'timestamp': '2024-01-01T00:00:00Z',
-                    }
-                ],
+                'out.c-b.orders_clean': [
+                    ('cfg-1', None, 'storage.output.tables[0].destination'),
+                    ('cfg-2', 'row-1', 'storage.input.tables[0].source'),
+                ]
             },
         ),
-        ([], {}),
+        (
+            ['in.c-a', 'in.c-a.orders'],
+            None,
+            {
+                'in.c-a': [('cfg-1', None, 'storage.input.tables[0].source')],
+                'in.c-a.orders': [('cfg-1', None, 'storage.input.tables[0].source')],
+            },
+        ),
+        # Only the mapping values equal to an ID match, not the values containing it.
+        (['in.c-a.order', 'out.c-b.orders'], None, {}),
+        (
+            ['out.c-b.orders_clean'],
+            ['transformation'],
+            {'out.c-b.orders_clean': [('cfg-1', None, 'storage.output.tables[0].destination')]},
+        ),
+        # The IDs used outside the mappings do not match.
+        (['out.c-b.orders_raw'], None, {}),
     ],
-    ids=['grouped_usage', 'empty_hits'],
+    ids=['item_types', 'all_types', 'bucket', 'substring', 'other_type', 'outside_mappings'],
 )
-async def test_find_id_usage_groups_matches(
-    mocker: MockerFixture, hits: list[SearchHit], expected: dict[str, list[dict[str, Any]]]
+async def test_find_table_usage_looks_up_lineage(
+    keboola_client: KeboolaClient,
+    mocker: MockerFixture,
+    target_ids: list[str],
+    item_types: list[str] | None,
+    expected: dict[str, list[tuple[str, str | None, str]]],
 ) -> None:
-    mocker.patch.object(storage_usage, 'fetch_configurations', autospec=True, return_value=hits)
-
-    client = mocker.Mock()
-    output = await storage_usage.find_id_usage(
-        client, target_ids=['id-1', 'id-2'], scopes=('storage.input', 'storage.output')
-    )
-    output_sorted = _sorted_usage(output)
+    keboola_client.storage_client.component_list.return_value = [
+        {
+            'id': 'keboola.snowflake-transformation',
+            'type': 'transformation',
+            'configurations': [
+                {
+                    'id': 'cfg-1',
+                    'name': 'Transformation',
+                    'version': 1,
+                    'currentVersion': {'created': '2024-01-01T00:00:00Z'},
+                    'configuration': {
+                        'storage': {
+                            'input': {'tables': [{'source': 'in.c-a.orders', 'destination': 'orders'}]},
+                            'output': {'tables': [{'source': 'out', 'destination': 'out.c-b.orders_clean'}]},
+                        }
+                    },
+                }
+            ],
+        },
+        {
+            'id': 'keboola.wr-db',
+            'type': 'writer',
+            'configurations': [
+                {
+                    'id': 'cfg-2',
+                    'name': 'Writer',
+                    'version': 1,
+                    'created': '2024-01-02T00:00:00Z',
+                    'configuration': {'parameters': {'tables': ['out.c-b.orders_raw']}},
+                    'rows': [
+                        {
+                            'id': 'row-1',
+                            'name': 'Orders',
+                            'version': 1,
+                            'configuration': {'storage': {'input': {'tables': [{'source': 'out.c-b.orders_clean'}]}}},
+                        }
+                    ],
+                }
+            ],
+        },
+    ]
 
-    output_map = {item.target_id: [ref.model_dump() for ref in item.usage_references] for item in output_sorted}
+    output = await storage_usage.find_table_usage(keboola_client, target_ids, item_types)
+    output_map = {
+        item.target_id: [(ref.configuration_id, ref.configuration_row_id, ref.used_in) for ref in item.usage_references]
+        for item in output
+    }
     assert output_map == expected
 
+    assert await storage_usage.find_table_usage(keboola_client, target_ids, item_types) == output
+    # The second lookup only checks the versions of the configurations.
+    assert keboola_client.storage_client.component_list.call_args_list == [
+        mocker.call(None, include=['configuration', 'rows']),
+        mocker.call(None),
+    ]
+
 
 @pytest.mark.parametrize(
     ('metadata', 'expected'),
@@ -818,7 +818,7 @@ async def test_modify_streamlit_data_app_folder(
     workspace_manager.get_sql_dialect = mocker.AsyncMock(return_value='snowflake')
     workspace_manager.get_branch_id = mocker.AsyncMock(return_value='default')
 
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
 
     # Dummy encrypted config
     encrypted_config = {
@@ -939,7 +939,7 @@ async def test_modify_streamlit_data_app_partial_success_when_response_building_
     workspace_manager.get_workspace_id = mocker.AsyncMock(return_value=1)
     workspace_manager.get_sql_dialect = mocker.AsyncMock(return_value='snowflake')
     workspace_manager.get_branch_id = mocker.AsyncMock(return_value='default')
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
 
     encrypted_config = {
         'parameters': {'script': ['SELECT 1']},
@@ -1082,7 +1082,7 @@ async def test_modify_streamlit_data_app_update_skips_metadata_when_version_miss
     workspace_manager.get_workspace_id = mocker.AsyncMock(return_value=1)
     workspace_manager.get_sql_dialect = mocker.AsyncMock(return_value='snowflake')
     workspace_manager.get_branch_id = mocker.AsyncMock(return_value='default')
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
 
     encrypted_config = {
         'parameters': {'script': ['SELECT 1']},
@@ -2197,7 +2197,7 @@ async def test_modify_python_js_data_app_create_draft_uses_external_git(
         side_effect=AssertionError('Should not fetch a git repo URL for a draft')
     )
 
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
 
     # Mock encryption: walk the dict and prefix `KBC::cipher::` onto any value whose key starts with '#'.
     async def fake_encrypt(value, *, project_id=None, component_id=None, config_id=None):
@@ -2285,7 +2285,7 @@ async def test_modify_python_js_data_app_create_draft_defaults_branch_to_init(
     keboola_client.data_science_client.create_data_app = mocker.AsyncMock(
         return_value=_make_python_js_data_app_response()
     )
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
     keboola_client.encryption_client = mocker.AsyncMock()
     keboola_client.encryption_client.encrypt = mocker.AsyncMock(side_effect=lambda v, **_: v)
     mocker.patch('keboola_mcp_server.tools.data_apps.set_cfg_creation_metadata', mocker.AsyncMock())
@@ -2349,7 +2349,7 @@ async def test_modify_python_js_data_app_create_draft_auto_derives_slug(
     keboola_client.data_science_client.create_data_app = mocker.AsyncMock(
         return_value=_make_python_js_data_app_response()
     )
-    keboola_client.storage_client.project_id = mocker.AsyncMock(return_value='proj-1')
+    keboola_client.get_project_id = mocker.AsyncMock(return_value='proj-1')
     keboola_client.encryption_client = mocker.AsyncMock()
     keboola_client.encryption_client.encrypt = mocker.AsyncMock(side_effect=lambda v, **_: v)
     mocker.patch('keboola_mcp_server.tools.data_apps.set_cfg_creation_metadata', mocker.AsyncMock())
@@ -147,7 +147,7 @@ async def test_get_project_info(
     ]
     keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
     keboola_client.branch_id = client_branch_id
-    keboola_client.storage_client.verify_token = mocker.AsyncMock(return_value=token_data)
+    keboola_client.get_token_info = mocker.AsyncMock(return_value=token_data)
     keboola_client.storage_client.branch_metadata_get = mocker.AsyncMock(return_value=metadata)
     keboola_client.storage_client.branches_list = mocker.AsyncMock(return_value=[_DEFAULT_BRANCH, _DEV_BRANCH])
     workspace_manager = WorkspaceManager.from_state(mcp_context_client.session.state)
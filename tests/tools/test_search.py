@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any, cast
 from unittest.mock import call
 
@@ -21,6 +22,9 @@ from keboola_mcp_server.tools.search import (
     find_component_id,
     search,
 )
+from keboola_mcp_server.tools.search_cursor import SearchCursors
+from keboola_mcp_server.tools.search_global import GlobalSearchCache
+from keboola_mcp_server.tools.search_index import TrigramIndex
 
 
 class TestSearch:
@@ -31,7 +35,7 @@ class TestSearch:
         """Disable storage-branches (no dual-fetch) and global-search (legacy textual path) features."""
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
         keboola_client.has_feature = mocker.AsyncMock(return_value=False)
-        keboola_client.storage_client.is_enabled = mocker.AsyncMock(return_value=False)
+        keboola_client.has_feature = mocker.AsyncMock(return_value=False)
 
     @pytest.mark.asyncio
     async def test_search_no_patterns(self, mcp_context_client: Context):
@@ -322,7 +326,10 @@ class TestSearch:
 
         # Verify it matches the result with offset=0
         result_with_zero_offset = await search(ctx=mcp_context_client, patterns=['test'], offset=0, limit=5)
-        assert result == result_with_zero_offset, 'Negative offset should behave the same as offset=0'
+        # The cursors differ, each page of the enumeration search keeps its own snapshot of the hits.
+        assert result.model_dump(exclude={'next_cursor'}) == result_with_zero_offset.model_dump(
+            exclude={'next_cursor'}
+        ), 'Negative offset should behave the same as offset=0'
 
     @pytest.mark.asyncio
     async def test_search_pagination(self, mocker: MockerFixture, mcp_context_client: Context):
@@ -432,6 +439,149 @@ class TestSearch:
             )
         ]
 
+    @pytest.mark.asyncio
+    async def test_search_lists_bucket_tables_concurrently(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        bucket_ids = [f'in.c-bucket-{i}' for i in range(3)]
+        keboola_client.storage_client.bucket_list = mocker.AsyncMock(
+            return_value=[{'id': bucket_id, 'name': bucket_id} for bucket_id in bucket_ids]
+        )
+
+        all_started = asyncio.Event()
+        started: list[str] = []
+
+        async def _bucket_table_list(bucket_id: str, include: Any = None, **kwargs: Any) -> list[JsonDict]:
+            started.append(bucket_id)
+            if len(started) == len(bucket_ids):
+                all_started.set()
+            # Each listing waits until all of them are in flight, so the search would hang if they ran sequentially.
+            await asyncio.wait_for(all_started.wait(), timeout=1.0)
+            return [{'id': f'{bucket_id}.sales', 'name': 'sales', 'created': '2024-01-01T00:00:00Z'}]
+
+        keboola_client.storage_client.bucket_table_list = mocker.AsyncMock(side_effect=_bucket_table_list)
+
+        result = await search(ctx=mcp_context_client, patterns=['sales'], item_types=['table'])
+
+        assert sorted(hit.table_id for hit in result.hits) == [f'{bucket_id}.sales' for bucket_id in bucket_ids]
+
+    @pytest.mark.asyncio
+    async def test_search_ranks_hits_by_match_quality(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        keboola_client.storage_client.bucket_list = mocker.AsyncMock(
+            return_value=[
+                {'id': 'in.c-presales', 'name': 'presales', 'created': '2024-03-01T00:00:00Z'},
+                {'id': 'in.c-sales-eu', 'name': 'sales-eu', 'created': '2024-02-01T00:00:00Z'},
+                {'id': 'in.c-sales', 'name': 'Sales', 'created': '2024-01-01T00:00:00Z'},
+                {'id': 'in.c-marketing', 'name': 'marketing', 'created': '2024-04-01T00:00:00Z'},
+            ]
+        )
+
+        result = await search(ctx=mcp_context_client, patterns=['sales'], item_types=['bucket'])
+
+        assert [hit.bucket_id for hit in result.hits] == ['in.c-sales', 'in.c-sales-eu', 'in.c-presales']
+
+    @pytest.mark.asyncio
+    async def test_search_builds_hits_of_returned_page_only(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        keboola_client.storage_client.bucket_list = mocker.AsyncMock(
+            return_value=[
+                {'id': f'in.c-sales-{i:02}', 'name': f'sales-{i:02}', 'created': f'2024-01-{i:02}T00:00:00Z'}
+                for i in range(1, 29)
+            ]
+        )
+        search_hit_init = mocker.spy(SearchHit, '__init__')
+
+        result = await search(ctx=mcp_context_client, patterns=['sales'], item_types=['bucket'], limit=5, offset=10)
+
+        assert [hit.bucket_id for hit in result.hits] == [f'in.c-sales-{i:02}' for i in range(18, 13, -1)]
+        assert result.total == 28
+        assert result.by_type == {'bucket': 28}
+        assert search_hit_init.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_search_pages_by_cursor(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        keboola_client.storage_client.bucket_list = mocker.AsyncMock(
+            return_value=[
+                {'id': f'in.c-sales-{i:02}', 'name': f'sales-{i:02}', 'created': f'2024-01-{i:02}T00:00:00Z'}
+                for i in range(1, 13)
+            ]
+        )
+
+        bucket_ids = []
+        result = await search(ctx=mcp_context_client, patterns=['sales'], item_types=['bucket'], limit=5)
+        bucket_ids.extend(hit.bucket_id for hit in result.hits)
+        while result.next_cursor:
+            result = await search(
+                ctx=mcp_context_client, patterns=['sales'], item_types=['bucket'], limit=5, cursor=result.next_cursor
+            )
+            bucket_ids.extend(hit.bucket_id for hit in result.hits)
+            assert result.total == 12
+
+        assert bucket_ids == [f'in.c-sales-{i:02}' for i in range(12, 0, -1)]
+        # The second page is searched again and keeps the snapshot the third page is served from.
+        assert keboola_client.storage_client.bucket_list.call_count == 2
+
+        # A different search does not use the snapshot; an unknown snapshot falls back to searching by the offset.
+        snapshot_id, _ = SearchCursors.decode(
+            (await search(ctx=mcp_context_client, patterns=['sales'], item_types=['bucket'], limit=5)).next_cursor
+        )
+        for cursor in [SearchCursors.encode(snapshot_id, 10), SearchCursors.encode('expired', 10)]:
+            result = await search(
+                ctx=mcp_context_client, patterns=['sales-1'], item_types=['bucket'], limit=5, cursor=cursor
+            )
+            assert [hit.bucket_id for hit in result.hits] == []
+            assert result.total == 3
+
+        with pytest.raises(ToolError, match='Invalid search cursor'):
+            await search(ctx=mcp_context_client, patterns=['sales'], cursor='not-a-cursor')
+
+    @pytest.mark.asyncio
+    async def test_search_lists_component_types_concurrently(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        listing = 0
+        max_listing = 0
+
+        async def _component_list(component_type, include=None):
+            nonlocal listing, max_listing
+            listing += 1
+            max_listing = max(max_listing, listing)
+            await asyncio.sleep(0.01)
+            listing -= 1
+            return []
+
+        keboola_client.storage_client.component_list = mocker.AsyncMock(side_effect=_component_list)
+
+        await search(ctx=mcp_context_client, patterns=['test'], item_types=['configuration', 'configuration-row'])
+
+        assert sorted(c.args[0] for c in keboola_client.storage_client.component_list.call_args_list) == [
+            'application',
+            'extractor',
+            'writer',
+        ]
+        assert max_listing == 3
+
+    @pytest.mark.asyncio
+    async def test_search_reuses_text_index(self, mocker: MockerFixture, mcp_context_client: Context):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+        keboola_client.storage_client.bucket_list = mocker.AsyncMock(
+            return_value=[
+                {'id': 'in.c-crm', 'name': 'crm', 'created': '2024-01-01T00:00:00Z'},
+                {'id': 'in.c-café', 'name': 'Café', 'created': '2024-01-01T00:00:00Z'},
+            ]
+        )
+        index_init = mocker.spy(TrigramIndex, '__init__')
+
+        result = await search(ctx=mcp_context_client, patterns=['café'], item_types=['bucket'])
+        assert [hit.bucket_id for hit in result.hits] == ['in.c-café']
+        result = await search(ctx=mcp_context_client, patterns=['crm', 'cafe'], item_types=['bucket'])
+        assert [hit.bucket_id for hit in result.hits] == ['in.c-crm']
+        # The regular expressions are matched against all the items.
+        result = await search(ctx=mcp_context_client, patterns=['caf.'], item_types=['bucket'], mode='regex')
+        assert [hit.bucket_id for hit in result.hits] == ['in.c-café']
+
+        assert index_init.call_count == 1
+
     @pytest.mark.asyncio
     async def test_search_hits_sorting(self, mocker: MockerFixture, mcp_context_client: Context):
         """Test search hits sorting."""
@@ -622,9 +772,8 @@ class TestSearch:
             ),
         ]
 
-        keboola_client.storage_client.bucket_list.assert_has_calls(
-            [call(branch_id='default'), call(branch_id='default')]
-        )
+        # The buckets listed for the bucket hits are reused for listing the tables.
+        keboola_client.storage_client.bucket_list.assert_called_once_with(branch_id='default')
         keboola_client.storage_client.bucket_table_list.assert_has_calls(
             [
                 call('in.c-test-bucket-a', include=['columns', 'columnMetadata'], branch_id='default'),
@@ -1006,7 +1155,7 @@ class TestGlobalTextualSearch:
     def _enable_global_search(self, mocker: MockerFixture, mcp_context_client: Context):
         """Enable the global-search feature so that textual search uses the server-side endpoint."""
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
-        keboola_client.storage_client.is_enabled = mocker.AsyncMock(return_value=True)
+        keboola_client.has_feature = mocker.AsyncMock(return_value=True)
 
     @pytest.mark.asyncio
     async def test_search_maps_global_search_items(self, mocker: MockerFixture, mcp_context_client: Context):
@@ -1129,6 +1278,50 @@ class TestGlobalTextualSearch:
         assert result.hits[0].branch_id == '123'
         assert result.hits[0].branch_name == 'my-dev-branch'
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ('second_search', 'second_branch_id', 'invalidate', 'expected_calls'),
+        [
+            ({}, None, False, 1),
+            ({'types': ['table']}, None, False, 2),
+            ({'branch_scope': 'all'}, None, False, 2),
+            ({'offset': 50}, None, False, 2),
+            ({}, '123', False, 2),
+            ({}, None, True, 2),
+        ],
+        ids=['same_search', 'other_types', 'other_branch_scope', 'other_offset', 'other_branch', 'invalidated'],
+    )
+    async def test_global_search_responses_cached(
+        self,
+        mocker: MockerFixture,
+        mcp_context_client: Context,
+        second_search: dict[str, Any],
+        second_branch_id: str | None,
+        invalidate: bool,
+        expected_calls: int,
+    ):
+        keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
+
+        async def _global_search(**kwargs) -> GlobalSearchResponse:
+            await asyncio.sleep(0.01)
+            return _global_search_response()
+
+        keboola_client.storage_client.global_search = mocker.AsyncMock(side_effect=_global_search)
+        first_search = {'query': 'foo', 'types': [], 'limit': 50, 'offset': 0, 'branch_scope': 'current'}
+
+        # Concurrent identical searches share the request.
+        first, second = await asyncio.gather(
+            GlobalSearchCache.search(keboola_client, **first_search),
+            GlobalSearchCache.search(keboola_client, **first_search),
+        )
+        assert first is second
+        if invalidate:
+            await GlobalSearchCache.invalidate(keboola_client)
+        keboola_client.branch_id = second_branch_id
+        await GlobalSearchCache.search(keboola_client, **(first_search | second_search))
+
+        assert keboola_client.storage_client.global_search.await_count == expected_calls
+
     @pytest.mark.asyncio
     async def test_search_does_not_widen_when_paginating(self, mocker: MockerFixture, mcp_context_client: Context):
         """An empty page with non-zero offset must not trigger the all-branches retry."""
@@ -1168,11 +1361,26 @@ class TestGlobalTextualSearch:
         assert [h.table_id for h in result.hits] == ['in.c-main.users']
 
     @pytest.mark.asyncio
-    async def test_search_falls_back_to_enumeration_on_error(self, mocker: MockerFixture, mcp_context_client: Context):
-        """A failing global-search request (e.g. a transient 5xx) falls back to enumeration."""
+    @pytest.mark.parametrize(
+        ('global_search_error', 'cursor'),
+        [
+            # A failing global-search request (e.g. a transient 5xx)
+            (RuntimeError('global-search exploded'), None),
+            # A cursor of the enumeration whose snapshot has expired keeps paging by the enumeration
+            (None, ':10'),
+        ],
+    )
+    async def test_search_falls_back_to_enumeration_on_error(
+        self,
+        global_search_error: Exception | None,
+        cursor: str | None,
+        mocker: MockerFixture,
+        mcp_context_client: Context,
+    ):
+        """A failing global-search request falls back to enumeration, the cursors are always enumerated."""
         keboola_client = KeboolaClient.from_state(mcp_context_client.session.state)
         keboola_client.storage_client.global_search = mocker.AsyncMock(
-            side_effect=RuntimeError('global-search exploded')
+            side_effect=global_search_error, return_value=_global_search_response()
         )
         fallback = SearchOutput(
             hits=[SearchHit(table_id='in.c-main.users', item_type='table', updated='', name='users')],
@@ -1185,10 +1393,12 @@ class TestGlobalTextualSearch:
             new=mocker.AsyncMock(return_value=fallback),
         )
 
-        result = await search(ctx=mcp_context_client, patterns=['users'], item_types=('table',))
+        result = await search(ctx=mcp_context_client, patterns=['users'], item_types=('table',), cursor=cursor)
 
         enum_mock.assert_awaited_once()
         assert [h.table_id for h in result.hits] == ['in.c-main.users']
+        if cursor:
+            keboola_client.storage_client.global_search.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_search_multiple_patterns_merge_and_dedupe(self, mocker: MockerFixture, mcp_context_client: Context):
@@ -0,0 +1,197 @@
+import json
+
+import jsonpath_ng
+import pytest
+from pytest_mock import MockerFixture
+
+from keboola_mcp_server.tools.search_index import (
+    FlatConfiguration,
+    LiteralMatcher,
+    TrigramIndex,
+    fold_text,
+    match_quality,
+    stringify_json,
+)
+from keboola_mcp_server.tools.search_models import SearchSpec, get_datum_path
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected'),
+    [('Customers', 'customers'), ('Café Crème', 'cafe creme'), ('ŽLUŤOUČKÝ', 'zlutoucky'), ('Straße', 'strasse')],
+)
+def test_fold_text(text: str, expected: str):
+    assert fold_text(text) == expected
+
+
+def test_trigram_index_candidates():
+    index = TrigramIndex(
+        [
+            ('orders', ['in.c-sales.orders', 'Orders', None]),
+            ('customers', ['in.c-crm.customers', 'Zákazníci']),
+            ('sales', ['in.c-sales', 'SALES']),
+        ]
+    )
+
+    assert len(index) == 3
+    assert index.candidates(['sales']) == {'orders', 'sales'}
+    assert index.candidates(['ZAKAZ', 'orders']) == {'customers', 'orders'}
+    assert index.candidates(['invoices']) == set()
+    # Too short to be looked up.
+    assert index.candidates(['sales', 'cr']) is None
+
+
+@pytest.mark.parametrize(
+    ('texts', 'expected'),
+    [
+        (['Sales'], 3),
+        (['in.c-sales', 'sales_eu'], 2),
+        (['presales'], 1),
+        (['marketing', None], 0),
+    ],
+)
+def test_match_quality(texts: list[str | None], expected: int):
+    assert match_quality(['sales'], texts) == expected
+
+
+@pytest.mark.parametrize(
+    ('patterns', 'pattern_mode', 'expected'),
+    [
+        (['sales', 'a.b'], 'literal', ['sales', 'a.b']),
+        (['sales', 'crm customers'], 'regex', ['sales', 'crm customers']),
+        (['sales|revenue'], 'regex', ['sales', 'revenue']),
+        (['sales', 'customer.*'], 'regex', None),
+        (['sales|'], 'regex', None),
+        (['(sales|revenue)'], 'regex', None),
+    ],
+)
+def test_search_spec_literals(patterns: list[str], pattern_mode: str, expected: list[str] | None):
+    spec = SearchSpec(patterns=patterns, item_types=['table'], pattern_mode=pattern_mode)
+    assert spec._literals == expected
+
+
+_CONFIGURATION = {
+    'parameters': {'query': 'SELECT * FROM "in.c-sales.orders"', 'limit': 10, 'tables': [{'id': 'in.c-crm.customers'}]},
+    'storage': {'input': {'tables': [{'source': 'in.c-sales.orders', 'columns': []}]}},
+    'runtime': None,
+}
+
+
+def test_flat_configuration_nodes():
+    flat = FlatConfiguration.from_configuration(_CONFIGURATION)
+
+    assert flat is not None
+    assert flat.text == json.dumps(_CONFIGURATION, sort_keys=True, ensure_ascii=False)
+    # The same nodes in the same order as found by the JSONPath `$..*`.
+    expected_nodes = jsonpath_ng.parse('$..*').find(_CONFIGURATION)
+    assert [node.path for node in flat.nodes] == [get_datum_path(datum) for datum in expected_nodes]
+    assert [flat.node_text(node) for node in flat.nodes] == [
+        None if datum.value is None else (datum.value if isinstance(datum.value, str) else stringify_json(datum.value))
+        for datum in expected_nodes
+    ]
+
+    first, end = flat.descendant_range(('storage', 'input'))
+    assert [node.path for node in flat.nodes[first:end]] == [
+        ('storage', 'input', 'tables'),
+        ('storage', 'input', 'tables', 0, 'source'),
+        ('storage', 'input', 'tables', 0, 'columns'),
+    ]
+    assert flat.descendant_range(('parameters', 'limit')) is None
+
+
+@pytest.mark.parametrize('configuration', [{1: 'non-string key'}, {'tuple': ('a', 'b')}])
+def test_flat_configuration_not_json(configuration: dict):
+    assert FlatConfiguration.from_configuration(configuration) is None
+
+
+@pytest.mark.parametrize(
+    ('patterns', 'pattern_mode', 'search_scopes', 'return_all_matched_patterns'),
+    [
+        (['in.c-sales.orders'], 'literal', [], True),
+        (['in.c-sales.orders', 'in.c-crm'], 'literal', [], False),
+        (['"in.c-sales'], 'literal', [], True),
+        (['orders$', 'limit'], 'regex', [], True),
+        (['(orders)'], 'regex', ['storage.input', 'parameters'], True),
+        (['in.c-crm'], 'literal', ['parameters'], True),
+        (['null'], 'literal', [], True),
+    ],
+)
+def test_match_configuration_scopes_flattened(
+    patterns: list[str],
+    pattern_mode: str,
+    search_scopes: list[str],
+    return_all_matched_patterns: bool,
+    mocker: MockerFixture,
+):
+    spec = SearchSpec(
+        patterns=patterns,
+        item_types=['configuration'],
+        pattern_mode=pattern_mode,
+        search_scopes=search_scopes,
+        search_type='config-based',
+        return_all_matched_patterns=return_all_matched_patterns,
+    )
+    flattened_matches = spec.match_configuration_scopes(_CONFIGURATION)
+
+    # Without the flattened configuration the JSONPath expressions are evaluated on the configuration.
+    mocker.patch.object(FlatConfiguration, 'from_configuration', return_value=None)
+    assert flattened_matches == spec.match_configuration_scopes(_CONFIGURATION)
+
+
+@pytest.mark.parametrize(
+    ('patterns', 'pattern_mode', 'combined', 'prune_unmatched'),
+    [
+        (['sales'], 'literal', True, True),
+        (['sales', 'crm'], 'regex', True, True),
+        (['"sales"', 'crm'], 'literal', True, False),
+        (['sales.*', 'crm'], 'regex', True, False),
+        (['(sales)', 'crm'], 'regex', False, False),
+    ],
+)
+def test_search_spec_combined_pattern(patterns: list[str], pattern_mode: str, combined: bool, prune_unmatched: bool):
+    spec = SearchSpec(patterns=patterns, item_types=['configuration'], pattern_mode=pattern_mode)
+    assert (spec._combined_pattern is not None) is combined
+    assert spec._prune_unmatched is prune_unmatched
+
+
+@pytest.mark.parametrize(
+    ('literals', 'case_sensitive', 'text', 'expected'),
+    [
+        (
+            ['in.c-a.t', 'in.c-a.t2', 'in.c-b.t'],
+            False,
+            'FROM "IN.C-A.T2" JOIN in.c-b.t',
+            {'in.c-a.t', 'in.c-a.t2', 'in.c-b.t'},
+        ),
+        (['in.c-a.t', 'in.c-a.t2', 'in.c-b.t'], True, 'FROM "IN.C-A.T2" JOIN in.c-b.t', {'in.c-b.t'}),
+        (['sales', 'les', 'ale'], False, 'wholesales', {'sales', 'les', 'ale'}),
+        (['aa', 'aaa'], False, 'aa', {'aa'}),
+        (['sales', 'crm'], False, 'marketing', set()),
+    ],
+)
+def test_literal_matcher_find(literals: list[str], case_sensitive: bool, text: str, expected: set[str]):
+    matcher = LiteralMatcher.from_literals(literals, case_sensitive)
+    assert matcher.find(text) == expected
+    assert (matcher.pattern.search(text) is not None) is bool(expected)
+
+
+def test_literal_matcher_not_applicable():
+    assert LiteralMatcher.from_literals(['café', 'crm'], case_sensitive=False) is None
+    assert LiteralMatcher.from_literals(['café', 'crm'], case_sensitive=True) is not None
+    assert LiteralMatcher.from_literals(['a' * 300, 'crm'], case_sensitive=True) is None
+    # The long s is matched by "s" case-insensitively, but it is not the lower case of "s".
+    assert LiteralMatcher.from_literals(['sales', 'crm'], case_sensitive=False).find('ſales') is None
+
+
+def test_search_spec_matches_many_literals():
+    target_ids = [f'in.c-bucket-{i}.table-{j}' for i in range(10) for j in range(10)]
+    spec = SearchSpec(
+        patterns=target_ids,
+        item_types=['configuration'],
+        pattern_mode='literal',
+        search_type='config-based',
+        return_all_matched_patterns=True,
+    )
+    assert spec._literal_matcher is not None
+
+    text = 'SELECT * FROM "in.c-bucket-1.table-1" JOIN "IN.C-BUCKET-1.TABLE-10" ON in.c-bucket-9.table-9.id'
+    assert spec.match_patterns(text) == ['in.c-bucket-1.table-1', 'in.c-bucket-9.table-9']
@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+from pytest_mock import MockerFixture
+
+from keboola_mcp_server.clients.base import JsonDict
+from keboola_mcp_server.clients.client import KeboolaClient
+from keboola_mcp_server.tools.search_index import FlatConfiguration
+from keboola_mcp_server.tools.search_inventory import ProjectInventory
+
+
+def _bucket(bucket_id: str, last_change_date: str | None) -> JsonDict:
+    return {'id': bucket_id, 'name': bucket_id.split('.')[-1], 'lastChangeDate': last_change_date}
+
+
+def _component(component_id: str, *configs: JsonDict) -> JsonDict:
+    return {'id': component_id, 'type': 'extractor', 'configurations': list(configs)}
+
+
+@pytest.mark.asyncio
+async def test_inventory_shared_per_project_and_token(keboola_client: KeboolaClient):
+    inventory = await ProjectInventory.from_client(keboola_client)
+    assert await ProjectInventory.from_client(keboola_client) is inventory
+
+    keboola_client.token = 'other-token'
+    other_inventory = await ProjectInventory.from_client(keboola_client)
+    assert other_inventory is not inventory
+
+    # Invalidates the inventories of all the tokens.
+    await ProjectInventory.invalidate(keboola_client)
+    assert await ProjectInventory.from_client(keboola_client) is not other_inventory
+    keboola_client.token = 'test-token'
+    assert await ProjectInventory.from_client(keboola_client) is not inventory
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('elapsed', 'expected_relisted'),
+    [
+        (0.0, ['in.c-b', 'in.c-c']),
+        # The unchanged buckets are rechecked after the interval, to pick up the metadata changes.
+        (ProjectInventory.TABLES_RECHECK_INTERVAL, ['in.c-a', 'in.c-b', 'in.c-c']),
+    ],
+)
+async def test_list_tables_relists_changed_buckets_only(
+    elapsed: float, expected_relisted: list[str], keboola_client: KeboolaClient, mocker: MockerFixture
+):
+    mocked_time = mocker.patch('keboola_mcp_server.tools.search_inventory.time')
+    mocked_time.monotonic.return_value = 1000.0
+    storage_client = keboola_client.storage_client
+    storage_client.bucket_list.side_effect = [
+        [_bucket('in.c-a', '2025-01-01'), _bucket('in.c-b', '2025-01-01')],
+        [_bucket('in.c-a', '2025-01-01'), _bucket('in.c-b', '2025-02-01'), _bucket('in.c-c', None)],
+    ]
+    storage_client.bucket_table_list.side_effect = lambda bucket_id, **kwargs: [{'id': f'{bucket_id}.table'}]
+
+    inventory = await ProjectInventory.from_client(keboola_client)
+    tables = await inventory.list_tables(keboola_client)
+    assert [table['id'] for table in tables] == ['in.c-a.table', 'in.c-b.table']
+    assert storage_client.bucket_table_list.call_count == 2
+
+    storage_client.bucket_table_list.reset_mock()
+    mocked_time.monotonic.return_value += elapsed
+    new_tables = await inventory.list_tables(keboola_client)
+    assert [table['id'] for table in new_tables] == ['in.c-a.table', 'in.c-b.table', 'in.c-c.table']
+    assert sorted(c.args[0] for c in storage_client.bucket_table_list.call_args_list) == expected_relisted
+    # The tables listed again unchanged are kept as the same objects.
+    assert new_tables[0] is tables[0]
+
+
+@pytest.mark.asyncio
+async def test_list_components_fetches_changed_configurations_only(keboola_client: KeboolaClient):
+    storage_client = keboola_client.storage_client
+    full_list = [
+        _component(
+            'keboola.ex-db',
+            {'id': '1', 'version': 1, 'configuration': {'query': 'old'}},
+            {'id': '2', 'version': 3, 'configuration': {'query': 'kept'}},
+        )
+    ]
+    light_list = [
+        _component('keboola.ex-db', {'id': '1', 'version': 2}, {'id': '2', 'version': 3}, {'id': '3', 'version': 1})
+    ]
+    storage_client.component_list.side_effect = [full_list, light_list]
+    storage_client.configuration_detail.side_effect = lambda component_id, config_id: {
+        'id': config_id,
+        'version': 2 if config_id == '1' else 1,
+        'configuration': {'query': f'new {config_id}'},
+    }
+
+    inventory = await ProjectInventory.from_client(keboola_client)
+    assert await inventory.list_components(keboola_client, 'extractor') == full_list
+
+    components = await inventory.list_components(keboola_client, 'extractor')
+    assert [config['configuration'] for config in components[0]['configurations']] == [
+        {'query': 'new 1'},
+        {'query': 'kept'},
+        {'query': 'new 3'},
+    ]
+    storage_client.component_list.assert_called_with('extractor')
+    assert sorted(c.args for c in storage_client.configuration_detail.call_args_list) == [
+        ('keboola.ex-db', '1'),
+        ('keboola.ex-db', '3'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_components_relists_when_many_configurations_changed(
+    keboola_client: KeboolaClient, mocker: MockerFixture
+):
+    mocker.patch.object(ProjectInventory, 'MAX_CONFIG_DETAILS', 1)
+    storage_client = keboola_client.storage_client
+    full_list = [_component('keboola.ex-db', {'id': '1', 'version': 1}, {'id': '2', 'version': 1})]
+    changed_list = [_component('keboola.ex-db', {'id': '1', 'version': 2}, {'id': '2', 'version': 2})]
+    storage_client.component_list.side_effect = [full_list, changed_list, changed_list]
+
+    inventory = await ProjectInventory.from_client(keboola_client)
+    await inventory.list_components(keboola_client, None)
+    assert await inventory.list_components(keboola_client, None) == changed_list
+
+    storage_client.configuration_detail.assert_not_called()
+    storage_client.component_list.assert_called_with(None, include=['configuration', 'rows'])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_refreshes_are_coalesced(keboola_client: KeboolaClient):
+    storage_client = keboola_client.storage_client
+
+    async def _bucket_list(**kwargs) -> list[JsonDict]:
+        await asyncio.sleep(0.01)
+        return [_bucket('in.c-a', '2025-01-01')]
+
+    storage_client.bucket_list.side_effect = _bucket_list
+    storage_client.bucket_table_list.return_value = [{'id': 'in.c-a.table'}]
+
+    inventory = await ProjectInventory.from_client(keboola_client)
+    buckets, tables = await asyncio.gather(
+        inventory.list_buckets(keboola_client), inventory.list_tables(keboola_client)
+    )
+
+    assert buckets == [_bucket('in.c-a', '2025-01-01')]
+    assert tables == [{'id': 'in.c-a.table'}]
+    storage_client.bucket_list.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('key', 'listed'),
+    [
+        (('keboola.ex-db', '1'), True),
+        (('keboola.ex-db', '1', 'row-1'), True),
+        # The configurations no longer listed are forgotten when the components are listed again.
+        (('keboola.ex-db', '2'), False),
+    ],
+)
+async def test_flat_configuration_cached_per_version(
+    key: tuple[str, ...], listed: bool, keboola_client: KeboolaClient, mocker: MockerFixture
+):
+    flatten = mocker.spy(FlatConfiguration, 'from_configuration')
+    inventory = await ProjectInventory.from_client(keboola_client)
+
+    flat = inventory.flat_configuration(key, 1, {'parameters': {'query': 'old'}})
+    assert inventory.flat_configuration(key, 1, {'parameters': {'query': 'old'}}) is flat
+    assert flatten.call_count == 1
+
+    new_flat = inventory.flat_configuration(key, 2, {'parameters': {'query': 'new'}})
+    assert new_flat is not flat
+    assert new_flat.text == '{"parameters": {"query": "new"}}'
+    assert flatten.call_count == 2
+
+    keboola_client.storage_client.component_list.return_value = [
+        _component('keboola.ex-db', {'id': '1', 'version': 2, 'rows': [{'id': 'row-1', 'version': 1}]})
+    ]
+    await inventory.list_components(keboola_client, 'extractor')
+    assert (inventory.flat_configuration(key, 2, {'parameters': {'query': 'new'}}) is new_flat) is listed
@@ -0,0 +1,136 @@
+import re
+
+import pytest
+from pytest_mock import MockerFixture
+
+from keboola_mcp_server.clients.base import JsonDict
+from keboola_mcp_server.clients.client import KeboolaClient
+from keboola_mcp_server.tools import search as search_module
+from keboola_mcp_server.tools.search import SearchSpec, fetch_configurations
+from keboola_mcp_server.tools.search_lineage import LineageIndex, is_mapping_scope
+
+
+def _config(config_id: str, version: int, storage: JsonDict, rows: list[JsonDict] | None = None) -> JsonDict:
+    return {
+        'id': config_id,
+        'name': f'Config {config_id}',
+        'version': version,
+        'currentVersion': {'created': f'2025-01-0{version}'},
+        'configuration': {'storage': storage, 'parameters': {'note': 'in.c-a.orders is read here'}},
+        'rows': rows or [],
+    }
+
+
+def _components(*configs: JsonDict) -> list[JsonDict]:
+    return [{'id': 'keboola.ex-db', 'type': 'extractor', 'configurations': list(configs)}]
+
+
+def test_lineage_index_references():
+    row = {
+        'id': 'row-1',
+        'name': 'Row',
+        'version': 1,
+        'configuration': {'storage': {'output': {'default_bucket': 'in.c-b', 'tables': ['in.c-b.users']}}},
+    }
+    index = LineageIndex(_components(_config('1', 1, {'input': {'tables': [{'source': 'in.c-a.orders'}]}}, rows=[row])))
+
+    assert [
+        (ref.configuration_id, ref.configuration_row_id, ref.used_in) for ref in index.get_references('in.c-a')
+    ] == [('1', None, 'storage.input.tables[0].source')]
+    assert [ref.used_in for ref in index.get_references('in.c-b')] == [
+        'storage.output.default_bucket',
+        'storage.output.tables[0]',
+    ]
+    [reference] = index.get_references('in.c-b.users')
+    assert reference.name == 'Row'
+    assert reference.updated == '2025-01-01'
+    assert reference.component_type == 'extractor'
+    # Only the mappings are indexed.
+    assert index.get_references('in.c-a.orders is read here') == []
+    assert index.get_references('in.c-a.order') == []
+
+
+def test_lineage_index_reuses_unchanged_configurations():
+    old_index = LineageIndex(
+        _components(
+            _config('1', 1, {'input': {'tables': [{'source': 'in.c-a.orders'}]}}),
+            _config('2', 1, {'input': {'tables': [{'source': 'in.c-a.users'}]}}),
+        )
+    )
+    index = LineageIndex(
+        _components(
+            _config('1', 1, {'input': {'tables': [{'source': 'in.c-a.orders'}]}}),
+            _config('2', 2, {'input': {'tables': [{'source': 'in.c-a.customers'}]}}),
+        ),
+        previous=old_index,
+    )
+
+    assert index._lineages[('keboola.ex-db', '1')] is old_index._lineages[('keboola.ex-db', '1')]
+    assert index.get_references('in.c-a.users') == []
+    assert [ref.updated for ref in index.get_references('in.c-a.customers')] == ['2025-01-02']
+
+
+def test_find_mentioning_keys():
+    row = {'id': 'row-1', 'version': 1, 'configuration': {'storage': {'input': {'tables': [{'source': 'in.c-a.x'}]}}}}
+    index = LineageIndex(
+        _components(
+            _config('1', 1, {'input': {'tables': [{'source': 'in.c-a.orders'}]}}),
+            _config('2', 1, {'output': {'tables': [{'destination': 'out.c-b.orders'}]}}, rows=[row]),
+            _config('3', 1, {}),
+        )
+    )
+
+    assert index.find_mentioning_keys(re.compile('orders')) == {('keboola.ex-db', '1'), ('keboola.ex-db', '2')}
+    assert index.find_mentioning_keys(re.compile('in\\.c-a')) == {
+        ('keboola.ex-db', '1'),
+        ('keboola.ex-db', '2', 'row-1'),
+    }
+    assert index.find_mentioning_keys(re.compile('is read here')) == set()
+
+
+@pytest.mark.parametrize(
+    ('scope', 'expected'),
+    [
+        ('storage.input', True),
+        ('$.storage.output.tables', True),
+        ('storage.input.tables[0].source', True),
+        ('storage', False),
+        ('storage.inputs', False),
+        ('parameters', False),
+    ],
+)
+def test_is_mapping_scope(scope: str, expected: bool):
+    assert is_mapping_scope(scope) is expected
+
+
+@pytest.mark.asyncio
+async def test_mapping_search_matches_mentioning_configurations_only(
+    keboola_client: KeboolaClient, mocker: MockerFixture
+):
+    row = {'id': 'row-1', 'version': 1, 'configuration': {'storage': {'input': {'tables': [{'source': 'in.c-a.x'}]}}}}
+    components = _components(
+        _config('1', 1, {'input': {'tables': [{'source': 'in.c-a.orders'}]}}),
+        _config('2', 1, {'output': {'tables': [{'destination': 'out.c-b.users'}]}}, rows=[row]),
+        _config('3', 1, {}),
+    )
+    keboola_client.storage_client.component_list.side_effect = lambda component_type, **kwargs: (
+        components if component_type == 'extractor' else []
+    )
+    match_configuration = mocker.spy(search_module, '_match_configuration')
+    spec = SearchSpec(
+        patterns=['in.c-a.orders', 'in.c-a.x'],
+        pattern_mode='literal',
+        item_types=['configuration'],
+        search_type='config-based',
+        search_scopes=['storage.input', 'storage.output'],
+        return_all_matched_patterns=True,
+    )
+
+    hits = await fetch_configurations(keboola_client, spec)
+
+    assert [(hit.configuration_id, hit.configuration_row_id) for hit in hits] == [('1', None), ('2', 'row-1')]
+    assert [call.args[2] for call in match_configuration.call_args_list] == [
+        ('keboola.ex-db', '1'),
+        ('keboola.ex-db', '2'),
+        ('keboola.ex-db', '2', 'row-1'),
+    ]
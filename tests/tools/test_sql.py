@@ -11,10 +11,12 @@ from mcp.types import ProgressNotification
 
 from keboola_mcp_server.clients.client import KeboolaClient
 from keboola_mcp_server.clients.query import QueryServiceClient
+from keboola_mcp_server.polling import QueryPollingStrategy
 from keboola_mcp_server.tools.sql import QueryDataOutput, _watch_for_http_disconnect, query_data
 from keboola_mcp_server.workspace import (
     JobSubmittedInfo,
     QueryResult,
+    QueryResultStream,
     SqlSelectData,
     TableFqn,
     WorkspaceManager,
@@ -35,27 +37,41 @@ def _truncate_data(qr: QueryResult, max_rows: int | None, max_chars: int | None)
 
     return QueryResult(
         status=qr.status,
-        data=SqlSelectData(columns=qr.data.columns, rows=rows),
-        message=_SnowflakeWorkspace._SELECTED_ROWS_MSG.format(rows=len(rows), total=len(qr.data.rows)),
+        data=SqlSelectData.from_rows(columns=qr.data.columns, rows=rows),
+        message=QueryResultStream._SELECTED_ROWS_MSG.format(rows=len(rows), total=len(qr.data.rows)),
+    )
+
+
+def _as_stream(qr: QueryResult) -> QueryResultStream:
+    """Wraps the query result in a stream yielding all its rows in a single page."""
+    if not qr.data:
+        return QueryResultStream(qr.status, qr.message)
+
+    async def _pages():
+        yield list(qr.data.values)
+
+    return QueryResultStream(
+        qr.status, qr.message, columns=qr.data.columns, total_rows=len(qr.data.rows), pages=_pages()
     )
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
-    ('query', 'query_name', 'result', 'expected_csv'),
+    ('query', 'query_name', 'result', 'expected_csv', 'use_cache'),
     [
         (
             'select 1;',
             'Simple Count Query',
-            QueryResult(status='ok', data=SqlSelectData(columns=['a'], rows=[{'a': 1}]), message=None),
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None),
             'a\r\n1\r\n',  # CSV
+            False,
         ),
         (
             'select id, name, email from user;',
             'User Details List',
             QueryResult(
                 status='ok',
-                data=SqlSelectData(
+                data=SqlSelectData.from_rows(
                     columns=['id', 'name', 'email'],
                     rows=[
                         {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -65,26 +81,54 @@ def _truncate_data(qr: QueryResult, max_rows: int | None, max_chars: int | None)
                 message=None,
             ),
             'id,name,email\r\n1,John,john@foo.com\r\n2,Joe,joe@bar.com\r\n',  # CSV
+            True,
         ),
         (
             'create table foo (id integer, name varchar);',
             'Create Table Operation',
             QueryResult(status='ok', data=None, message='1 table created'),
             'message\r\n1 table created\r\n',  # CSV
+            False,
         ),
     ],
 )
 async def test_query_data(
-    query: str, query_name: str, result: QueryResult, expected_csv: str, mcp_context_client: Context, mocker
+    query: str,
+    query_name: str,
+    result: QueryResult,
+    expected_csv: str,
+    use_cache: bool,
+    mcp_context_client: Context,
+    mocker,
 ):
     manager = mocker.AsyncMock(WorkspaceManager)
-    manager.execute_query.return_value = result
+    manager.execute_query_stream.return_value = _as_stream(result)
     mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
-    result = await query_data(query, query_name, mcp_context_client)
+    result = await query_data(query, query_name, mcp_context_client, use_cache=use_cache)
     assert isinstance(result, QueryDataOutput)
     assert result.query_name == query_name
     assert result.csv_data == expected_csv
+    # The query results are cached only when the caller asks for it.
+    assert manager.execute_query_stream.call_args.kwargs['use_cache'] is use_cache
+
+
+@pytest.mark.asyncio
+async def test_query_data_writes_csv_page_by_page(mcp_context_client: Context, mocker):
+    async def _pages():
+        yield [[1, 'John'], [2, None]]
+        yield [[3, 'Jack, Jr.']]
+
+    manager = mocker.AsyncMock(WorkspaceManager)
+    manager.execute_query_stream.return_value = QueryResultStream(
+        'ok', columns=['id', 'name'], total_rows=5, pages=_pages()
+    )
+    mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
+
+    result = await query_data('select id, name from user;', 'Users', mcp_context_client)
+
+    assert result.csv_data == 'id,name\r\n1,John\r\n2,\r\n3,"Jack, Jr."\r\n'
+    assert result.message == 'Returning 3 of 5 selected rows.'
 
 
 @pytest.mark.asyncio
@@ -100,13 +144,15 @@ async def test_query_data_emits_progress_notification_with_job_id(mcp_context_cl
         backend='snowflake',
     )
 
-    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None):
+    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None, use_cache=False):
         if on_job_submitted is not None:
             await on_job_submitted(info)
-        return QueryResult(status='ok', data=SqlSelectData(columns=['a'], rows=[{'a': 1}]), message=None)
+        return _as_stream(
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None)
+        )
 
     manager = mocker.AsyncMock(WorkspaceManager)
-    manager.execute_query.side_effect = fake_execute_query
+    manager.execute_query_stream.side_effect = fake_execute_query
     mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
     mcp_context_client.request_context.meta = mocker.MagicMock()
@@ -148,13 +194,15 @@ async def test_query_data_skips_progress_when_no_token(mcp_context_client: Conte
     progressToken. Without one we must stay silent — sending unsolicited progress can break clients
     that strictly validate the protocol."""
 
-    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None):
+    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None, use_cache=False):
         # The tool should not even hand us a callback when no token is set.
         assert on_job_submitted is None
-        return QueryResult(status='ok', data=SqlSelectData(columns=['a'], rows=[{'a': 1}]), message=None)
+        return _as_stream(
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None)
+        )
 
     manager = mocker.AsyncMock(WorkspaceManager)
-    manager.execute_query.side_effect = fake_execute_query
+    manager.execute_query_stream.side_effect = fake_execute_query
     mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
     # empty_context fixture defaults meta to None, which is the "no progressToken" shape.
@@ -179,13 +227,15 @@ async def test_query_data_skips_progress_when_request_id_missing(mcp_context_cli
     """
     info = JobSubmittedInfo(job_id='job-no-rid', cancellation_url='https://q/cancel', backend='snowflake')
 
-    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None):
+    async def fake_execute_query(sql_query, *, max_rows, max_chars, on_job_submitted=None, use_cache=False):
         if on_job_submitted is not None:
             await on_job_submitted(info)
-        return QueryResult(status='ok', data=SqlSelectData(columns=['a'], rows=[{'a': 1}]), message=None)
+        return _as_stream(
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None)
+        )
 
     manager = mocker.AsyncMock(WorkspaceManager)
-    manager.execute_query.side_effect = fake_execute_query
+    manager.execute_query_stream.side_effect = fake_execute_query
     mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
     mcp_context_client.request_context.meta = mocker.MagicMock()
@@ -370,7 +420,7 @@ class TestWorkspaceManagerSnowflake:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -385,7 +435,7 @@ class TestWorkspaceManagerSnowflake:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -400,7 +450,7 @@ class TestWorkspaceManagerSnowflake:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},  # 17 characters
@@ -440,7 +490,7 @@ class TestWorkspaceManagerSnowflake:
         }
         qsclient.get_job_results.return_value = {
             'status': 'completed' if db_data.is_ok else 'failed',
-            'data': [list(row.values()) for row in db_data.data.rows] if db_data.data else [],
+            'data': list(db_data.data.values) if db_data.data else [],
             'columns': [{'name': col_name} for col_name in db_data.data.columns] if db_data.data else [],
             'message': db_data.message,
             'numberOfRows': len(db_data.data.rows) if db_data.data else None,
@@ -458,7 +508,10 @@ class TestWorkspaceManagerSnowflake:
         qsclient.submit_job.assert_called_once()
         qsclient.get_job_status.assert_called_once_with('qs-job-1234')
         qsclient.get_job_results.assert_called_once_with(
-            'qs-job-1234', 'qs-job-statement-1234', offset=0, limit=1000 if max_rows is None else max(max_rows, 100)
+            'qs-job-1234',
+            'qs-job-statement-1234',
+            offset=0,
+            limit=max(min(1_000 if max_chars else 10_000, max_rows or 10_000), 100),
         )
 
     @pytest.mark.asyncio
@@ -508,13 +561,13 @@ class TestWorkspaceManagerSnowflake:
             },
         ]
         mocker.patch.object(QueryServiceClient, 'create', return_value=qsclient)
-        mocker.patch.object(_SnowflakeWorkspace, '_PAGE_SIZE', 4)
+        mocker.patch.object(_SnowflakeWorkspace, '_MAX_PAGE_SIZE', 4)
 
         m = WorkspaceManager.from_state(context.session.state)
         actual = await m.execute_query('select id, name, email from user;')
         assert actual == QueryResult(
             status='ok',
-            data=SqlSelectData(
+            data=SqlSelectData.from_rows(
                 columns=['id', 'name', 'email'],
                 rows=[
                     {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -589,6 +642,203 @@ class TestWorkspaceManagerSnowflake:
         # Page 2 must not be fetched once page 1 hit the char budget.
         qsclient.get_job_results.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_query_stream_prefetches_next_page(
+        self, keboola_client: KeboolaClient, context: Context, mocker
+    ):
+        keboola_client.storage_client.branches_list.return_value = [{'id': 1234, 'isDefault': True}]
+
+        qsclient = mocker.AsyncMock(QueryServiceClient)
+        qsclient.submit_job.return_value = 'qs-job-1234'
+        qsclient.get_job_status.return_value = {
+            'status': 'completed',
+            'statements': [{'id': 'qs-job-statement-1234', 'status': 'completed'}],
+        }
+        qsclient.get_job_results.side_effect = [
+            {
+                'status': 'completed',
+                'data': [[1, 'John'], [2, 'Joe']],
+                'columns': [{'name': 'id'}, {'name': 'name'}],
+                'message': None,
+                'numberOfRows': 3,
+            },
+            {
+                'status': 'completed',
+                'data': [[3, 'Jack']],
+                'columns': [{'name': 'id'}, {'name': 'name'}],
+                'message': None,
+                'numberOfRows': 3,
+            },
+        ]
+        mocker.patch.object(QueryServiceClient, 'create', return_value=qsclient)
+        mocker.patch.object(_SnowflakeWorkspace, '_MAX_PAGE_SIZE', 2)
+
+        m = WorkspaceManager.from_state(context.session.state)
+        stream = await m.execute_query_stream('select id, name from user;')
+
+        assert stream.is_ok
+        assert stream.columns == ['id', 'name']
+        qsclient.get_job_results.assert_called_once()
+
+        pages = stream.pages()
+        # The second page is requested while the first one is being consumed.
+        assert await anext(pages) == [[1, 'John'], [2, 'Joe']]
+        assert qsclient.get_job_results.call_args_list == [
+            call('qs-job-1234', 'qs-job-statement-1234', offset=0, limit=100),
+            call('qs-job-1234', 'qs-job-statement-1234', offset=2, limit=100),
+        ]
+        assert await anext(pages) == [[3, 'Jack']]
+        with pytest.raises(StopAsyncIteration):
+            await anext(pages)
+        assert stream.message == 'Returning 3 of 3 selected rows.'
+
+    @pytest.mark.asyncio
+    async def test_execute_query_stream_cancels_prefetch_when_closed_early(
+        self, keboola_client: KeboolaClient, context: Context, mocker
+    ):
+        keboola_client.storage_client.branches_list.return_value = [{'id': 1234, 'isDefault': True}]
+
+        next_page_cancelled = asyncio.Event()
+
+        async def _get_job_results(job_id: str, statement_id: str, *, offset: int, limit: int) -> dict[str, Any]:
+            if offset > 0:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    next_page_cancelled.set()
+                    raise
+            return {
+                'status': 'completed',
+                'data': [[1], [2]],
+                'columns': [{'name': 'id'}],
+                'message': None,
+                'numberOfRows': 4,
+            }
+
+        qsclient = mocker.AsyncMock(QueryServiceClient)
+        qsclient.submit_job.return_value = 'qs-job-1234'
+        qsclient.get_job_status.return_value = {
+            'status': 'completed',
+            'statements': [{'id': 'qs-job-statement-1234', 'status': 'completed'}],
+        }
+        qsclient.get_job_results.side_effect = _get_job_results
+        mocker.patch.object(QueryServiceClient, 'create', return_value=qsclient)
+        mocker.patch.object(_SnowflakeWorkspace, '_MAX_PAGE_SIZE', 2)
+
+        m = WorkspaceManager.from_state(context.session.state)
+        stream = await m.execute_query_stream('select id from user;')
+        pages = stream.pages()
+        assert await anext(pages) == [[1], [2]]
+        await asyncio.sleep(0)  # let the next page request start
+        await pages.aclose()
+
+        # Closing the pages waits for the cancelled request to finish.
+        assert next_page_cancelled.is_set()
+
+    @pytest.fixture
+    def cached_query_qsclient(self, keboola_client: KeboolaClient, mocker) -> QueryServiceClient:
+        keboola_client.storage_client.branches_list.return_value = [{'id': 1234, 'isDefault': True}]
+        keboola_client.storage_client.table_detail.return_value = {
+            'id': 'in.c-foo.bar',
+            'lastImportDate': '2026-01-01T10:00:00+0100',
+        }
+
+        qsclient = mocker.AsyncMock(QueryServiceClient)
+        qsclient.submit_job.return_value = 'qs-job-1234'
+        qsclient.get_job_status.return_value = {
+            'status': 'completed',
+            'statements': [{'id': 'qs-job-statement-1234', 'status': 'completed'}],
+        }
+        qsclient.get_job_results.return_value = {
+            'status': 'completed',
+            'data': [[1, 'John'], [2, 'Joe']],
+            'columns': [{'name': 'id'}, {'name': 'name'}],
+            'message': None,
+            'numberOfRows': 2,
+        }
+        mocker.patch.object(QueryServiceClient, 'create', return_value=qsclient)
+        return qsclient
+
+    @pytest.mark.asyncio
+    async def test_execute_query_use_cache(
+        self, keboola_client: KeboolaClient, context: Context, cached_query_qsclient: QueryServiceClient
+    ):
+        m = WorkspaceManager.from_state(context.session.state)
+        await m.get_table_info(
+            {
+                'id': 'in.c-foo.bar',
+                'name': 'bar',
+                'lastImportDate': '2026-01-01T10:00:00+0100',
+                'bucket': {'backendPath': ['DB', 'in.c-foo']},
+            }
+        )
+        expected = QueryResult(
+            status='ok',
+            data=SqlSelectData(columns=['id', 'name'], values=[[1, 'John'], [2, 'Joe']]),
+            message='Returning 2 of 2 selected rows.',
+        )
+
+        actual = await m.execute_query('select id, name from "DB"."in.c-foo"."bar";', use_cache=True)
+        assert actual == expected
+        # The import dates of a query not cached yet are those seen when the table was resolved.
+        keboola_client.storage_client.table_detail.assert_not_called()
+        # The same query, differently formatted, is answered from the cache.
+        actual = await m.execute_query('SELECT id,  name FROM "DB"."in.c-foo"."bar"', use_cache=True)
+        assert actual == expected
+        cached_query_qsclient.submit_job.assert_called_once()
+        keboola_client.storage_client.table_detail.assert_called_once_with('in.c-foo.bar')
+
+        # A new import to the table invalidates the cached result.
+        keboola_client.storage_client.table_detail.return_value = {
+            'id': 'in.c-foo.bar',
+            'lastImportDate': '2026-01-02T10:00:00+0100',
+        }
+        actual = await m.execute_query('select id, name from "DB"."in.c-foo"."bar";', use_cache=True)
+        assert actual == expected
+        assert cached_query_qsclient.submit_job.call_count == 2
+        actual = await m.execute_query('select id, name from "DB"."in.c-foo"."bar";', use_cache=True)
+        assert cached_query_qsclient.submit_job.call_count == 2
+
+        # The results are not shared with other tokens.
+        keboola_client.token = 'other-token'
+        actual = await m.execute_query('select id, name from "DB"."in.c-foo"."bar";', use_cache=True)
+        assert actual == expected
+        assert cached_query_qsclient.submit_job.call_count == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        'sql_query',
+        [
+            'select id, name from "DB"."in.c-foo"."unknown";',  # the table was not resolved by get_table_info
+            'select id, name, random() from "DB"."in.c-foo"."bar";',  # volatile function
+            'select id, name from "DB"."in.c-foo"."bar" where ts < current_timestamp();',  # volatile function
+            'select id, name from bar;',  # the unqualified table cannot be tracked
+        ],
+    )
+    async def test_execute_query_use_cache_not_cacheable(
+        self, sql_query: str, context: Context, cached_query_qsclient: QueryServiceClient
+    ):
+        m = WorkspaceManager.from_state(context.session.state)
+        await m.get_table_info({'id': 'in.c-foo.bar', 'name': 'bar', 'bucket': {'backendPath': ['DB', 'in.c-foo']}})
+
+        await m.execute_query(sql_query, use_cache=True)
+        await m.execute_query(sql_query, use_cache=True)
+        assert cached_query_qsclient.submit_job.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_query_stream_use_cache_skips_partially_read_result(
+        self, context: Context, cached_query_qsclient: QueryServiceClient
+    ):
+        m = WorkspaceManager.from_state(context.session.state)
+
+        stream = await m.execute_query_stream('with t as (select 1 as id) select id from t', use_cache=True)
+        await stream.pages().aclose()
+        stream = await m.execute_query_stream('with t as (select 1 as id) select id from t', use_cache=True)
+        assert [page async for page in stream.pages()] == [[[1, 'John'], [2, 'Joe']]]
+        stream = await m.execute_query_stream('with t as (select 1 as id) select id from t', use_cache=True)
+        assert [page async for page in stream.pages()] == [[[1, 'John'], [2, 'Joe']]]
+        assert cached_query_qsclient.submit_job.call_count == 2
+
 
 class TestWorkspaceManagerBigQuery:
     @pytest.fixture
@@ -725,7 +975,7 @@ class TestWorkspaceManagerBigQuery:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -740,7 +990,7 @@ class TestWorkspaceManagerBigQuery:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},
@@ -755,7 +1005,7 @@ class TestWorkspaceManagerBigQuery:
                 'select id, name, email from user;',
                 QueryResult(
                     status='ok',
-                    data=SqlSelectData(
+                    data=SqlSelectData.from_rows(
                         columns=['id', 'name', 'email'],
                         rows=[
                             {'id': 1, 'name': 'John', 'email': 'john@foo.com'},  # 17 characters
@@ -796,7 +1046,7 @@ class TestWorkspaceManagerBigQuery:
         }
         qsclient.get_job_results.return_value = {
             'status': 'completed' if db_data.is_ok else 'failed',
-            'data': [list(row.values()) for row in db_data.data.rows] if db_data.data else [],
+            'data': list(db_data.data.values) if db_data.data else [],
             'columns': [{'name': col_name} for col_name in db_data.data.columns] if db_data.data else [],
             'message': db_data.message,
             'numberOfRows': len(db_data.data.rows) if db_data.data else None,
@@ -814,7 +1064,10 @@ class TestWorkspaceManagerBigQuery:
         qsclient.submit_job.assert_called_once()
         qsclient.get_job_status.assert_called_once_with('qs-job-1234')
         qsclient.get_job_results.assert_called_once_with(
-            'qs-job-1234', 'qs-job-statement-1234', offset=0, limit=1000 if max_rows is None else max(max_rows, 100)
+            'qs-job-1234',
+            'qs-job-statement-1234',
+            offset=0,
+            limit=max(min(1_000 if max_chars else 10_000, max_rows or 10_000), 100),
         )
 
     @pytest.mark.parametrize(
@@ -854,6 +1107,11 @@ class TestWorkspaceManagerBigQuery:
 class TestQueryCancellation:
     """Tests for query cancellation on timeout."""
 
+    @pytest.fixture(autouse=True)
+    def one_second_polling(self, mocker):
+        """The job statuses below are scripted for one status check per second within the 2 second timeout."""
+        mocker.patch.object(QueryPollingStrategy, 'MIN_INTERVAL', 1.0)
+
     @pytest.fixture
     def snowflake_context(self, keboola_client: KeboolaClient, empty_context: Context) -> Context:
         """Context with Snowflake workspace."""
@@ -1212,7 +1470,7 @@ class TestQueryCancellation:
             await asyncio.Event().wait()
 
         manager = AsyncMock(WorkspaceManager)
-        manager.execute_query.side_effect = never_returns
+        manager.execute_query_stream.side_effect = never_returns
         mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
         # Fake HTTP request: not disconnected for the first poll, then disconnected.
@@ -1228,7 +1486,7 @@ class TestQueryCancellation:
         with pytest.raises(ValueError, match='Query was cancelled'):
             await query_data('SELECT 1', 'test', mcp_context_client)
 
-        manager.execute_query.assert_called_once()
+        manager.execute_query_stream.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_query_data_logs_when_disconnect_watcher_raises(
@@ -1242,7 +1500,7 @@ class TestQueryCancellation:
             await asyncio.Event().wait()
 
         manager = AsyncMock(WorkspaceManager)
-        manager.execute_query.side_effect = never_returns
+        manager.execute_query_stream.side_effect = never_returns
         mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 
         async def boom(*_a, **_kw):
@@ -1255,7 +1513,7 @@ class TestQueryCancellation:
         with caplog.at_level('WARNING'), pytest.raises(ValueError, match='Query was cancelled'):
             await query_data('SELECT 1', 'test', mcp_context_client)
 
-        manager.execute_query.assert_called_once()
+        manager.execute_query_stream.assert_called_once()
         assert any('disconnect watcher' in r.message for r in caplog.records)
 
     @pytest.mark.asyncio
@@ -1266,10 +1524,8 @@ class TestQueryCancellation:
         completed, the `CancelledError` must propagate (not be swallowed by `_cancel_and_drain`
         and cause a result to be returned), while the shielded drain still runs to completion."""
         manager = AsyncMock(WorkspaceManager)
-        manager.execute_query.return_value = QueryResult(
-            status='ok',
-            data=SqlSelectData(columns=['a'], rows=[{'a': 1}]),
-            message=None,
+        manager.execute_query_stream.return_value = _as_stream(
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None)
         )
         mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
         # HTTP mode with a request that never disconnects: the query wins the race, leaving the
@@ -1310,10 +1566,8 @@ class TestQueryCancellation:
         """When there is no HTTP request bound (stdio transport), the disconnect race is skipped
         entirely and the query runs directly to completion."""
         manager = AsyncMock(WorkspaceManager)
-        manager.execute_query.return_value = QueryResult(
-            status='ok',
-            data=SqlSelectData(columns=['a'], rows=[{'a': 1}]),
-            message=None,
+        manager.execute_query_stream.return_value = _as_stream(
+            QueryResult(status='ok', data=SqlSelectData.from_rows(columns=['a'], rows=[{'a': 1}]), message=None)
         )
         mcp_context_client.session.state[WorkspaceManager.STATE_KEY] = manager
 